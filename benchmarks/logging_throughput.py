@@ -0,0 +1,119 @@
+"""
+Records per second logged by many threads, through the multiprocessing queue pipeline
+formatting on the producer threads, and through setup_logging()
+
+Usage:
+    python -m benchmarks.logging_throughput --threads 1000 --records 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Queue
+from typing import Any, Callable
+
+from simple_logger.logger import DuplicateFilter, WrapperLogFormatter
+
+from ocp_scale_utilities.logger import setup_logging
+
+LOGGER = logging.getLogger("benchmarks.logging_throughput")
+
+
+def setup_multiprocessing_queue_logging(log_file: str) -> QueueListener:
+    """
+    Pipeline of setup_logging() before the in-process fast path:
+    records are formatted and filtered on the producer threads and pickled through a multiprocessing queue
+    """
+    log_queue: Queue = Queue(maxsize=-1)
+    log_listener = QueueListener(log_queue, logging.FileHandler(filename=log_file), logging.StreamHandler())
+    root_log_queue_handler = QueueHandler(queue=log_queue)
+    root_log_queue_handler.setFormatter(
+        fmt=WrapperLogFormatter(
+            fmt="%(asctime)s %(name)s %(log_color)s%(levelname)s%(reset)s %(message)s",
+            log_colors={"INFO": "green"},
+            secondary_log_colors={},
+        )
+    )
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level=logging.INFO)
+    root_logger.addHandler(hdlr=root_log_queue_handler)
+    root_logger.addFilter(filter=DuplicateFilter())
+    log_listener.start()
+    return log_listener
+
+
+def reset_logging() -> None:
+    for logger in (logging.getLogger(), logging.getLogger("basic")):
+        for handler in list(logger.handlers):
+            logger.removeHandler(hdlr=handler)
+        for log_filter in list(logger.filters):
+            logger.removeFilter(filter=log_filter)
+
+
+def run(setup: Callable[[str], Any], threads: int, records: int) -> dict[str, float]:
+    """
+    Log records from threads through the pipeline built by setup
+
+    Returns:
+        dict: Seconds producers spent logging and until all records were written, and records per second of each
+    """
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_listener = setup(os.path.join(log_dir, "benchmark.log"))
+        for handler in log_listener.handlers:
+            if type(handler).__name__.endswith("StreamHandler"):
+                handler.setStream(open(os.devnull, "w"))
+        barrier = threading.Barrier(parties=threads + 1)
+
+        def _produce(thread: int) -> None:
+            barrier.wait()
+            for record in range(records):
+                LOGGER.info(f"Thread {thread} record {record}")
+
+        producers = [threading.Thread(target=_produce, args=(thread,)) for thread in range(threads)]
+        for producer in producers:
+            producer.start()
+        barrier.wait()
+        start_time = time.perf_counter()
+        for producer in producers:
+            producer.join()
+        produced_time = time.perf_counter() - start_time
+        log_listener.stop()
+        written_time = time.perf_counter() - start_time
+        reset_logging()
+
+    total = threads * records
+    return {
+        "records": total,
+        "produce_seconds": produced_time,
+        "produce_records_per_second": total / produced_time,
+        "write_seconds": written_time,
+        "write_records_per_second": total / written_time,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=1000, help="Number of threads logging")
+    parser.add_argument("--records", type=int, default=100, help="Records logged per thread")
+    args = parser.parse_args()
+
+    results = {
+        "multiprocessing-queue": run(
+            setup=setup_multiprocessing_queue_logging, threads=args.threads, records=args.records
+        ),
+        "setup_logging": run(
+            setup=lambda log_file: setup_logging(log_file=log_file), threads=args.threads, records=args.records
+        ),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
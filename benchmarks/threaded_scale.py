@@ -0,0 +1,388 @@
+"""
+Throughput, thread count, peak RSS and tail latency of the threaded utilities, their as-completed
+and process-sharded variants and ThreadedScaleResources across resource counts, against the fake apiserver
+of the tests running in a child process with configurable latency, 500 errors and 429 throttling
+
+Usage:
+    python -m benchmarks.threaded_scale --counts 1000,10000,50000 --latency 0.005 --throttle-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import tempfile
+import threading
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Optional
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.threaded.as_completed import (
+    threaded_deploy_resources_as_completed,
+    threaded_wait_deleted_resources_as_completed,
+    threaded_wait_for_resources_status_as_completed,
+)
+from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
+from ocp_scale_utilities.threaded.sharded import sharded_delete_resources, sharded_deploy_resources
+from ocp_scale_utilities.threaded.utils import (
+    threaded_clean_up_resources,
+    threaded_delete_resources,
+    threaded_deploy_requested_resources,
+    threaded_deploy_resources,
+    threaded_deploy_resources_wait_for_status,
+    threaded_wait_deleted_resources,
+    threaded_wait_for_resources_status,
+)
+from ocp_scale_utilities.timing import ResourceTimings
+from tests.fake_apiserver import FakeAPIServer, get_fake_client, write_fake_kubeconfig
+
+LOGGER = logging.getLogger("benchmarks.threaded_scale")
+
+# Seconds between samples of thread count and RSS
+SAMPLE_INTERVAL = 0.05
+
+
+def _serve(connection: Connection, server_kwargs: dict[str, Any]) -> None:
+    """
+    Run the fake apiserver in a child process, so its threads and memory are not measured,
+    answering "requests" with its request counters until "stop"
+    """
+    with FakeAPIServer(**server_kwargs) as server:
+        connection.send(server.host)
+        while connection.recv() != "stop":
+            with server.condition:
+                connection.send(dict(server.requests))
+
+
+class ProcessSampler:
+    def __init__(self):
+        """
+        Sample the thread count and RSS of the current process in a background thread
+        """
+        self.peak_threads = 0
+        self.peak_rss_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def rss_bytes() -> int:
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            # Peak of the whole process, in KiB on linux
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def _sample(self) -> None:
+        self.peak_threads = max(self.peak_threads, threading.active_count())
+        self.peak_rss_bytes = max(self.peak_rss_bytes, self.rss_bytes())
+
+    def _run(self) -> None:
+        while not self._stop.wait(timeout=SAMPLE_INTERVAL):
+            self._sample()
+
+    def __enter__(self) -> ProcessSampler:
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_arguments: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+class Benchmark:
+    def __init__(
+        self,
+        connection: Connection,
+        client: DynamicClient,
+        watch: bool,
+        client_kwargs: dict[str, Any],
+        processes: Optional[int] = None,
+    ):
+        self.connection = connection
+        self.client = client
+        self.watch = watch
+        # get_client() arguments of the clients of sharded worker processes
+        self.client_kwargs = client_kwargs
+        self.processes = processes
+        self.results: list[dict[str, Any]] = []
+
+    def server_requests(self) -> dict[str, int]:
+        self.connection.send("requests")
+        return self.connection.recv()
+
+    def pods(self, count: int, prefix: str) -> list[Pod]:
+        return [
+            Pod(
+                name=f"{prefix}-{index}",
+                namespace=f"benchmark-{count}",
+                client=self.client,
+                containers=[dict(name="pause", image="registry.k8s.io/pause:3.9")],
+            )
+            for index in range(count)
+        ]
+
+    def config_maps(self, count: int, prefix: str) -> list[ConfigMap]:
+        return [
+            ConfigMap(name=f"{prefix}-{index}", namespace=f"benchmark-{count}", client=self.client, data={"a": "b"})
+            for index in range(count)
+        ]
+
+    def measure(
+        self,
+        function: str,
+        count: int,
+        func: Callable[[], Any],
+        timings: Optional[ResourceTimings] = None,
+        phases: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Run func, recording its duration, throughput, peak thread count and RSS,
+        latency percentiles of phases from timings, and the requests served meanwhile
+        """
+        requests_before = self.server_requests()
+        error = None
+        with ProcessSampler() as sampler:
+            start_time = time.perf_counter()
+            try:
+                func()
+            except Exception as exp:
+                # Not retried errors are part of the results, eg: injected errors of calls without retry policy
+                error = str(exp).splitlines()[0]
+            seconds = time.perf_counter() - start_time
+        requests_after = self.server_requests()
+
+        result = {
+            "function": function,
+            "count": count,
+            "seconds": seconds,
+            "resources_per_second": count / seconds,
+            "peak_threads": sampler.peak_threads,
+            "peak_rss_bytes": sampler.peak_rss_bytes,
+            "error": error,
+            "latency": {phase: timings.percentiles(phase=phase) for phase in phases} if timings else {},
+            "requests": {
+                key: value - requests_before.get(key, 0)
+                for key, value in requests_after.items()
+                if value != requests_before.get(key, 0)
+            },
+        }
+        LOGGER.warning(
+            f"{function} {count}: {seconds:.2f}s, {result['resources_per_second']:.0f} resources/s"
+            f"{f', failed: {error}' if error else ''}"
+        )
+        self.results.append(result)
+
+    def run(self, count: int) -> None:
+        pods = self.pods(count=count, prefix="deploy")
+        timings = ResourceTimings(count=count)
+        self.measure(
+            function="threaded_deploy_resources",
+            count=count,
+            func=lambda: threaded_deploy_resources(resources=pods, timings=timings),
+            timings=timings,
+            phases=("deploy",),
+        )
+        self.measure(
+            function="threaded_wait_for_resources_status",
+            count=count,
+            func=lambda: threaded_wait_for_resources_status(
+                resources=pods, status=Pod.Status.RUNNING, watch=self.watch, timings=timings
+            ),
+            timings=timings,
+            phases=("status", "ready"),
+        )
+        self.measure(
+            function="threaded_delete_resources",
+            count=count,
+            func=lambda: threaded_delete_resources(resources=pods, timings=timings),
+        )
+        self.measure(
+            function="threaded_wait_deleted_resources",
+            count=count,
+            func=lambda: threaded_wait_deleted_resources(resources=pods, watch=self.watch, timings=timings),
+            timings=timings,
+            phases=("delete",),
+        )
+
+        config_maps = self.config_maps(count=count, prefix="requested")
+        requested_timings = ResourceTimings(count=count)
+        self.measure(
+            function="threaded_deploy_requested_resources",
+            count=count,
+            func=lambda: threaded_deploy_requested_resources(
+                resources=config_maps, request_resources=config_maps, timings=requested_timings
+            ),
+            timings=requested_timings,
+            phases=("deploy",),
+        )
+        self.measure(
+            function="threaded_clean_up_resources",
+            count=count,
+            func=lambda: threaded_clean_up_resources(resources=config_maps),
+        )
+
+        pods = self.pods(count=count, prefix="pipeline")
+        pipeline_timings = ResourceTimings(count=count)
+        self.measure(
+            function="threaded_deploy_resources_wait_for_status",
+            count=count,
+            func=lambda: threaded_deploy_resources_wait_for_status(
+                resources=pods, status=Pod.Status.RUNNING, watch=self.watch, timings=pipeline_timings
+            ),
+            timings=pipeline_timings,
+            phases=("deploy", "status", "ready"),
+        )
+        threaded_delete_resources(resources=pods)
+        threaded_wait_deleted_resources(resources=pods, watch=self.watch)
+
+        pods = self.pods(count=count, prefix="as-completed")
+        as_completed_timings = ResourceTimings(count=count)
+        self.measure(
+            function="threaded_deploy_resources_as_completed",
+            count=count,
+            func=lambda: list(threaded_deploy_resources_as_completed(resources=pods, timings=as_completed_timings)),
+            timings=as_completed_timings,
+            phases=("deploy",),
+        )
+        self.measure(
+            function="threaded_wait_for_resources_status_as_completed",
+            count=count,
+            func=lambda: list(
+                threaded_wait_for_resources_status_as_completed(
+                    resources=pods, status=Pod.Status.RUNNING, timings=as_completed_timings
+                )
+            ),
+            timings=as_completed_timings,
+            phases=("status",),
+        )
+        threaded_delete_resources(resources=pods)
+        self.measure(
+            function="threaded_wait_deleted_resources_as_completed",
+            count=count,
+            func=lambda: list(
+                threaded_wait_deleted_resources_as_completed(resources=pods, timings=as_completed_timings)
+            ),
+            timings=as_completed_timings,
+            phases=("delete",),
+        )
+
+        pods = self.pods(count=count, prefix="sharded")
+        sharded_timings = ResourceTimings(count=count)
+        self.measure(
+            function="sharded_deploy_resources",
+            count=count,
+            func=lambda: sharded_deploy_resources(
+                resources=pods,
+                processes=self.processes,
+                client_kwargs=self.client_kwargs,
+                status=Pod.Status.RUNNING,
+                timings=sharded_timings,
+            ),
+            timings=sharded_timings,
+            phases=("deploy", "status"),
+        )
+        self.measure(
+            function="sharded_delete_resources",
+            count=count,
+            func=lambda: sharded_delete_resources(
+                resources=pods, processes=self.processes, client_kwargs=self.client_kwargs, timings=sharded_timings
+            ),
+            timings=sharded_timings,
+            phases=("delete",),
+        )
+
+        pods = self.pods(count=count, prefix="scale")
+        scale = ThreadedScaleResources(
+            resources=pods, wait_for_status=Pod.Status.RUNNING, watch_status=self.watch, watch_deleted=self.watch
+        )
+
+        def _scale() -> None:
+            with scale:
+                pass
+
+        self.measure(
+            function="ThreadedScaleResources",
+            count=count,
+            func=_scale,
+            timings=scale.timings,
+            phases=("deploy", "status", "ready", "delete"),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", default="1000,10000,50000", help="Comma separated resource counts")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to each request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of creates and deletes failing")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of creates and deletes throttled")
+    parser.add_argument("--retry-after", default="1", help="Retry-After header of throttled requests")
+    parser.add_argument("--ready-delay", type=float, default=0.0, help="Seconds before pods are Running")
+    parser.add_argument("--connection-pool-maxsize", type=int, default=50, help="Concurrent REST calls")
+    parser.add_argument("--poll", action="store_true", help="Poll status and deletion instead of watching")
+    parser.add_argument("--processes", type=int, help="Worker processes of sharded utilities, defaults to CPUs")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of error and throttle draws")
+    parser.add_argument("--output", help="JSON file to write results to, defaults to stdout")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    # Resource loggers log every create and delete, which would be measured along with the utilities
+    logging.disable(level=logging.INFO)
+
+    server_kwargs = {
+        "ready_delay": args.ready_delay,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after,
+        "seed": args.seed,
+    }
+    connection, child_connection = multiprocessing.get_context("spawn").Pipe()
+    server_process = multiprocessing.get_context("spawn").Process(
+        target=_serve, args=(child_connection, server_kwargs), daemon=True
+    )
+    server_process.start()
+    try:
+        host = connection.recv()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = get_fake_client(
+                host=host,
+                cache_file=os.path.join(cache_dir, "discovery.json"),
+                connection_pool_maxsize=args.connection_pool_maxsize,
+            )
+            client_kwargs = {
+                "config_file": write_fake_kubeconfig(host=host, path=os.path.join(cache_dir, "kubeconfig")),
+                "temp_file_path": cache_dir,
+            }
+            benchmark = Benchmark(
+                connection=connection,
+                client=client,
+                watch=not args.poll,
+                client_kwargs=client_kwargs,
+                processes=args.processes,
+            )
+            for count in (int(count) for count in args.counts.split(",")):
+                benchmark.run(count=count)
+    finally:
+        connection.send("stop")
+        server_process.join()
+
+    output = json.dumps({"parameters": {**server_kwargs, **vars(args)}, "results": benchmark.results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncGenerator, Optional, Sequence
+
+import pytest
+from ocp_resources.resource import Resource
+
+from ocp_scale_utilities.aio.utils import (
+    async_delete_resources,
+    async_deploy_requested_resources,
+    async_deploy_resources,
+    async_deploy_resources_wait_for_status,
+    async_wait_deleted_resources,
+    async_wait_for_resources_status,
+)
+from ocp_scale_utilities.constants import TIMEOUT_2MIN
+from ocp_scale_utilities.monitoring import PrometheusDataCollector
+from ocp_scale_utilities.results import ResultsStore
+from ocp_scale_utilities.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from ocp_scale_utilities.scale import ScaleResourcesMixin
+from ocp_scale_utilities.threaded.utils import get_max_workers
+from ocp_scale_utilities.timing import ResourceTimings
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncScaleResources(ScaleResourcesMixin, AsyncExitStack):
+    def __init__(
+        self,
+        resources: Sequence[Resource],
+        request_resources: Optional[Sequence[Resource]] = None,
+        pytest_cache: Optional[pytest.Cache] = None,
+        cache_key_prefix: Optional[str] = None,
+        wait_for_status: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        watch_status: bool = False,
+        watch_deleted: bool = True,
+        delete_collection: bool = False,
+        delete_namespaces: Optional[Sequence[str]] = None,
+        wait_for_status_timeout: int = TIMEOUT_2MIN,
+        pipeline: bool = False,
+        throughput_bucket_seconds: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        data_collector: Optional[PrometheusDataCollector] = None,
+        results_store: Optional[ResultsStore] = None,
+        run_metadata: Optional[dict[str, Any]] = None,
+    ):
+        """
+        Asyncio counterpart of ThreadedScaleResources, to be used with async with.
+        Waits and backoffs are coroutines, so in-flight resources are only bounded by max_concurrency,
+        while blocking kube REST calls run on executor.
+
+        Args:
+            resources (Sequence): List of Resource objects to be managed
+            pytest_cache (pytest.Cache): config.cache from python run to store results in
+            cache_key_prefix (str): prefix to use for cache_keys
+            wait_for_status (str): Wait for provided status upon deploy
+            executor (Executor, optional): Shared executor to run the blocking kube REST calls on
+            max_workers (int, optional): Number of REST calls at once when executor is not provided,
+                defaults to connection_pool_maxsize of the Resource client
+            max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+            watch_status (bool, optional): Wait for status from shared list+watch streams instead of polling
+            watch_deleted (bool, optional): Wait for deletion from shared list+watch streams instead of polling
+            delete_collection (bool, optional): Delete resources sharing kind, namespace and labels
+                with one deletecollection call per group
+            delete_namespaces (list, optional): With delete_collection,
+                namespaces holding only scale objects, deleted as a whole
+            wait_for_status_timeout (int, optional): Time to wait for resources to reach wait_for_status
+            pipeline (bool, optional): With wait_for_status, wait for status of each resource
+                as soon as its own create returns instead of after all resources are deployed,
+                wait_for_status_timeout is then a deadline shared by deploy and status
+            throughput_bucket_seconds (float, optional): Width of the time buckets of throughput statistics
+            retry_policy (RetryPolicy, optional): Retry of deploys and deletes failing with a retryable status,
+                None to disable
+            data_collector (PrometheusDataCollector, optional): Collect prometheus data
+                at post-enter, pre-exit and cleanup-on-error, instead of collect_data() of child classes
+            results_store (ResultsStore, optional): Append a run named cache_key_prefix with its phases,
+                per-resource timings and data collected by data_collector
+            run_metadata (dict, optional): Metadata of the run in results_store, eg: build, cluster version
+        """
+        super().__init__()
+        self.resources = resources
+        self.request_resources = request_resources
+        self.pytest_cache = pytest_cache
+        self.cache_key_prefix = cache_key_prefix
+        self.wait_for_status = wait_for_status
+        self.executor = executor
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.watch_status = watch_status
+        self.watch_deleted = watch_deleted
+        self.delete_collection = delete_collection
+        self.delete_namespaces = delete_namespaces
+        self.wait_for_status_timeout = wait_for_status_timeout
+        self.pipeline = pipeline
+        self.throughput_bucket_seconds = throughput_bucket_seconds
+        self.retry_policy = retry_policy
+        self.data_collector = data_collector
+        self.results_store = results_store
+        self.run_metadata = run_metadata
+        self.run_id: Optional[str] = None
+
+        # Lifecycle timestamps per resource, indexed like resources
+        self.timings = ResourceTimings(count=len(resources))
+        self._owned_executor: Optional[ThreadPoolExecutor] = None
+        self.collect_data_start_time = time.time()
+
+    @asynccontextmanager
+    async def _cleanup_on_error(self, stack_exit, phase: str) -> AsyncGenerator[None, None]:
+        async with AsyncExitStack() as stack:
+            stack.push_async_exit(stack_exit)
+            # Recorded before resources are unwound
+            stack.callback(self._record_failed_phase, phase=phase, start_time=time.time())
+            yield
+            self.collect_data(id="cleanup-on-error", start_time=self.collect_data_start_time)
+            stack.pop_all()
+
+    async def __aenter__(self) -> AsyncScaleResources:
+        async with self._cleanup_on_error(stack_exit=super().__aexit__, phase="deploy"):
+            if not self.executor:
+                # Registered first, so it is unwound last
+                self.executor = self._owned_executor = ThreadPoolExecutor(
+                    max_workers=get_max_workers(resources=self.resources, max_workers=self.max_workers)
+                )
+                self.callback(self._shutdown_executor)
+
+            start_time = time.time()
+            self._start_run()
+            if self.pipeline and self.wait_for_status:
+                await async_deploy_resources_wait_for_status(
+                    resources=self.resources,
+                    status=self.wait_for_status,
+                    timeout=self.wait_for_status_timeout,
+                    request_resources=self.request_resources,
+                    exit_stack=self,
+                    executor=self.executor,
+                    max_concurrency=self.max_concurrency,
+                    watch=self.watch_status,
+                    timings=self.timings,
+                    retry_policy=self.retry_policy,
+                )
+            elif self.request_resources:
+                await async_deploy_requested_resources(
+                    resources=self.resources,
+                    request_resources=self.request_resources,
+                    exit_stack=self,
+                    executor=self.executor,
+                    max_concurrency=self.max_concurrency,
+                    timings=self.timings,
+                    retry_policy=self.retry_policy,
+                )
+            else:
+                await async_deploy_resources(
+                    resources=self.resources,
+                    exit_stack=self,
+                    executor=self.executor,
+                    max_concurrency=self.max_concurrency,
+                    timings=self.timings,
+                    retry_policy=self.retry_policy,
+                )
+
+            if self.wait_for_status and not self.pipeline:
+                await async_wait_for_resources_status(
+                    resources=self.resources,
+                    status=self.wait_for_status,
+                    timeout=self.wait_for_status_timeout,
+                    executor=self.executor,
+                    max_concurrency=self.max_concurrency,
+                    watch=self.watch_status,
+                    timings=self.timings,
+                )
+
+            self.collect_data_start_time = stop_time = time.time()
+            self._record_deploy(start_time=start_time, stop_time=stop_time)
+
+            self.collect_data(id="post-enter", start_time=start_time)
+
+        return self
+
+    async def __aexit__(self, *exc_arguments: Any) -> Any:
+        """
+        Delete all resources, mark the start and end fields.
+        On error, deletion will unwind AsyncExitStack,
+        exiting the resources of each deploy in parallel batches,
+        in reverse order of creation between batches.
+        """
+        async with self._cleanup_on_error(stack_exit=super().__aexit__, phase="delete"):
+            self.collect_data(id="pre-exit", start_time=self.collect_data_start_time)
+            start_time = time.time()
+            await async_delete_resources(
+                resources=self.resources,
+                executor=self.executor,
+                max_concurrency=self.max_concurrency,
+                collection=self.delete_collection,
+                namespaces=self.delete_namespaces,
+                timings=self.timings,
+                retry_policy=self.retry_policy,
+            )
+            await async_wait_deleted_resources(
+                resources=self.resources,
+                executor=self.executor,
+                max_concurrency=self.max_concurrency,
+                watch=self.watch_deleted,
+                timings=self.timings,
+            )
+            stop_time = time.time()
+            self._record_delete(start_time=start_time, stop_time=stop_time)
+
+        self._shutdown_executor()
@@ -0,0 +1,543 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor
+from contextlib import AsyncExitStack
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from ocp_resources.resource import Resource
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_scale_utilities.constants import TIMEOUT_2MIN, TIMEOUT_4MIN
+from ocp_scale_utilities.exceptions import ThreadedResourcesError
+from ocp_scale_utilities.retry import DEFAULT_RETRY_POLICY, RetryPolicy, async_call_with_retry
+from ocp_scale_utilities.template import get_exit_callback
+from ocp_scale_utilities.threaded.collection import threaded_delete_collections
+from ocp_scale_utilities.threaded.utils import (
+    ThreadedExitCallbacks,
+    get_deploy_func,
+    push_exit_callbacks,
+    record_times,
+    resources_executor,
+)
+from ocp_scale_utilities.threaded.watch import ResourcesWatcher
+from ocp_scale_utilities.timing import (
+    CREATE_ACK,
+    CREATE_REQUEST,
+    DELETE_REQUEST,
+    GONE,
+    STATUS_REACHED,
+    ResourceTimings,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds between polls of a resource
+POLL_INTERVAL = 1
+
+
+async def _run(executor: Optional[Executor], func: Callable[[], Any]) -> Any:
+    """
+    Run a blocking kube REST call on executor, without blocking the event loop
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, func)
+
+
+async def _gather(
+    resources: Sequence[Resource],
+    func: Callable[[int], Awaitable[Any]],
+    max_concurrency: Optional[int] = None,
+    aggregate_errors: bool = True,
+) -> list[Any]:
+    """
+    Await func with the index of each resource, at most max_concurrency at once, letting every call complete.
+    Only max_concurrency coroutines exist at once, each one taking the next resource when done.
+
+    Raises:
+        ThreadedResourcesError: Once all calls completed, if any of them failed and aggregate_errors
+        Exception: First error raised, if any call failed and not aggregate_errors
+    """
+    results: list[Any] = [None] * len(resources)
+    indexes = iter(range(len(resources)))
+
+    async def _worker() -> None:
+        for index in indexes:
+            try:
+                results[index] = await func(index)
+            except Exception as exp:
+                results[index] = exp
+
+    await asyncio.gather(*(_worker() for _ in range(min(len(resources), max_concurrency or len(resources)))))
+    failures: list[tuple[Resource, BaseException]] = [
+        (resources[index], result) for index, result in enumerate(results) if isinstance(result, Exception)
+    ]
+    if failures and aggregate_errors:
+        raise ThreadedResourcesError(failures=failures, results=results) from failures[0][1]
+    if failures:
+        raise failures[0][1]
+    return results
+
+
+async def _deploy_resource(
+    resource: Resource,
+    executor: Optional[Executor] = None,
+    exit_callbacks: Optional[ThreadedExitCallbacks] = None,
+    exit_callback: Optional[Callable[..., Any]] = None,
+    request_resource: Optional[Resource] = None,
+    timings: Optional[ResourceTimings] = None,
+    index: int = 0,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> Any:
+    """
+    Deploy resource, or its request resource, retrying according to retry_policy,
+    registering exit_callback, or resource.__exit__, with exit_callbacks if provided,
+    recording create-request and create-ack times of the resource at index with timings if provided
+    """
+    deploy = get_deploy_func(resource=resource, enter=bool(exit_callbacks), request_resource=request_resource)
+    if timings:
+        timings.record(event=CREATE_REQUEST, index=index)
+    result = await async_call_with_retry(
+        func=partial(_run, executor=executor, func=deploy),
+        retry_policy=retry_policy,
+        description=f"Deploy {resource.kind} {resource.name}",
+        create=True,
+    )
+    if timings:
+        timings.record(event=CREATE_ACK, index=index)
+
+    if not exit_callbacks:
+        return result
+    exit_callbacks.append(callback=exit_callback or resource.__exit__)
+    return None
+
+
+async def _wait_for_resource_status(
+    resource: Resource,
+    status: str,
+    timeout: float,
+    executor: Optional[Executor] = None,
+    timings: Optional[ResourceTimings] = None,
+    index: int = 0,
+    stop_status: Optional[str] = None,
+    poll_interval: float = POLL_INTERVAL,
+) -> None:
+    """
+    Poll resource until it reaches status, sleeping on the event loop between polls
+
+    Raises:
+        TimeoutExpiredError: If resource did not reach status before timeout, or reached stop_status
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    stop_status = stop_status or resource.Status.FAILED
+    while True:
+        instance = await _run(executor=executor, func=lambda: resource.exists)
+        current_status = (instance.to_dict().get("status") or {}).get("phase") if instance else None
+        if current_status == status:
+            if timings:
+                timings.record(event=STATUS_REACHED, index=index)
+            return
+        if current_status == stop_status:
+            raise TimeoutExpiredError(f"Status of {resource.kind} {resource.name} is {current_status}")
+        if loop.time() >= deadline:
+            raise TimeoutExpiredError(
+                f"{resource.kind} {resource.name} did not reach status {status}, last status {current_status}"
+            )
+        await asyncio.sleep(poll_interval)
+
+
+async def _wait_resource_deleted(
+    resource: Resource,
+    timeout: float,
+    executor: Optional[Executor] = None,
+    timings: Optional[ResourceTimings] = None,
+    index: int = 0,
+    poll_interval: float = POLL_INTERVAL,
+) -> bool:
+    """
+    Poll resource until it no longer exists, sleeping on the event loop between polls
+
+    Returns:
+        bool: True if deleted, False if resource still exists after timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while await _run(executor=executor, func=lambda: resource.exists):
+        if loop.time() >= deadline:
+            LOGGER.warning(f"Timeout expired while waiting for {resource.kind} {resource.name} to be deleted")
+            return False
+        await asyncio.sleep(poll_interval)
+    if timings:
+        timings.record(event=GONE, index=index)
+    return True
+
+
+def _delete_collections(
+    resources: Sequence[Resource],
+    executor: Optional[Executor] = None,
+    namespaces: Optional[Sequence[str]] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> list[Optional[bool]]:
+    with resources_executor(resources=resources, executor=executor) as _executor:
+        return threaded_delete_collections(
+            resources=resources, executor=_executor, namespaces=namespaces, retry_policy=retry_policy
+        )
+
+
+async def async_clean_up_resources(
+    resources: Sequence[Resource], *, executor: Optional[Executor] = None, max_concurrency: Optional[int] = None
+) -> list[Any]:
+    """
+    Call clean_up() for multiple resources
+
+    Args:
+        resources (list): List of Resources
+        executor (Executor, optional): Executor running the blocking kube REST calls,
+            defaults to the default executor of the event loop
+        max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+
+    Returns:
+        list: Data related to the results of the function
+    """
+    return await _gather(
+        resources=resources,
+        func=lambda x: _run(executor=executor, func=resources[x].clean_up),
+        max_concurrency=max_concurrency,
+        aggregate_errors=False,
+    )
+
+
+async def async_delete_resources(
+    resources: Sequence[Resource],
+    *,
+    executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+    collection: bool = False,
+    namespaces: Optional[Sequence[str]] = None,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+) -> list[Any]:
+    """
+    Call delete() for multiple resources
+
+    Args:
+        resources (list): List of Resources
+        executor (Executor, optional): Executor running the blocking kube REST calls,
+            defaults to the default executor of the event loop
+        max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+        collection (bool, optional): Delete resources sharing kind, namespace and labels with one deletecollection
+            call per group, falling back to delete() when a group cannot be selected exclusively
+        namespaces (list, optional): With collection, namespaces holding only scale objects, deleted as a whole
+        timings (ResourceTimings, optional): Record the delete-request time of each resource
+        retry_policy (RetryPolicy, optional): Retry of deletes failing with a retryable status, None to disable
+
+    Returns:
+        list: Data related to the results of the function, one result per resource
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deleted
+    """
+    collection_results: list[Optional[bool]] = [None] * len(resources)
+
+    async def _delete(_index: int) -> Any:
+        if collection_results[_index] is not None:
+            return collection_results[_index]
+        _resource = resources[_index]
+        if timings:
+            timings.record(event=DELETE_REQUEST, index=_index)
+        return await async_call_with_retry(
+            func=partial(_run, executor=executor, func=_resource.delete),
+            retry_policy=retry_policy,
+            description=f"Delete {_resource.kind} {_resource.name}",
+        )
+
+    if collection:
+        record_times(timings=timings, event=DELETE_REQUEST, times=[time.time()] * len(resources))
+        collection_results = await asyncio.to_thread(
+            _delete_collections,
+            resources=resources,
+            executor=executor,
+            namespaces=namespaces,
+            retry_policy=retry_policy,
+        )
+    return await _gather(resources=resources, func=_delete, max_concurrency=max_concurrency)
+
+
+async def async_wait_deleted_resources(
+    resources: Sequence[Resource],
+    *,
+    timeout: int = TIMEOUT_4MIN,
+    executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+    watch: bool = False,
+    timings: Optional[ResourceTimings] = None,
+    poll_interval: float = POLL_INTERVAL,
+) -> list[Any]:
+    """
+    Wait for multiple resources to be deleted
+
+    Args:
+        resources (list): List of Resources
+        timeout (int): Length of time to wait for each resource to be deleted
+        executor (Executor, optional): Executor running the blocking kube REST calls,
+            defaults to the default executor of the event loop
+        max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+        watch (bool, optional): Track all resources from one list+watch stream per kind and namespace
+            instead of polling each resource, timeout is then shared by all resources
+        timings (ResourceTimings, optional): Record the time each resource was observed gone
+        poll_interval (float): Seconds between polls of a resource
+
+    Returns:
+        list: True for each deleted resource
+    """
+    if watch:
+        deleted_times = await asyncio.to_thread(ResourcesWatcher(resources=resources, timeout=timeout).wait_deleted)
+        record_times(timings=timings, event=GONE, times=deleted_times)
+        return [deleted is not None for deleted in deleted_times]
+
+    return await _gather(
+        resources=resources,
+        func=lambda x: _wait_resource_deleted(
+            resource=resources[x],
+            timeout=timeout,
+            executor=executor,
+            timings=timings,
+            index=x,
+            poll_interval=poll_interval,
+        ),
+        max_concurrency=max_concurrency,
+        aggregate_errors=False,
+    )
+
+
+async def async_deploy_requested_resources(
+    resources: Sequence[Resource],
+    request_resources: Sequence[Resource],
+    exit_stack: Optional[AsyncExitStack] = None,
+    *,
+    executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+) -> list[Any]:
+    """
+    Deploy multiple resources
+
+    Args:
+        resources (list): List of Resources eg: Project
+        request_resources (list): List of Request Resources eg: ProjectRequest
+        exit_stack (AsyncExitStack, optional): AsyncExitStack if desired, will enter Resources to deploy them
+            and push a single ThreadedExitCallbacks unwinding them in parallel
+        executor (Executor, optional): Executor running the blocking kube REST calls,
+            defaults to the default executor of the event loop
+        max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+        timings (ResourceTimings, optional): Record create-request and create-ack times of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+
+    Returns:
+        list: Data related to the results of the function
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deployed
+    """
+    exit_callbacks = push_exit_callbacks(resources=resources, exit_stack=exit_stack, executor=executor)
+    return await _gather(
+        resources=resources,
+        func=lambda x: _deploy_resource(
+            resource=resources[x],
+            executor=executor,
+            exit_callbacks=exit_callbacks,
+            exit_callback=get_exit_callback(resources=resources, index=x),
+            request_resource=request_resources[x],
+            timings=timings,
+            index=x,
+            retry_policy=retry_policy,
+        ),
+        max_concurrency=max_concurrency,
+    )
+
+
+async def async_deploy_resources(
+    resources: Sequence[Resource],
+    exit_stack: Optional[AsyncExitStack] = None,
+    *,
+    executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+) -> list[Any]:
+    """
+    Deploy multiple resources
+
+    Args:
+        resources (list): List of Resources
+        exit_stack (AsyncExitStack, optional): AsyncExitStack if desired, will enter Resources to deploy them
+            and push a single ThreadedExitCallbacks unwinding them in parallel
+        executor (Executor, optional): Executor running the blocking kube REST calls,
+            defaults to the default executor of the event loop
+        max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+        timings (ResourceTimings, optional): Record create-request and create-ack times of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+
+    Returns:
+        list: Data related to the results of the function
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deployed
+    """
+    exit_callbacks = push_exit_callbacks(resources=resources, exit_stack=exit_stack, executor=executor)
+    return await _gather(
+        resources=resources,
+        func=lambda x: _deploy_resource(
+            resource=resources[x],
+            executor=executor,
+            exit_callbacks=exit_callbacks,
+            exit_callback=get_exit_callback(resources=resources, index=x),
+            timings=timings,
+            index=x,
+            retry_policy=retry_policy,
+        ),
+        max_concurrency=max_concurrency,
+    )
+
+
+async def async_wait_for_resources_status(
+    resources: Sequence[Resource],
+    status: str,
+    timeout: int = TIMEOUT_2MIN,
+    *,
+    executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+    watch: bool = False,
+    timings: Optional[ResourceTimings] = None,
+    poll_interval: float = POLL_INTERVAL,
+) -> list[Any]:
+    """
+    Wait for multiple resources to reach status
+
+    Args:
+        resources (list): List of Resources
+        status (str): Status to wait for
+        timeout (int): Length of time to wait for each resource to reach status
+        executor (Executor, optional): Executor running the blocking kube REST calls,
+            defaults to the default executor of the event loop
+        max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+        watch (bool, optional): Track all resources from one list+watch stream per kind and namespace
+            instead of polling each resource, timeout is then shared by all resources
+        timings (ResourceTimings, optional): Record the time each resource reached status
+        poll_interval (float): Seconds between polls of a resource
+
+    Returns:
+        list: Data related to the results of the function, time each resource reached status when watching
+
+    Raises:
+        TimeoutExpiredError: If resources did not reach status
+    """
+    if watch:
+        watcher = ResourcesWatcher(resources=resources, timeout=timeout)
+        try:
+            return await asyncio.to_thread(watcher.wait_for_status, status=status)
+        finally:
+            record_times(timings=timings, event=STATUS_REACHED, times=watcher.results)
+
+    return await _gather(
+        resources=resources,
+        func=lambda x: _wait_for_resource_status(
+            resource=resources[x],
+            status=status,
+            timeout=timeout,
+            executor=executor,
+            timings=timings,
+            index=x,
+            poll_interval=poll_interval,
+        ),
+        max_concurrency=max_concurrency,
+        aggregate_errors=False,
+    )
+
+
+async def async_deploy_resources_wait_for_status(
+    resources: Sequence[Resource],
+    status: str,
+    timeout: int = TIMEOUT_2MIN,
+    *,
+    request_resources: Optional[Sequence[Resource]] = None,
+    exit_stack: Optional[AsyncExitStack] = None,
+    executor: Optional[Executor] = None,
+    max_concurrency: Optional[int] = None,
+    watch: bool = False,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    poll_interval: float = POLL_INTERVAL,
+) -> None:
+    """
+    Deploy multiple resources, each resource waiting for status as soon as its own create returns.
+    All resources share a single deadline.
+
+    Args:
+        resources (list): List of Resources
+        status (str): Status to wait for
+        timeout (int): Shared deadline in seconds for all resources to be deployed and reach status
+        request_resources (list, optional): List of Request Resources eg: ProjectRequest
+        exit_stack (AsyncExitStack, optional): AsyncExitStack if desired, will enter Resources to deploy them
+            and push a single ThreadedExitCallbacks unwinding them in parallel
+        executor (Executor, optional): Executor running the blocking kube REST calls,
+            defaults to the default executor of the event loop
+        max_concurrency (int, optional): Number of resources in progress at once, defaults to all resources
+        watch (bool, optional): Track status from one list+watch stream per kind and namespace
+            started before the first create, instead of polling each resource
+        timings (ResourceTimings, optional): Record create-request, create-ack and status-reached times
+            of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+        poll_interval (float): Seconds between polls of a resource
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deployed,
+            or did not reach status before the deadline without watch
+        TimeoutExpiredError: If watched resources did not reach status before the deadline
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    exit_callbacks = push_exit_callbacks(resources=resources, exit_stack=exit_stack, executor=executor)
+
+    async def _deploy(_index: int) -> None:
+        await _deploy_resource(
+            resource=resources[_index],
+            executor=executor,
+            exit_callbacks=exit_callbacks,
+            exit_callback=get_exit_callback(resources=resources, index=_index),
+            request_resource=request_resources[_index] if request_resources else None,
+            timings=timings,
+            index=_index,
+            retry_policy=retry_policy,
+        )
+        if not watch:
+            await _wait_for_resource_status(
+                resource=resources[_index],
+                status=status,
+                timeout=max(0.0, deadline - loop.time()),
+                executor=executor,
+                timings=timings,
+                index=_index,
+                poll_interval=poll_interval,
+            )
+
+    watcher = ResourcesWatcher(resources=resources, timeout=timeout) if watch else None
+    watch_task = asyncio.ensure_future(asyncio.to_thread(watcher.wait_for_status, status=status)) if watcher else None
+    try:
+        await _gather(resources=resources, func=_deploy, max_concurrency=max_concurrency)
+        if watch_task:
+            await watch_task
+    except BaseException:
+        if watcher:
+            watcher.stop()
+        if watch_task:
+            # The stopped watch ends on its own, its error is superseded by the one raised
+            watch_task.add_done_callback(lambda _task: _task.cancelled() or _task.exception())
+        raise
+    finally:
+        if watcher:
+            record_times(timings=timings, event=STATUS_REACHED, times=watcher.results)
@@ -1,4 +1,5 @@
 TIMEOUT_30SEC = 30
 
 TIMEOUT_2MIN = 60 * 2
+TIMEOUT_4MIN = 60 * 4
 TIMEOUT_5MIN = 60 * 5
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ocp_resources.resource import Resource
+
+
+class ThreadedResourcesError(Exception):
+    def __init__(self, failures: list[tuple[Resource, BaseException]], results: list[Any]):
+        """
+        Raised once all resources of a threaded helper were processed, if any of them failed
+
+        Args:
+            failures (list): (resource, raised exception) per failed resource
+            results (list): Result per resource, the raised exception for failed resources
+        """
+        self.failures = failures
+        self.results = results
+        summary = ", ".join(f"{resource.kind} {resource.name}: {exp!r}" for resource, exp in failures[:10])
+        super().__init__(f"{len(failures)} of {len(results)} resources failed: {summary}")
+
+    @property
+    def failed_resources(self) -> list[Resource]:
+        return [resource for resource, _ in self.failures]
+
+
+class ShardWorkerError(Exception):
+    """
+    Raised in place of an exception of a worker process which cannot be sent to the parent process,
+    or for the resources left unprocessed by a worker process which exited unexpectedly
+    """
@@ -1,81 +1,491 @@
 from __future__ import annotations
 
+import gzip
+import io
+import json
 import logging
-from multiprocessing import Queue
+import queue
+import re
+import threading
+import time
+from multiprocessing import Queue, get_context, queues
 from logging import StreamHandler
 from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Optional
 
 from simple_logger.logger import WrapperLogFormatter, DuplicateFilter
 
 
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler of an in-process queue, enqueuing records as they are,
+    leaving message merging and formatting to the listener thread
+    """
+
+    listener: Optional[BatchQueueListener] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchFlushMixin:
+    """
+    Flush a stream once per batch drained by BatchQueueListener instead of once per record
+    """
+
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        StreamHandler.flush(self)  # type: ignore[arg-type]
+
+
+class _BatchStreamHandler(_BatchFlushMixin, StreamHandler):
+    pass
+
+
+class _BatchRotatingFileHandler(_BatchFlushMixin, RotatingFileHandler):
+    pass
+
+
+# LogRecord attributes holding the resource a record is about, set with extra=resource_extra(resource)
+RESOURCE_EXTRA_FIELDS = {"resource_kind": "kind", "resource_name": "name", "resource_namespace": "namespace"}
+
+
+def resource_extra(resource: Any) -> dict[str, Optional[str]]:
+    """
+    extra of a log call about resource, eg: LOGGER.info("Deployed", extra=resource_extra(resource=vm))
+    """
+    return {field: getattr(resource, attribute, None) for field, attribute in RESOURCE_EXTRA_FIELDS.items()}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line:
+    timestamp, thread, logger, level, message, exception and resource fields of resource_extra()
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "thread": record.threadName,
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        for field in RESOURCE_EXTRA_FIELDS:
+            if getattr(record, field, None) is not None:
+                entry[field] = getattr(record, field)
+        return json.dumps(entry, default=str)
+
+
+class GzipRotatingFileHandler(RotatingFileHandler):
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 2**30,
+        backup_count: int = 10,
+        flush_interval: float = 5.0,
+    ):
+        """
+        RotatingFileHandler writing gzip compressed lines, rotating to filename.1.gz, filename.2.gz...
+        Compression and rotation run on the thread handling records, the listener thread with setup_logging().
+
+        Args:
+            filename (str): Log file, eg: run.jsonl.gz
+            max_bytes (int): Max uncompressed bytes per log file before rotation,
+                counting the bytes of a log file being appended to
+            backup_count (int): Max log files to rotate
+            flush_interval (float): Min seconds between flushes, each flush ending a compression block
+        """
+        self.flush_interval = flush_interval
+        self._flush_time = time.monotonic()
+        self.bytes_written = self._uncompressed_size(filename=filename)
+        super().__init__(filename=filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.namer = lambda name: re.sub(r"\.gz\.(\d+)$", r".\1.gz", name)
+
+    @staticmethod
+    def _uncompressed_size(filename: str) -> int:
+        """
+        Uncompressed bytes of a log file being appended to,
+        up to a compression block truncated when its writer was killed
+        """
+        size = 0
+        try:
+            with gzip.open(filename, "rb") as log_file:
+                while chunk := log_file.read(2**20):
+                    size += len(chunk)
+        except (OSError, EOFError):
+            pass
+        return size
+
+    def _open(self) -> io.TextIOWrapper:
+        return io.TextIOWrapper(gzip.open(self.baseFilename, "ab"), encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = f"{self.format(record)}\n"
+            size = len(message.encode(self.encoding or "utf-8"))
+            if self.maxBytes and self.bytes_written and self.bytes_written + size > self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(message)
+            self.bytes_written += size
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self.bytes_written = 0
+
+    def flush(self) -> None:
+        if time.monotonic() - self._flush_time >= self.flush_interval:
+            self._flush_time = time.monotonic()
+            super().flush()
+
+
+class _LoggerFormatter(logging.Formatter):
+    def __init__(self, formatters: dict[str, logging.Formatter], default: logging.Formatter):
+        """
+        Format records with the formatter of their logger, formatting each record once for all handlers
+
+        Args:
+            formatters (dict): Formatter per logger name
+            default (logging.Formatter): Formatter of records of other loggers
+        """
+        super().__init__()
+        self.formatters = formatters
+        self.default = default
+        self._last_record: Optional[logging.LogRecord] = None
+        self._last_text = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if record is not self._last_record:
+            self._last_text = self.formatters.get(record.name, self.default).format(record)
+            self._last_record = record
+        return self._last_text
+
+
+# Standalone numbers, with an optional unit, eg: 42, 0.5, 10s, 75%
+_NUMBER_PATTERN = re.compile(r"(?<![\w.-])\d+(?:\.\d+)?(?:ms|s|m|h|%)?(?![\w.-])")
+# Remaining words holding a digit, eg: resource names vm-1234, uids
+_NAME_PATTERN = re.compile(r"(?<![\w.-])[\w.-]*\d[\w.-]*(?![\w.-])")
+
+
+def get_message_template(message: str) -> str:
+    """
+    Message with numbers and resource names stripped, eg: "waiting for VM <name> to be Running"
+    """
+    return _NAME_PATTERN.sub("<name>", _NUMBER_PATTERN.sub("<n>", message))
+
+
+class LogAggregator:
+    def __init__(self, interval: float = 10.0, samples: int = 1, pass_level: int = logging.WARNING):
+        """
+        Group records by logger, level and message template, passing samples of each template per interval
+        and summarizing the others, eg: "1,873 × waiting for VM <name> to be Running in the last 10s"
+
+        Args:
+            interval (float): Seconds between summaries
+            samples (int): Records passed per template and interval, before the others are counted
+            pass_level (int): Records of this level and above are always passed
+        """
+        self.interval = interval
+        self.samples = samples
+        self.pass_level = pass_level
+        self._counts: dict[tuple[str, int, str], int] = {}
+        self._window_start = time.monotonic()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Count record
+
+        Returns:
+            bool: True if record is to be passed, False if it is only counted
+        """
+        if record.levelno >= self.pass_level:
+            return True
+        key = (record.name, record.levelno, get_message_template(message=record.getMessage()))
+        count = self._counts[key] = self._counts.get(key, 0) + 1
+        return count <= self.samples
+
+    def summaries(self, force: bool = False) -> list[logging.LogRecord]:
+        """
+        Summary records of templates with records not passed, once interval elapsed
+
+        Args:
+            force (bool): Summarize before interval elapsed, eg: on stop
+
+        Returns:
+            list: Summary records, empty until interval elapsed
+        """
+        elapsed = time.monotonic() - self._window_start
+        if elapsed < self.interval and not force:
+            return []
+        summaries = [
+            logging.makeLogRecord({
+                "name": name,
+                "levelno": levelno,
+                "levelname": logging.getLevelName(levelno),
+                "msg": f"{count:,} × {template} in the last {elapsed:.0f}s",
+            })
+            for (name, levelno, template), count in self._counts.items()
+            if count > self.samples
+        ]
+        self._counts = {}
+        self._window_start = time.monotonic()
+        return summaries
+
+
+class BatchQueueListener(QueueListener):
+    _sentinel = None
+    queue: Any
+
+    def __init__(
+        self,
+        log_queue: Any,
+        *handlers: logging.Handler,
+        batch_size: int = 1000,
+        logger_filters: Optional[dict[str, logging.Filter]] = None,
+        aggregator: Optional[LogAggregator] = None,
+    ):
+        """
+        QueueListener draining records in batches, filtering them once and flushing handlers once per batch.
+        A multiprocessing queue forwarding records of worker processes is only created on demand.
+
+        Args:
+            log_queue (Queue): Queue records are enqueued to
+            handlers (logging.Handler): Handlers records are passed to
+            batch_size (int): Max records handled between flushes
+            logger_filters (dict, optional): Filter per logger name, applied to records of that logger only,
+                as a filter of the logger would be, but on the listener thread
+            aggregator (LogAggregator, optional): Sample repetitive records and summarize them periodically
+        """
+        super().__init__(log_queue, *handlers)
+        self.batch_size = batch_size
+        self.logger_filters = logger_filters or {}
+        self.aggregator = aggregator
+        self._multiprocessing_queue: Optional[Queue] = None
+        self._forwarder: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        logger_filter = self.logger_filters.get(record.name)
+        if logger_filter and not logger_filter.filter(record):
+            return
+        if self.aggregator and not self.aggregator.filter(record):
+            return
+        super().handle(record)
+
+    def _handle_summaries(self, force: bool = False) -> None:
+        if self.aggregator:
+            for summary in self.aggregator.summaries(force=force):
+                super().handle(summary)
+
+    def _flush(self) -> None:
+        for handler in self.handlers:
+            getattr(handler, "flush_batch", handler.flush)()
+
+    def _monitor(self) -> None:
+        while True:
+            try:
+                # Wake up to summarize even when no records are logged
+                records = [self.queue.get(timeout=self.aggregator.interval if self.aggregator else None)]
+            except queue.Empty:
+                records = []
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            for record in records:
+                if record is self._sentinel:
+                    self._handle_summaries(force=True)
+                    self._flush()
+                    return
+                self.handle(record)
+            self._handle_summaries()
+            self._flush()
+
+    def _forward(self) -> None:
+        while (record := self._multiprocessing_queue.get()) is not self._sentinel:  # type: ignore[union-attr]
+            self.queue.put(record)
+
+    def get_multiprocessing_queue(self) -> Queue:
+        """
+        Queue for worker processes to send their records to, forwarded to the queue of the listener
+
+        Returns:
+            Queue: Multiprocessing queue created in the spawn context, shareable with processes of any start method
+        """
+        with self._lock:
+            if not self._multiprocessing_queue:
+                self._multiprocessing_queue = get_context("spawn").Queue(maxsize=-1)
+                self._forwarder = threading.Thread(target=self._forward, daemon=True)
+                self._forwarder.start()
+            return self._multiprocessing_queue
+
+    def stop(self) -> None:
+        """
+        Stop the listener once all queued records were handled, closing its handlers to end compressed streams
+        """
+        if self._multiprocessing_queue and self._forwarder:
+            self._multiprocessing_queue.put(self._sentinel)
+            self._forwarder.join()
+            self._forwarder = None
+        super().stop()
+        for handler in self.handlers:
+            handler.close()
+
+
+def _add_queue_handlers(
+    log_queue: Any, log_level: int, queue_handler_class: type[QueueHandler] = QueueHandler
+) -> list[QueueHandler]:
+    """
+    Send records of the root and basic loggers to log_queue, to be formatted by the listener
+
+    Returns:
+        list: root and basic QueueHandler
+    """
+    basic_log_queue_handler = queue_handler_class(queue=log_queue)
+    basic_log_queue_handler.set_name(name="basic")
+
+    basic_logger = logging.getLogger("basic")
+    basic_logger.setLevel(level=log_level)
+    basic_logger.addHandler(hdlr=basic_log_queue_handler)
+
+    root_log_queue_handler = queue_handler_class(queue=log_queue)
+    root_log_queue_handler.set_name(name="root")
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level=log_level)
+    root_logger.addHandler(hdlr=root_log_queue_handler)
+
+    root_logger.propagate = False
+    basic_logger.propagate = False
+    return [root_log_queue_handler, basic_log_queue_handler]
+
+
 def setup_logging(
     log_level: int = logging.INFO,
     log_file: Optional[str] = None,
     log_file_max_bytes: int = 2**27,
     log_file_backup_count: int = 10,
-) -> QueueListener:
+    batch_size: int = 1000,
+    aggregate_interval: Optional[float] = None,
+    json_log_file: Optional[str] = None,
+    json_log_file_max_bytes: int = 2**30,
+) -> BatchQueueListener:
     """
     Setup basic/root logging using QueueHandler/QueueListener
     to consolidate log messages into a single stream to be written to multiple outputs.
 
+    Records are passed as they are through an in-process queue,
+    filtering and formatting happen on the listener thread, in batches.
+    Records of worker processes go through a multiprocessing queue created by get_log_queue() on demand.
+
     Args:
         log_level (int): log level
         log_file (str, optional): logging output file
         log_file_max_bytes (int, optional): Max bytes per log file before rotation
         log_file_backup_count (int, optional): Max log files to rotate
+        batch_size (int, optional): Max records handled by the listener between flushes
+        aggregate_interval (float, optional): Pass one record per message template below WARNING
+            every aggregate_interval seconds, summarizing the others, eg: repetitive per-resource messages
+        json_log_file (str, optional): gzip compressed JSON lines logging output file, eg: run.jsonl.gz
+        json_log_file_max_bytes (int, optional): Max uncompressed bytes per JSON lines log file before rotation
 
     Returns:
-        QueueListener: Process monitoring the log Queue
+        BatchQueueListener: Thread monitoring the log Queue
 
     Eg:
-       root QueueHandler ┐                         ┌> StreamHandler
-                         ├> Queue -> QueueListener ┤
-      basic QueueHandler ┘                         └> FileHandler
-    """
-    basic_log_formatter = logging.Formatter(fmt="%(message)s")
-    root_log_formatter = WrapperLogFormatter(
-        fmt="%(asctime)s %(name)s %(log_color)s%(levelname)s%(reset)s %(message)s",
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red,bg_white",
-        },
-        secondary_log_colors={},
+       root QueueHandler ┐                               ┌> StreamHandler
+                         ├> SimpleQueue -> QueueListener ┤
+      basic QueueHandler ┘       ^                       ├> FileHandler
+       worker processes -> Queue ┘                       └> GzipRotatingFileHandler
+    """
+    log_formatter = _LoggerFormatter(
+        formatters={"basic": logging.Formatter(fmt="%(message)s")},
+        default=WrapperLogFormatter(
+            fmt="%(asctime)s %(name)s %(log_color)s%(levelname)s%(reset)s %(message)s",
+            log_colors={
+                "DEBUG": "cyan",
+                "INFO": "green",
+                "WARNING": "yellow",
+                "ERROR": "red",
+                "CRITICAL": "red,bg_white",
+            },
+            secondary_log_colors={},
+        ),
     )
 
-    log_queue: Queue = Queue(maxsize=-1)
-    console_handler = StreamHandler()
-
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log_handlers: list[logging.Handler] = [_BatchStreamHandler()]
     if log_file:
-        log_file_handler = RotatingFileHandler(
-            filename=log_file, maxBytes=log_file_max_bytes, backupCount=log_file_backup_count
+        log_handlers.insert(
+            0,
+            _BatchRotatingFileHandler(
+                filename=log_file, maxBytes=log_file_max_bytes, backupCount=log_file_backup_count
+            ),
+        )
+    for log_handler in log_handlers:
+        log_handler.setFormatter(fmt=log_formatter)
+    if json_log_file:
+        json_log_handler = GzipRotatingFileHandler(
+            filename=json_log_file, max_bytes=json_log_file_max_bytes, backup_count=log_file_backup_count
         )
-        log_listener = QueueListener(log_queue, log_file_handler, console_handler)
-    else:
-        log_listener = QueueListener(log_queue, console_handler)
+        json_log_handler.setFormatter(fmt=JsonLinesFormatter())
+        log_handlers.append(json_log_handler)
 
-    basic_log_queue_handler = QueueHandler(queue=log_queue)
-    basic_log_queue_handler.set_name(name="basic")
-    basic_log_queue_handler.setFormatter(fmt=basic_log_formatter)
+    log_listener = BatchQueueListener(
+        log_queue,
+        *log_handlers,
+        batch_size=batch_size,
+        logger_filters={"root": DuplicateFilter()},
+        aggregator=LogAggregator(interval=aggregate_interval) if aggregate_interval else None,
+    )
+    for queue_handler in _add_queue_handlers(
+        log_queue=log_queue, log_level=log_level, queue_handler_class=_InProcessQueueHandler
+    ):
+        if isinstance(queue_handler, _InProcessQueueHandler):
+            queue_handler.listener = log_listener
 
-    basic_logger = logging.getLogger("basic")
-    basic_logger.setLevel(level=log_level)
-    basic_logger.addHandler(hdlr=basic_log_queue_handler)
+    log_listener.start()
+    return log_listener
 
-    root_log_queue_handler = QueueHandler(queue=log_queue)
-    root_log_queue_handler.set_name(name="root")
-    root_log_queue_handler.setFormatter(fmt=root_log_formatter)
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level=log_level)
-    root_logger.addHandler(hdlr=root_log_queue_handler)
-    root_logger.addFilter(filter=DuplicateFilter())
+def get_log_queue() -> Optional[Queue]:
+    """
+    Queue of the root logger set up by setup_logging(), to be passed to child processes
 
-    root_logger.propagate = False
-    basic_logger.propagate = False
+    Returns:
+        Queue: Log queue, None if setup_logging() was not called
+    """
+    for handler in reversed(logging.getLogger().handlers):
+        if not isinstance(handler, QueueHandler) or handler.get_name() != "root":
+            continue
+        if isinstance(handler.queue, queues.Queue):
+            return handler.queue
+        if isinstance(handler, _InProcessQueueHandler) and handler.listener:
+            return handler.listener.get_multiprocessing_queue()
+    return None
 
-    log_listener.start()
-    return log_listener
+
+def setup_worker_logging(log_queue: Queue, log_level: int = logging.INFO) -> None:
+    """
+    Setup logging of a child process to send its records to the log Queue of the parent process,
+    so they are written by the QueueListener of the parent along with the records of the parent.
+
+    Args:
+        log_queue (Queue): Queue returned by get_log_queue() in the parent process
+        log_level (int): log level
+    """
+    for logger_name in (None, "basic"):
+        logger = logging.getLogger(logger_name)
+        for handler in list(logger.handlers):
+            logger.removeHandler(hdlr=handler)
+    _add_queue_handlers(log_queue=log_queue, log_level=log_level)
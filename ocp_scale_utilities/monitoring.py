@@ -1,6 +1,17 @@
 from __future__ import annotations
 
+import json
 import logging
+import math
+import os
+import re
+import statistics
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+from urllib.parse import urlencode
 
 from ocp_resources.resource import Resource
 from ocp_utilities.monitoring import Prometheus
@@ -10,36 +21,235 @@ from ocp_scale_utilities.constants import TIMEOUT_5MIN, TIMEOUT_30SEC
 
 LOGGER = logging.getLogger(__name__)
 
+# Seconds between samples of live sampling and of range queries
+SAMPLE_INTERVAL = 5
+# Samples the rate must be steady over to be settled
+SETTLE_WINDOW = 6
+# Points per series of collected range queries, the step grows with the collected duration
+COLLECT_MAX_POINTS = 1000
+COLLECT_INDEX_FILE = "index.json"
 
-class MonitorResourceAPIServerRequests:
+DEFAULT_COLLECT_QUERIES = {
+    "apiserver-request-latency-p99": (
+        "histogram_quantile(0.99, sum by (le, verb) "
+        '(rate(apiserver_request_duration_seconds_bucket{verb!~"WATCH|CONNECT"}[5m])))'
+    ),
+    "apiserver-request-rate": "sum by (code) (rate(apiserver_request_total[5m]))",
+    "etcd-request-latency-p99": (
+        "histogram_quantile(0.99, sum by (le, operation) (rate(etcd_request_duration_seconds_bucket[5m])))"
+    ),
+    "etcd-wal-fsync-p99": (
+        "histogram_quantile(0.99, sum by (le, instance) (rate(etcd_disk_wal_fsync_duration_seconds_bucket[5m])))"
+    ),
+    "kubelet-pod-start-latency-p99": (
+        "histogram_quantile(0.99, sum by (le) (rate(kubelet_pod_start_sli_duration_seconds_bucket[5m])))"
+    ),
+    "kubelet-running-pods": "sum(kubelet_running_pods)",
+    "resource-counts": "max by (resource) (apiserver_storage_objects)",
+}
+
+
+def query_range(
+    prometheus: Prometheus, query: str, start: float, end: float, step: float = SAMPLE_INTERVAL
+) -> list[dict[str, Any]]:
+    """
+    Run a prometheus range query, one round trip for the whole history of query between start and end
+
+    Args:
+        prometheus (Prometheus): Prometheus object from ocp_utilities
+        query (str): prometheus query string
+        start (float): Start timestamp
+        end (float): End timestamp
+        step (float): Seconds between samples
+
+    Returns:
+        list: Series of the result, each with "metric" labels and [timestamp, value] "values"
+
+    Raises:
+        ValueError: If the query did not succeed
+    """
+    response = prometheus._get_response(
+        query=f"{prometheus.api_v1}/query_range?{urlencode({'query': query, 'start': start, 'end': end, 'step': step})}"
+    )
+    if response.get("status") != "success":
+        raise ValueError(f"Range query {query!r} failed: {response}")
+    return response.get("data", {}).get("result", [])
+
+
+def get_range_step(start: float, end: float, max_points: int = COLLECT_MAX_POINTS) -> int:
+    """
+    Step in seconds of a range query from start to end returning at most max_points per series,
+    never below SAMPLE_INTERVAL
+    """
+    return max(SAMPLE_INTERVAL, math.ceil((end - start) / max_points))
+
+
+class PrometheusDataCollector:
     def __init__(
         self,
         prometheus: Prometheus,
-        resource_class: type[Resource],
-        idle_requests_value: float,
+        output_dir: str,
+        queries: Optional[dict[str, str]] = None,
+        max_points: int = COLLECT_MAX_POINTS,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Collect range queries concurrently, storing each series as compact arrays of float64
+
+        Every collect() writes a directory named after its id under output_dir, holding one {name}.bin file per query
+        with the timestamps then the values of each series, and an index.json of queries, steps and series labels.
+
+        Args:
+            prometheus (Prometheus): Prometheus object from ocp_utilities
+            output_dir (str): Directory to write collected data in
+            queries (dict, optional): PromQL query per name, defaults to DEFAULT_COLLECT_QUERIES
+            max_points (int, optional): Points per series, the step grows with the collected duration
+            max_workers (int, optional): Queries running at once, defaults to all queries
+        """
+        self.prometheus = prometheus
+        self.output_dir = output_dir
+        self.queries = queries or DEFAULT_COLLECT_QUERIES
+        self.max_points = max_points
+        self.max_workers = max_workers or len(self.queries)
+
+    def _write_series(self, path: str, series: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        index = []
+        with open(path, "wb") as fd:
+            for serie in series:
+                array("d", (float(timestamp) for timestamp, _ in serie["values"])).tofile(fd)
+                array("d", (float(value) for _, value in serie["values"])).tofile(fd)
+                index.append({"metric": serie["metric"], "length": len(serie["values"])})
+        return index
+
+    def collect(self, id: str, start_time: float, end_time: Optional[float] = None) -> dict[str, Any]:
+        """
+        Run all queries as parallel range queries from start_time to end_time, and write their results
+
+        Args:
+            id (str): Name of the directory to write the results in
+            start_time (float): Beginning time to collect data from
+            end_time (float, optional): End time to collect data to, defaults to now
+
+        Returns:
+            dict: Index written, with "start", "end", "step" and per query name its "query" and "series" labels,
+                queries that failed are logged and left out
+        """
+        end_time = end_time or time.time()
+        step = get_range_step(start=start_time, end=end_time, max_points=self.max_points)
+        directory = os.path.join(self.output_dir, id)
+        os.makedirs(directory, exist_ok=True)
+
+        index: dict[str, Any] = {"start": start_time, "end": end_time, "step": step, "queries": {}}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                name: executor.submit(
+                    query_range, prometheus=self.prometheus, query=query, start=start_time, end=end_time, step=step
+                )
+                for name, query in self.queries.items()
+            }
+            for name, future in futures.items():
+                try:
+                    series = future.result()
+                except Exception as exp:
+                    LOGGER.warning(f"{id}: Failed to collect {name}: {exp}")
+                    continue
+                index["queries"][name] = {
+                    "query": self.queries[name],
+                    "series": self._write_series(path=os.path.join(directory, f"{name}.bin"), series=series),
+                }
+
+        with open(os.path.join(directory, COLLECT_INDEX_FILE), "w") as fd:
+            json.dump(index, fd, indent=2)
+        LOGGER.info(f"{id}: Collected {len(index['queries'])}/{len(self.queries)} queries in {directory}")
+        return index
+
+
+def load_collected_data(directory: str) -> dict[str, list[dict[str, Any]]]:
+    """
+    Read the data written by PrometheusDataCollector.collect()
+
+    Args:
+        directory (str): Directory of a single collect() call
+
+    Returns:
+        dict: Per query name, its series with "metric" labels, "timestamps" and "values" arrays
+    """
+    with open(os.path.join(directory, COLLECT_INDEX_FILE)) as fd:
+        index = json.load(fd)
+
+    data: dict[str, list[dict[str, Any]]] = {}
+    for name, query in index["queries"].items():
+        data[name] = []
+        with open(os.path.join(directory, f"{name}.bin"), "rb") as fd:
+            for serie in query["series"]:
+                timestamps, values = array("d"), array("d")
+                timestamps.fromfile(fd, serie["length"])
+                values.fromfile(fd, serie["length"])
+                data[name].append({"metric": serie["metric"], "timestamps": timestamps, "values": values})
+    return data
+
+
+def _get_resource_plural(resource_class: type[Resource]) -> str:
+    return f"{resource_class.kind.lower()}s"
+
+
+def _get_label_matcher(label: str, values: list[str]) -> str:
+    """
+    PromQL label matcher of a single value, or a regex union of values
+    """
+    if len(values) == 1:
+        return f'{label}="{values[0]}"'
+    union = "|".join(re.escape(value).replace("\\", "\\\\") for value in sorted(set(values)))
+    return f'{label}=~"{union}"'
+
+
+class MonitorResourcesAPIServerRequests:
+    def __init__(
+        self,
+        prometheus: Prometheus,
+        idle_requests_values: dict[type[Resource], float],
         time_duration_seconds: int = TIMEOUT_5MIN,
+        idle_window_seconds: int = TIMEOUT_30SEC,
     ):
         """
-        Monitor API Server Requests for a particular Resource
+        Monitor API Server Requests for multiple Resources with a single query,
+        the cluster is 'idle' once the requests of every Resource are below the value of the Resource
 
         Args:
             prometheus (Prometheus): Prometheus object from ocp_utilities
-            resource_class (Resource): Resource class to monitor
+            idle_requests_values (dict): Minimum value indicating an 'idle' state per Resource class to monitor
             time_duration_seconds (int, optional): Time duration to use with prometheus query
-            idle_requests_value (float, optional): Minimum value indicating an 'idle' state
+            idle_window_seconds (int, optional): Recent history to find quiet with a single range query,
+                before falling back to live sampling
         """
         self.prometheus = prometheus
-        self.resource_class = resource_class
+        self.idle_requests_values = {
+            _get_resource_plural(resource_class=resource_class): idle_requests_value
+            for resource_class, idle_requests_value in idle_requests_values.items()
+        }
         self.time_duration_seconds = time_duration_seconds
-        self.idle_requests_value = idle_requests_value
+        self.idle_window_seconds = idle_window_seconds
+        # Rise over the settle window and standard deviation accepted as noise, per resource
+        self.settle_tolerances = dict(self.idle_requests_values)
+        self.baseline: dict[str, dict[str, float]] = {}
 
+        groups = [resource_class.api_group or "" for resource_class in idle_requests_values]
         self.apiserver_requests_query = (
             "sum by (resource) (rate(apiserver_request_total{"
-            f'group="{self.resource_class.api_group}",'
-            f'resource="{self.resource_class.kind.lower()}s"'
+            f"{_get_label_matcher(label='group', values=groups)},"
+            f"{_get_label_matcher(label='resource', values=list(self.idle_requests_values))}"
             f"}}[{self.time_duration_seconds}s]))"
         )
 
+    def _is_idle(self, values: dict[str, float]) -> bool:
+        """
+        Whether requests of every Resource are below their idle value, Resources without requests being idle
+        """
+        return all(values.get(resource, 0.0) < value for resource, value in self.idle_requests_values.items())
+
+    def _sample_values(self, sample: list[dict[str, Any]]) -> dict[str, float]:
+        return {series["metric"].get("resource", ""): float(series["value"][1]) for series in sample}
+
     def _initial_wait(self) -> None:
         """
         The initial state is unknown, and will be unknown, it cannot be guaranteed.
@@ -50,15 +260,14 @@ class MonitorResourceAPIServerRequests:
         initial_noise_count = 0
         sampler = TimeoutSampler(
             wait_timeout=TIMEOUT_30SEC,
-            sleep=5,
+            sleep=SAMPLE_INTERVAL,
             func=self.prometheus.query_sampler,
             query=self.apiserver_requests_query,
         )
         try:
             for sample in sampler:
                 if sample:
-                    value = float(sample[0]["value"][1])
-                    if value < self.idle_requests_value:
+                    if self._is_idle(values=self._sample_values(sample=sample)):
                         initial_noise_count = 0
                         initial_silence_count += 1
                     else:
@@ -70,26 +279,210 @@ class MonitorResourceAPIServerRequests:
         except TimeoutExpiredError:
             pass
 
+    def _get_recent_idle_states(self) -> Optional[list[bool]]:
+        """
+        Whether the cluster was idle at each step of the last idle_window_seconds, from a single range query
+
+        Returns:
+            list: Idle state per step in time order, None if the history could not be queried
+        """
+        end = time.time()
+        try:
+            result = query_range(
+                prometheus=self.prometheus,
+                query=self.apiserver_requests_query,
+                start=end - self.idle_window_seconds,
+                end=end,
+            )
+        except Exception as exp:
+            LOGGER.warning(f"Failed to query history of {self.apiserver_requests_query!r}: {exp}")
+            return None
+
+        steps: dict[float, dict[str, float]] = {}
+        for series in result:
+            for timestamp, value in series["values"]:
+                steps.setdefault(float(timestamp), {})[series["metric"].get("resource", "")] = float(value)
+        return [self._is_idle(values=steps[timestamp]) for timestamp in sorted(steps)]
+
+    def calibrate(
+        self, calibration_seconds: int = TIMEOUT_5MIN, sigmas: float = 3.0, min_margin: float = 0.1
+    ) -> dict[str, dict[str, float]]:
+        """
+        Learn the baseline of every Resource from the last calibration_seconds with a single range query,
+        to be called before the run while the cluster is at rest.
+        Idle values become the baseline mean plus sigmas standard deviations,
+        and settle tolerances the larger of sigmas standard deviations and min_margin.
+
+        Args:
+            calibration_seconds (int): Seconds of history to learn the baseline from
+            sigmas (float): Standard deviations above the baseline mean still considered idle
+            min_margin (float): Minimum requests per second above the baseline mean still considered idle
+
+        Returns:
+            dict: Baseline "mean", "stdev", "idle_value" and "tolerance" per resource
+
+        Raises:
+            ValueError: If the history could not be queried
+        """
+        end = time.time()
+        result = query_range(
+            prometheus=self.prometheus, query=self.apiserver_requests_query, start=end - calibration_seconds, end=end
+        )
+        series_values = {
+            series["metric"].get("resource", ""): [float(value) for _, value in series["values"]] for series in result
+        }
+        for resource in self.idle_requests_values:
+            values = series_values.get(resource) or [0.0]
+            mean = statistics.fmean(values)
+            tolerance = max(sigmas * statistics.pstdev(values), min_margin)
+            self.idle_requests_values[resource] = mean + tolerance
+            self.settle_tolerances[resource] = tolerance
+            self.baseline[resource] = {
+                "mean": mean,
+                "stdev": statistics.pstdev(values),
+                "idle_value": mean + tolerance,
+                "tolerance": tolerance,
+            }
+        LOGGER.info(f"Calibrated {self.apiserver_requests_query!r} over {calibration_seconds}s: {self.baseline}")
+        return self.baseline
+
+    def _is_settled(self, resource: str, ewma: float, window_values: deque[float]) -> bool:
+        """
+        Whether the EWMA of a Resource is idle, and its rate neither rising nor fluctuating beyond its tolerance
+        """
+        tolerance = self.settle_tolerances[resource]
+        slope = (
+            statistics.linear_regression(range(len(window_values)), window_values).slope
+            if len(window_values) > 1
+            else 0.0
+        )
+        return (
+            ewma < self.idle_requests_values[resource]
+            and slope * len(window_values) <= tolerance
+            and statistics.pstdev(window_values) <= tolerance
+        )
+
+    def wait_for_settle(
+        self, alpha: float = 0.3, window: int = SETTLE_WINDOW, timeout: Optional[int] = None
+    ) -> dict[str, Any]:
+        """
+        Wait for every Resource to settle, judged on the rate series and not a single sample:
+        the EWMA of the rate is below the idle value, and over the last window samples
+        the rate does not rise by more than the tolerance and its standard deviation stays within it.
+        Use calibrate() first to learn the idle values and tolerances of the cluster.
+
+        Args:
+            alpha (float): EWMA smoothing factor, higher reacts faster to recent samples
+            window (int): Samples the rate must be steady over
+            timeout (int, optional): Seconds to wait, twice time_duration_seconds by default
+
+        Returns:
+            dict: "settle_seconds" measured, number of "samples" and last "ewma" per resource
+
+        Raises:
+            TimeoutExpiredError: If the Resources did not settle within timeout
+        """
+        start_time = time.monotonic()
+        ewma: dict[str, float] = {}
+        window_values: dict[str, deque[float]] = {
+            resource: deque(maxlen=window) for resource in self.idle_requests_values
+        }
+        samples = 0
+        sampler = TimeoutSampler(
+            wait_timeout=timeout or self.time_duration_seconds * 2,
+            sleep=SAMPLE_INTERVAL,
+            func=self.prometheus.query_sampler,
+            query=self.apiserver_requests_query,
+        )
+        try:
+            for sample in sampler:
+                if not sample:
+                    continue
+                values = self._sample_values(sample=sample)
+                for resource in self.idle_requests_values:
+                    value = values.get(resource, 0.0)
+                    ewma[resource] = alpha * value + (1 - alpha) * ewma.get(resource, value)
+                    window_values[resource].append(value)
+                samples += 1
+                if samples >= window and all(
+                    self._is_settled(resource=resource, ewma=ewma[resource], window_values=window_values[resource])
+                    for resource in self.idle_requests_values
+                ):
+                    break
+        except TimeoutExpiredError:
+            LOGGER.error(
+                f"EWMA: {ewma} of {self.apiserver_requests_query!r} did not settle below: {self.idle_requests_values}"
+            )
+            raise
+
+        settle_seconds = time.monotonic() - start_time
+        LOGGER.info(f"{self.apiserver_requests_query!r} settled after {settle_seconds:.1f}s")
+        return {"settle_seconds": settle_seconds, "samples": samples, "ewma": ewma}
+
     def wait_for_idle(self) -> None:
         """
-        Wait for 'idle' cluster state based on provided Resource
+        Wait for 'idle' cluster state based on provided Resources
+
+        The last idle_window_seconds are first checked with a single range query:
+        a window quiet throughout returns immediately,
+        recent noise skips the initial wait and waits for idle with live sampling,
+        otherwise the initial wait samples live whether the cluster stays silent or becomes noisy.
         """
-        self._initial_wait()
+        idle_states = self._get_recent_idle_states()
+        expected_samples = self.idle_window_seconds // SAMPLE_INTERVAL
+        if idle_states and len(idle_states) >= expected_samples and all(idle_states):
+            LOGGER.info(f"{self.apiserver_requests_query!r} was idle over the last {self.idle_window_seconds}s")
+            return
+        if not idle_states or all(idle_states[-3:]):
+            self._initial_wait()
 
         sampler = TimeoutSampler(
             wait_timeout=self.time_duration_seconds * 2,
-            sleep=5,
+            sleep=SAMPLE_INTERVAL,
             func=self.prometheus.query_sampler,
             query=self.apiserver_requests_query,
         )
         sample = None
         try:
             for sample in sampler:
-                if sample and float(sample[0]["value"][1]) < self.idle_requests_value:
+                if sample and self._is_idle(values=self._sample_values(sample=sample)):
                     return
         except TimeoutExpiredError:
             LOGGER.error(
                 f"Metric value: {sample} of {self.apiserver_requests_query!r} "
-                f"is not below minimum: {self.idle_requests_value}"
+                f"is not below minimum: {self.idle_requests_values}"
             )
             raise
+
+
+class MonitorResourceAPIServerRequests(MonitorResourcesAPIServerRequests):
+    def __init__(
+        self,
+        prometheus: Prometheus,
+        resource_class: type[Resource],
+        idle_requests_value: float,
+        time_duration_seconds: int = TIMEOUT_5MIN,
+        idle_window_seconds: int = TIMEOUT_30SEC,
+    ):
+        """
+        Monitor API Server Requests for a particular Resource
+
+        Args:
+            prometheus (Prometheus): Prometheus object from ocp_utilities
+            resource_class (Resource): Resource class to monitor
+            time_duration_seconds (int, optional): Time duration to use with prometheus query
+            idle_requests_value (float, optional): Minimum value indicating an 'idle' state
+            idle_window_seconds (int, optional): Recent history to find quiet with a single range query,
+                before falling back to live sampling
+        """
+        super().__init__(
+            prometheus=prometheus,
+            idle_requests_values={resource_class: idle_requests_value},
+            time_duration_seconds=time_duration_seconds,
+            idle_window_seconds=idle_window_seconds,
+        )
+        self.resource_class = resource_class
+
+    @property
+    def idle_requests_value(self) -> float:
+        return self.idle_requests_values[_get_resource_plural(resource_class=self.resource_class)]
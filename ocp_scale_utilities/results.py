@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from array import array
+from typing import Any, Optional, Sequence
+
+from ocp_resources.resource import Resource
+
+from ocp_scale_utilities.timing import LIFECYCLE_EVENTS, PHASES, ResourceTimings
+
+LOGGER = logging.getLogger(__name__)
+
+# Statements written by the writer thread in one transaction at most
+WRITE_BATCH_SIZE = 1000
+
+_EVENT_COLUMNS = tuple(event.replace("-", "_") for event in LIFECYCLE_EVENTS)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    created REAL NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_name_created ON runs (name, created);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id TEXT NOT NULL REFERENCES runs (id),
+    phase TEXT NOT NULL,
+    start REAL NOT NULL,
+    stop REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS phases_run_id ON phases (run_id);
+CREATE TABLE IF NOT EXISTS resources (
+    run_id TEXT NOT NULL REFERENCES runs (id),
+    position INTEGER NOT NULL,
+    kind TEXT,
+    name TEXT,
+    namespace TEXT,
+    {", ".join(f"{column} REAL" for column in _EVENT_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS resources_run_id ON resources (run_id, position);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL REFERENCES runs (id),
+    collect_id TEXT NOT NULL,
+    query TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    timestamps BLOB NOT NULL,
+    "values" BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metrics_run_id ON metrics (run_id, collect_id, query);
+"""
+
+
+class ResultsStore:
+    def __init__(self, path: str, batch_size: int = WRITE_BATCH_SIZE):
+        """
+        Results of scale runs appended to an indexed SQLite file: run metadata,
+        per-phase and per-resource timings, and collected metric series.
+
+        Writes are queued and executed by a writer thread in batched transactions,
+        reads flush pending writes first.
+
+        Args:
+            path (str): SQLite file
+            batch_size (int, optional): Statements written in one transaction at most
+        """
+        self.path = path
+        self.batch_size = batch_size
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+        connection.close()
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write, name="results-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=60)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    @staticmethod
+    def _commit(connection: sqlite3.Connection, writes: list[tuple[str, list[tuple[Any, ...]]]]) -> None:
+        """
+        Execute writes in one transaction, logging the statements that fail
+        """
+        with connection:
+            for statement, rows in writes:
+                try:
+                    connection.executemany(statement, rows)
+                except sqlite3.Error as exp:
+                    LOGGER.error(f"Failed to store results: {exp}")
+
+    def _write(self) -> None:
+        connection = self._connect()
+        stop = False
+        while not stop:
+            items = [self._queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is None for item in items)
+            flushed = [item for item in items if isinstance(item, threading.Event)]
+            try:
+                self._commit(connection=connection, writes=[item for item in items if isinstance(item, tuple)])
+            except sqlite3.Error as exp:
+                # eg: database is locked, the writer keeps going with the next batch
+                LOGGER.error(f"Failed to commit results: {exp}")
+                if connection.in_transaction:
+                    connection.rollback()
+            finally:
+                for event in flushed:
+                    event.set()
+        connection.close()
+
+    def _put(self, statement: str, rows: list[tuple[Any, ...]]) -> None:
+        if not self._writer.is_alive():
+            raise ValueError(f"Results store {self.path} is closed")
+        if rows:
+            self._queue.put((statement, rows))
+
+    def flush(self) -> None:
+        """
+        Wait for all queued writes to be committed, writes were all committed once the store is closed
+        """
+        if not self._writer.is_alive():
+            return
+        event = threading.Event()
+        self._queue.put(event)
+        event.wait()
+
+    def close(self) -> None:
+        """
+        Commit queued writes and stop the writer thread
+        """
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    def __enter__(self) -> ResultsStore:
+        return self
+
+    def __exit__(self, *exc_arguments: Any) -> None:
+        self.close()
+
+    def start_run(self, name: str, metadata: Optional[dict[str, Any]] = None) -> str:
+        """
+        Append a run
+
+        Args:
+            name (str): Name of the scenario, runs of the same name are compared with each other
+            metadata (dict, optional): JSON serializable details of the run, eg: build, cluster version
+
+        Returns:
+            str: Id of the run
+        """
+        run_id = uuid.uuid4().hex
+        self._put(
+            statement="INSERT INTO runs (id, name, created, metadata) VALUES (?, ?, ?, ?)",
+            rows=[(run_id, name, time.time(), json.dumps(metadata or {}))],
+        )
+        return run_id
+
+    def record_phase(self, run_id: str, phase: str, start: float, stop: float, count: int) -> None:
+        """
+        Record the wall clock time of a phase of a run, eg: the deploy of all resources
+        """
+        self._put(
+            statement="INSERT INTO phases (run_id, phase, start, stop, count) VALUES (?, ?, ?, ?, ?)",
+            rows=[(run_id, phase, start, stop, count)],
+        )
+
+    def record_timings(self, run_id: str, resources: Sequence[Resource], timings: ResourceTimings) -> None:
+        """
+        Record lifecycle timestamps of every resource of a run
+
+        Args:
+            run_id (str): Id of the run
+            resources (Sequence): Resources, indexed like timings
+            timings (ResourceTimings): Lifecycle timestamps of resources
+        """
+        self._put(
+            statement=(
+                f"INSERT INTO resources (run_id, position, kind, name, namespace, {', '.join(_EVENT_COLUMNS)}) "
+                f"VALUES (?, ?, ?, ?, ?, {', '.join('?' * len(_EVENT_COLUMNS))})"
+            ),
+            rows=[
+                (
+                    run_id,
+                    index,
+                    resource.kind,
+                    resource.name,
+                    getattr(resource, "namespace", None),
+                    *(
+                        None if math.isnan(timings.timestamps[event][index]) else timings.timestamps[event][index]
+                        for event in LIFECYCLE_EVENTS
+                    ),
+                )
+                for index, resource in enumerate(resources)
+            ],
+        )
+
+    def record_metrics(self, run_id: str, collect_id: str, data: dict[str, list[dict[str, Any]]]) -> None:
+        """
+        Record collected metric series of a run, as read by load_collected_data()
+
+        Args:
+            run_id (str): Id of the run
+            collect_id (str): Where the data was collected, eg: "post-enter"
+            data (dict): Per query name, its series with "metric" labels, "timestamps" and "values" arrays
+        """
+        self._put(
+            statement=(
+                'INSERT INTO metrics (run_id, collect_id, query, metric, timestamps, "values") '
+                "VALUES (?, ?, ?, ?, ?, ?)"
+            ),
+            rows=[
+                (
+                    run_id,
+                    collect_id,
+                    name,
+                    json.dumps(serie["metric"], sort_keys=True),
+                    array("d", serie["timestamps"]).tobytes(),
+                    array("d", serie["values"]).tobytes(),
+                )
+                for name, series in data.items()
+                for serie in series
+            ],
+        )
+
+    def runs(self, name: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Runs from oldest to newest
+
+        Args:
+            name (str, optional): Only runs of this name
+
+        Returns:
+            list: "id", "name", "created" and "metadata" of each run
+        """
+        self.flush()
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT * FROM runs WHERE ? IS NULL OR name = ? ORDER BY created", (name, name)
+            ).fetchall()
+        connection.close()
+        return [{**dict(row), "metadata": json.loads(row["metadata"])} for row in rows]
+
+    def timings(self, run_id: str) -> ResourceTimings:
+        """
+        Lifecycle timestamps of the resources of a run
+        """
+        self.flush()
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(_EVENT_COLUMNS)} FROM resources WHERE run_id = ? ORDER BY position", (run_id,)
+            ).fetchall()
+        connection.close()
+        timings = ResourceTimings(count=len(rows))
+        for index, row in enumerate(rows):
+            for event, column in zip(LIFECYCLE_EVENTS, _EVENT_COLUMNS):
+                if row[column] is not None:
+                    timings.record(event=event, index=index, timestamp=row[column])
+        return timings
+
+    def metrics(self, run_id: str, collect_id: str) -> dict[str, list[dict[str, Any]]]:
+        """
+        Collected metric series of a run, in the format of load_collected_data()
+        """
+        self.flush()
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT * FROM metrics WHERE run_id = ? AND collect_id = ? ORDER BY rowid", (run_id, collect_id)
+            ).fetchall()
+        connection.close()
+        data: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            timestamps, values = array("d"), array("d")
+            timestamps.frombytes(row["timestamps"])
+            values.frombytes(row["values"])
+            data.setdefault(row["query"], []).append({
+                "metric": json.loads(row["metric"]),
+                "timestamps": timestamps,
+                "values": values,
+            })
+        return data
+
+    def compare(
+        self, run_id: str, baseline_run_id: str, phases: Optional[tuple[str, ...]] = None
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Compare latency percentiles of each phase of a run against a baseline run
+
+        Args:
+            run_id (str): Id of the run
+            baseline_run_id (str): Id of the baseline run
+            phases (tuple, optional): Phases to compare, defaults to all PHASES
+
+        Returns:
+            dict: {phase: {percentile: {"run", "baseline", "change"}}}, change being relative to the baseline,
+                eg: 0.18 for 18% slower, for phases recorded in both runs
+        """
+        run_timings = self.timings(run_id=run_id)
+        baseline_timings = self.timings(run_id=baseline_run_id)
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        for phase in phases or tuple(PHASES):
+            run_latency = run_timings.percentiles(phase=phase)
+            baseline_latency = baseline_timings.percentiles(phase=phase)
+            if not run_latency or not baseline_latency:
+                continue
+            result[phase] = {
+                key: {
+                    "run": run_latency[key],
+                    "baseline": baseline_latency[key],
+                    "change": (run_latency[key] - baseline_latency[key]) / baseline_latency[key]
+                    if baseline_latency[key]
+                    else math.inf,
+                }
+                for key in run_latency
+                if key != "count"
+            }
+        return result
+
+    def regressions(self, run_id: str, baseline_run_id: Optional[str] = None, threshold: float = 0.1) -> list[str]:
+        """
+        Latency percentiles of a run slower than a baseline run by more than threshold
+
+        Args:
+            run_id (str): Id of the run
+            baseline_run_id (str, optional): Id of the baseline run, defaults to the previous run of the same name
+            threshold (float, optional): Relative change to report, eg: 0.1 for 10%
+
+        Returns:
+            list: Description of each regression, eg: "p99 deploy latency regressed 18%"
+        """
+        if not baseline_run_id:
+            runs = [run["id"] for run in self.runs(name=self._run_name(run_id=run_id))]
+            if runs.index(run_id) == 0:
+                LOGGER.info(f"No baseline for run {run_id}")
+                return []
+            baseline_run_id = runs[runs.index(run_id) - 1]
+
+        return [
+            f"{key} {phase} latency regressed {values['change']:.0%}"
+            for phase, percentiles in self.compare(run_id=run_id, baseline_run_id=baseline_run_id).items()
+            for key, values in percentiles.items()
+            if values["change"] > threshold
+        ]
+
+    def _run_name(self, run_id: str) -> str:
+        self.flush()
+        with self._connect() as connection:
+            row = connection.execute("SELECT name FROM runs WHERE id = ?", (run_id,)).fetchone()
+        connection.close()
+        if not row:
+            raise ValueError(f"Unknown run {run_id}")
+        return row["name"]
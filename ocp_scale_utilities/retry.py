@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import ConflictError
+
+LOGGER = logging.getLogger(__name__)
+
+# Too Many Requests, returned by API Priority and Fairness, and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def get_retry_after(exception: BaseException) -> Optional[float]:
+    """
+    Seconds to wait from the Retry-After header of an API error, as seconds or an HTTP date
+
+    Returns:
+        float: Seconds to wait, None if the header is missing or invalid
+    """
+    retry_after = (getattr(exception, "headers", None) or {}).get("Retry-After")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(tz=timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        retryable_statuses: frozenset[int] = RETRYABLE_STATUSES,
+    ):
+        """
+        Retry of API calls failing with a retryable status, with jittered exponential backoff
+
+        Args:
+            max_retries (int): Number of retries per call, after the first attempt
+            base_delay (float): Backoff ceiling in seconds of the first retry, doubled on each retry
+            max_delay (float): Backoff ceiling in seconds, also capping Retry-After of failed calls
+            retryable_statuses (frozenset): HTTP statuses to retry on
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_statuses = retryable_statuses
+
+    def is_retryable(self, exception: BaseException) -> bool:
+        return isinstance(exception, ApiException) and exception.status in self.retryable_statuses
+
+    def get_delay(self, attempt: int, exception: Optional[BaseException] = None) -> float:
+        """
+        Seconds to wait before retry number attempt + 1
+
+        Retry-After of the failed call is honored when present, up to max_delay,
+        otherwise a random delay up to the exponential backoff ceiling is used (full jitter),
+        so throttled threads do not retry in lockstep.
+        """
+        retry_after = get_retry_after(exception=exception) if exception else None
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def get_retry_delay(
+    exception: BaseException, attempt: int, retry_policy: Optional[RetryPolicy], description: str = ""
+) -> Optional[float]:
+    """
+    Seconds to wait before retrying a call which failed on attempt, logging the retry
+
+    Returns:
+        float: Seconds to wait, None if the call should not be retried
+    """
+    if not retry_policy or attempt >= retry_policy.max_retries or not retry_policy.is_retryable(exception):
+        return None
+    delay = retry_policy.get_delay(attempt=attempt, exception=exception)
+    LOGGER.warning(
+        f"{description} failed with status {getattr(exception, 'status', None)}, "
+        f"retry {attempt + 1}/{retry_policy.max_retries} in {delay:.1f}s"
+    )
+    return delay
+
+
+def _is_applied_create(exception: BaseException, attempt: int, create: bool, description: str) -> bool:
+    if create and attempt and isinstance(exception, ConflictError):
+        LOGGER.info(f"{description} already done by a previous attempt")
+        return True
+    return False
+
+
+def call_with_retry(
+    func: Callable[[], Any],
+    retry_policy: Optional[RetryPolicy] = None,
+    description: str = "",
+    create: bool = False,
+) -> Any:
+    """
+    Call func, retrying according to retry_policy
+
+    Args:
+        func (Callable): API call
+        retry_policy (RetryPolicy, optional): Retry policy, func is called once if not provided
+        description (str): Description of the call to log, eg: "create Pod pod-1"
+        create (bool): func creates an object, a conflict on retry means a previous attempt created it
+
+    Returns:
+        Any: Result of func, None if a retried create found the object created by a previous attempt
+    """
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as exp:
+            if _is_applied_create(exception=exp, attempt=attempt, create=create, description=description):
+                return None
+            delay = get_retry_delay(exception=exp, attempt=attempt, retry_policy=retry_policy, description=description)
+            if delay is None:
+                raise
+        attempt += 1
+        time.sleep(delay)
+
+
+async def async_call_with_retry(
+    func: Callable[[], Awaitable[Any]],
+    retry_policy: Optional[RetryPolicy] = None,
+    description: str = "",
+    create: bool = False,
+) -> Any:
+    """
+    Await func(), retrying according to retry_policy without blocking the event loop while backing off
+
+    Args:
+        func (Callable): Returns an awaitable API call
+        retry_policy (RetryPolicy, optional): Retry policy, func is awaited once if not provided
+        description (str): Description of the call to log, eg: "create Pod pod-1"
+        create (bool): func creates an object, a conflict on retry means a previous attempt created it
+
+    Returns:
+        Any: Result of func, None if a retried create found the object created by a previous attempt
+    """
+    attempt = 0
+    while True:
+        try:
+            return await func()
+        except Exception as exp:
+            if _is_applied_create(exception=exp, attempt=attempt, create=create, description=description):
+                return None
+            delay = get_retry_delay(exception=exp, attempt=attempt, retry_policy=retry_policy, description=description)
+            if delay is None:
+                raise
+        attempt += 1
+        await asyncio.sleep(delay)
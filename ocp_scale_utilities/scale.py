@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Optional, Sequence
+
+import pytest
+from ocp_resources.resource import Resource
+
+from ocp_scale_utilities.monitoring import PrometheusDataCollector, load_collected_data
+from ocp_scale_utilities.results import ResultsStore
+from ocp_scale_utilities.timing import ResourceTimings
+
+DEPLOY_PHASES = ("deploy", "status", "ready")
+DELETE_PHASES = ("delete",)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ScaleResourcesMixin:
+    """
+    Executor, statistics, results store, pytest cache and data collection handling
+    shared by ThreadedScaleResources and AsyncScaleResources
+    """
+
+    resources: Sequence[Resource]
+    pytest_cache: Optional[pytest.Cache]
+    cache_key_prefix: Optional[str]
+    executor: Optional[Executor]
+    throughput_bucket_seconds: float
+    data_collector: Optional[PrometheusDataCollector]
+    results_store: Optional[ResultsStore]
+    run_metadata: Optional[dict[str, Any]]
+    run_id: Optional[str]
+    timings: ResourceTimings
+    _owned_executor: Optional[ThreadPoolExecutor]
+
+    def _shutdown_executor(self) -> None:
+        if self._owned_executor:
+            self._owned_executor.shutdown()
+            self.executor = self._owned_executor = None
+
+    def _start_run(self) -> None:
+        if self.results_store:
+            self.run_id = self.results_store.start_run(
+                name=self.cache_key_prefix or "scale", metadata=self.run_metadata
+            )
+
+    def _record_deploy(self, start_time: float, stop_time: float) -> None:
+        """
+        Record the deploy phase with results_store and pytest_cache
+        """
+        if self.results_store and self.run_id:
+            self.results_store.record_phase(
+                run_id=self.run_id, phase="deploy", start=start_time, stop=stop_time, count=len(self.resources)
+            )
+        if self.pytest_cache and self.cache_key_prefix:
+            self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-count", len(self.resources))
+            self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-start", start_time)
+            self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-stop", stop_time)
+            self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-elapsed", stop_time - start_time)
+            self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-statistics", self.statistics(phases=DEPLOY_PHASES))
+
+    def _record_delete(self, start_time: float, stop_time: float) -> None:
+        """
+        Record the delete phase and per-resource timings with results_store, and the delete phase with pytest_cache
+        """
+        if self.results_store and self.run_id:
+            self.results_store.record_phase(
+                run_id=self.run_id, phase="delete", start=start_time, stop=stop_time, count=len(self.resources)
+            )
+            self.results_store.record_timings(run_id=self.run_id, resources=self.resources, timings=self.timings)
+        if self.pytest_cache and self.cache_key_prefix:
+            self.pytest_cache.set(f"{self.cache_key_prefix}-delete-start", start_time)
+            self.pytest_cache.set(f"{self.cache_key_prefix}-delete-stop", stop_time)
+            self.pytest_cache.set(f"{self.cache_key_prefix}-delete-elapsed", stop_time - start_time)
+            self.pytest_cache.set(f"{self.cache_key_prefix}-delete-statistics", self.statistics(phases=DELETE_PHASES))
+
+    def _record_failed_phase(self, phase: str, start_time: float) -> None:
+        """
+        Record a phase that failed, up to the failure, and the timings recorded so far with results_store,
+        so that failed runs can be compared too
+        """
+        if self.results_store and self.run_id:
+            self.results_store.record_phase(
+                run_id=self.run_id, phase=phase, start=start_time, stop=time.time(), count=len(self.resources)
+            )
+            self.results_store.record_timings(run_id=self.run_id, resources=self.resources, timings=self.timings)
+
+    def statistics(self, phases: Optional[tuple[str, ...]] = None) -> dict[str, Any]:
+        """
+        Latency percentiles (p50, p90, p99, max) and throughput per time bucket of each lifecycle phase
+
+        Args:
+            phases (tuple, optional): Phases to include, defaults to all of deploy, status, ready and delete
+
+        Returns:
+            dict: {phase: {"latency": percentiles, "throughput": throughput}} for phases with recorded data
+        """
+        return self.timings.statistics(phases=phases, bucket_seconds=self.throughput_bucket_seconds)
+
+    def collect_data(self, id: str, start_time: float):
+        # Collect data with data_collector when provided,
+        # otherwise placeholder to be defined by child classes for any data collection required
+        #
+        # Args:
+        #    id (str): A string to be utilized to identify where the call occured
+        #    start_time (float): Beginning time to collect data from
+        if self.data_collector:
+            self.data_collector.collect(id=id, start_time=start_time)
+            if self.results_store and self.run_id:
+                self.results_store.record_metrics(
+                    run_id=self.run_id,
+                    collect_id=id,
+                    data=load_collected_data(directory=os.path.join(self.data_collector.output_dir, id)),
+                )
+            return
+        LOGGER.warning("No data collected. Provide data_collector or define collect_data() in child classes")
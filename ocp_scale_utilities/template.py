@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from functools import partial
+from typing import Any, Callable, Optional, Sequence, overload
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.resource import Resource
+
+# Arguments of the template kept by the bare resources unwinding deployed resources
+_EXIT_KWARGS = ("teardown", "delete_timeout")
+
+
+class ResourceTemplate(Sequence[Resource]):
+    def __init__(
+        self,
+        resource_class: type[Resource],
+        count: int,
+        name_pattern: str,
+        namespace: Optional[str] = None,
+        client: Optional[DynamicClient] = None,
+        **kwargs: Any,
+    ):
+        """
+        Lazy sequence of count resources built from a template, in place of a list of Resource objects.
+        Each resource is only built when a worker picks it up, with its own deep copy of kwargs,
+        and released once processed: nothing but the template is kept for the whole run.
+
+        Resources of a template can be passed to any threaded or asyncio helper and to ThreadedScaleResources,
+        which unwind the resources they deployed with bare resources holding only kind, name and namespace.
+
+        Args:
+            resource_class (type): Resource class to build, eg: VirtualMachine
+            count (int): Number of resources
+            name_pattern (str): Name of the resource at index, formatted with index, eg: "vm-{index:05d}"
+            namespace (str, optional): Namespace of namespaced resources, formatted with index
+            client (DynamicClient, optional): Client of the resources,
+                defaults to the client built for the first resource
+            **kwargs: Arguments of resource_class, eg: body, label, kind_dict with its name and namespace set
+        """
+        self.resource_class = resource_class
+        self.size = count
+        self.name_pattern = name_pattern
+        self.namespace = namespace
+        self.client = client
+        self.kwargs = kwargs
+
+    def __len__(self) -> int:
+        return self.size
+
+    @overload
+    def __getitem__(self, index: int) -> Resource: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Resource]: ...
+
+    def __getitem__(self, index: int | slice) -> Resource | list[Resource]:
+        if isinstance(index, slice):
+            return [self.build(index=_index) for _index in range(self.size)[index]]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"{self.resource_class.kind} template index {index} out of range")
+        return self.build(index=index)
+
+    def get_name(self, index: int) -> str:
+        return self.name_pattern.format(index=index)
+
+    def get_namespace(self, index: int) -> Optional[str]:
+        return self.namespace.format(index=index) if self.namespace else None
+
+    def _build(self, index: int, kwargs: dict[str, Any]) -> Resource:
+        name = self.get_name(index=index)
+        namespace = self.get_namespace(index=index)
+        if "kind_dict" in kwargs:
+            kwargs["kind_dict"].setdefault("metadata", {})["name"] = name
+            if namespace:
+                kwargs["kind_dict"]["metadata"]["namespace"] = namespace
+        if namespace:
+            kwargs["namespace"] = namespace
+
+        resource = self.resource_class(name=name, client=self.client, **kwargs)
+        # Build the client once, for all resources
+        self.client = self.client or resource.client
+        return resource
+
+    def build(self, index: int) -> Resource:
+        """
+        Build the resource at index, with its own copy of the template arguments
+        """
+        return self._build(index=index, kwargs=deepcopy(self.kwargs))
+
+    def build_handle(self, index: int) -> Resource:
+        """
+        Build the resource at index with only its name, namespace and client, enough to delete it or wait for it
+        """
+        return self._build(
+            index=index, kwargs={key: value for key, value in self.kwargs.items() if key in _EXIT_KWARGS}
+        )
+
+    def _exit(self, index: int, *exc_details: Any) -> None:
+        self.build_handle(index=index).__exit__(*exc_details)
+
+    def exit_callback(self, index: int) -> Callable[..., Any]:
+        """
+        Exit callback of the deployed resource at index, holding the index instead of the resource
+        """
+        return partial(self._exit, index)
+
+
+def get_exit_callback(resources: Sequence[Resource], index: int) -> Optional[Callable[..., Any]]:
+    """
+    Compact exit callback of the resource at index of a ResourceTemplate, None for other sequences
+
+    Args:
+        resources (Sequence): List of Resources or ResourceTemplate
+        index (int): Position of the resource
+
+    Returns:
+        Callable: Exit callback to register instead of resource.__exit__, None to register resource.__exit__
+    """
+    return resources.exit_callback(index=index) if isinstance(resources, ResourceTemplate) else None
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from contextlib import ExitStack
+from itertools import islice
+from typing import Any, Callable, Generator, Optional, Sequence
+
+from ocp_resources.resource import Resource
+
+from ocp_scale_utilities.constants import TIMEOUT_2MIN, TIMEOUT_4MIN
+from ocp_scale_utilities.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from ocp_scale_utilities.template import get_exit_callback
+from ocp_scale_utilities.threaded.checkpoint import DeployCheckpoint
+from ocp_scale_utilities.threaded.client_pool import ClientPool
+from ocp_scale_utilities.threaded.concurrency import AdaptiveConcurrencyLimiter
+from ocp_scale_utilities.threaded.pacing import Pacer
+from ocp_scale_utilities.threaded.utils import (
+    deploy_resource,
+    get_max_workers,
+    push_exit_callbacks,
+    resources_executor,
+    wait_for_resource_status,
+    wait_resource_deleted,
+)
+from ocp_scale_utilities.timing import ResourceTimings
+
+LOGGER = logging.getLogger(__name__)
+
+# (resource, result or raised exception, elapsed seconds)
+CompletedResource = tuple[Resource, Any, float]
+
+
+def _timed_call(func: Callable[[int], Any], index: int) -> tuple[Any, float]:
+    start_time = time.monotonic()
+    try:
+        result = func(index)
+    except Exception as exp:
+        result = exp
+    return result, time.monotonic() - start_time
+
+
+def threaded_as_completed(
+    resources: Sequence[Resource],
+    func: Callable[[int], Any],
+    *,
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+    client_pool: Optional[ClientPool] = None,
+) -> Generator[CompletedResource, None, None]:
+    """
+    Call func with the index of each resource via threads, yielding results in completion order.
+    At most max_in_flight calls are queued or running at once,
+    further calls are only submitted as the consumer takes results, so a slow consumer slows submission.
+    Calls not yet started are cancelled when the generator is closed early.
+
+    Args:
+        resources (list): List of Resources
+        func (Callable): Called with the index of a resource
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        max_in_flight (int, optional): Number of calls queued or running at once,
+            defaults to the connection pools of client_pool if provided, else the number of worker threads
+            from get_max_workers()
+        client_pool (ClientPool, optional): Pool of the clients func calls from, whose connection pools
+            size the default max_in_flight
+
+    Yields:
+        tuple: (resource, result or raised exception, elapsed seconds)
+    """
+    max_in_flight = max(
+        1,
+        max_in_flight
+        or get_max_workers(resources=resources, max_workers=client_pool.max_workers if client_pool else None),
+    )
+    indexes = iter(range(len(resources)))
+    in_flight: dict[Future, int] = {}
+    with resources_executor(resources=resources, executor=executor, max_workers=max_in_flight) as _executor:
+        try:
+            while True:
+                for index in islice(indexes, max_in_flight - len(in_flight)):
+                    in_flight[_executor.submit(_timed_call, func=func, index=index)] = index
+                if not in_flight:
+                    return
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result, elapsed = future.result()
+                    yield resources[in_flight.pop(future)], result, elapsed
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def threaded_deploy_resources_as_completed(
+    resources: Sequence[Resource],
+    exit_stack: Optional[ExitStack] = None,
+    *,
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    pacer: Optional[Pacer] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> Generator[CompletedResource, None, None]:
+    """
+    Deploy multiple resources via threads, yielding each resource as soon as it is deployed
+
+    Args:
+        resources (list): List of Resources
+        exit_stack (ExitStack, optional): ExitStack if desired, will enter Resources to deploy them
+            and push a single ThreadedExitCallbacks unwinding them in parallel
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        max_in_flight (int, optional): Number of deploys queued or running at once
+        timings (ResourceTimings, optional): Record create-request and create-ack times of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+        limiter (AdaptiveConcurrencyLimiter, optional): Adapt the number of concurrent deploys to apiserver feedback,
+            max_in_flight then defaults to the highest limit of limiter
+        pacer (Pacer, optional): Pace deploys with a token bucket and optional waves
+        client_pool (ClientPool, optional): Spread deploys across the clients of the pool,
+            defaults to the client of each resource
+        checkpoint (DeployCheckpoint, optional): Append each deployed resource,
+            resources it re-attached to are not deployed again
+
+    Yields:
+        tuple: (resource, deploy result or raised exception, elapsed seconds) in completion order
+    """
+    exit_callbacks = push_exit_callbacks(resources=resources, exit_stack=exit_stack, executor=executor)
+    yield from threaded_as_completed(
+        resources=resources,
+        func=lambda x: deploy_resource(
+            resource=resources[x],
+            exit_callbacks=exit_callbacks,
+            exit_callback=get_exit_callback(resources=resources, index=x),
+            timings=timings,
+            index=x,
+            retry_policy=retry_policy,
+            limiter=limiter,
+            pacer=pacer,
+            client_pool=client_pool,
+            checkpoint=checkpoint,
+        ),
+        executor=executor,
+        max_in_flight=max_in_flight or (limiter.max_limit if limiter else None),
+        client_pool=client_pool,
+    )
+
+
+def threaded_wait_for_resources_status_as_completed(
+    resources: Sequence[Resource],
+    status: str,
+    timeout: int = TIMEOUT_2MIN,
+    *,
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+    timings: Optional[ResourceTimings] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> Generator[CompletedResource, None, None]:
+    """
+    Wait for multiple resources to reach status via threads, yielding each resource as soon as it reaches status
+
+    Args:
+        resources (list): List of Resources
+        status (str): Status to wait for
+        timeout (int): Length of time for each thread to wait for resource to reach status
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        max_in_flight (int, optional): Number of waits queued or running at once
+        timings (ResourceTimings, optional): Record the time each resource reached status
+        client_pool (ClientPool, optional): Spread polls across the clients of the pool,
+            defaults to the client of each resource
+        checkpoint (DeployCheckpoint, optional): Append each resource reaching status
+
+    Yields:
+        tuple: (resource, None or raised exception eg: TimeoutExpiredError, elapsed seconds) in completion order
+    """
+    yield from threaded_as_completed(
+        resources=resources,
+        func=lambda x: wait_for_resource_status(
+            resource=resources[x],
+            status=status,
+            timeout=timeout,
+            timings=timings,
+            index=x,
+            client_pool=client_pool,
+            checkpoint=checkpoint,
+        ),
+        executor=executor,
+        max_in_flight=max_in_flight,
+        client_pool=client_pool,
+    )
+
+
+def threaded_wait_deleted_resources_as_completed(
+    resources: Sequence[Resource],
+    *,
+    timeout: int = TIMEOUT_4MIN,
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+    timings: Optional[ResourceTimings] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> Generator[CompletedResource, None, None]:
+    """
+    Call wait_deleted() for multiple resources via threads, yielding each resource as soon as it is deleted
+
+    Args:
+        resources (list): List of Resources
+        timeout (int): Length of time for each thread to wait for resource to be deleted
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        max_in_flight (int, optional): Number of waits queued or running at once
+        timings (ResourceTimings, optional): Record the time each resource was observed gone
+        client_pool (ClientPool, optional): Spread polls across the clients of the pool,
+            defaults to the client of each resource
+        checkpoint (DeployCheckpoint, optional): Append each resource observed gone
+
+    Yields:
+        tuple: (resource, True if deleted or raised exception, elapsed seconds) in completion order
+    """
+    yield from threaded_as_completed(
+        resources=resources,
+        func=lambda x: wait_resource_deleted(
+            resource=resources[x],
+            timeout=timeout,
+            timings=timings,
+            index=x,
+            client_pool=client_pool,
+            checkpoint=checkpoint,
+        ),
+        executor=executor,
+        max_in_flight=max_in_flight,
+        client_pool=client_pool,
+    )
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from functools import cache
+from typing import Any, Optional, Sequence
+
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.resource import NamespacedResource, Resource
+
+from ocp_scale_utilities.threaded.watch import list_resources
+from ocp_scale_utilities.timing import CREATE_ACK, GONE
+
+LOGGER = logging.getLogger(__name__)
+
+# Fields of a resource recorded with its create-ack, enough to list and delete it without the Resource object
+IDENTITY_FIELDS = ("kind", "api_group", "api_version", "name", "namespace")
+
+
+@cache
+def _get_handle_class(kind: str, api_group: Optional[str], api_version: Optional[str], namespaced: bool) -> type:
+    """
+    Bare Resource class of a kind, from the api_group or api_version recorded in a checkpoint
+    """
+    return type(
+        kind,
+        (NamespacedResource if namespaced else Resource,),
+        {"kind": kind, "api_group": api_group, "api_version": api_version},
+    )
+
+
+class DeployCheckpoint:
+    def __init__(self, path: str):
+        """
+        Append-only checkpoint of the resources of a deployment that were created and reached status,
+        one JSON line per event, flushed as events happen so it survives the process being killed.
+
+        Entries are keyed by the position of each resource, a run resuming from the checkpoint
+        must be given the same resources in the same order.
+        A checkpoint that already exists is loaded and appended to.
+
+        Args:
+            path (str): Path of the checkpoint file
+        """
+        self.path = path
+        # Position of each resource: identity fields and {event: time}
+        self.entries: dict[int, dict[str, Any]] = {}
+        # Positions of checkpointed resources found on the cluster by attach(), not deployed again
+        self.attached: set[int] = set()
+        self._lock = threading.Lock()
+        self.load()
+        self._file = open(self.path, "a")
+
+    def _apply(self, line: dict[str, Any]) -> None:
+        index = line["index"]
+        if line["event"] == GONE:
+            self.entries.pop(index, None)
+            return
+        if line["event"] == CREATE_ACK:
+            self.entries[index] = {**{field: line.get(field) for field in IDENTITY_FIELDS}, "events": {}}
+        if index in self.entries:
+            self.entries[index]["events"][line["event"]] = line["time"]
+
+    def load(self) -> None:
+        """
+        Load the events of an existing checkpoint, skipping a line truncated when its writer was killed
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as checkpoint_file:
+            for number, text in enumerate(checkpoint_file, start=1):
+                try:
+                    self._apply(line=json.loads(text))
+                except ValueError:
+                    LOGGER.warning(f"Skipping incomplete line {number} of checkpoint {self.path}")
+        LOGGER.info(f"Loaded {len(self.entries)} resources from checkpoint {self.path}")
+
+    def record(self, event: str, index: int, resource: Optional[Resource] = None) -> None:
+        """
+        Append a lifecycle event of the resource at index
+
+        Args:
+            event (str): Lifecycle event, eg: CREATE_ACK
+            index (int): Position of the resource
+            resource (Resource, optional): Resource whose identity is recorded with CREATE_ACK
+        """
+        line: dict[str, Any] = {"event": event, "index": index, "time": time.time()}
+        if resource is not None:
+            line.update({field: getattr(resource, field, None) for field in IDENTITY_FIELDS})
+        with self._lock:
+            self._file.write(f"{json.dumps(line)}\n")
+            self._file.flush()
+            self._apply(line=line)
+
+    def indexes(self, event: str = CREATE_ACK) -> list[int]:
+        """
+        Positions of the checkpointed resources that reached event, eg: STATUS_REACHED
+        """
+        return sorted(index for index, entry in self.entries.items() if event in entry["events"])
+
+    def attach(self, resources: Sequence[Resource]) -> list[int]:
+        """
+        Re-attach to the checkpointed resources that still exist, with one list call per kind and namespace,
+        so that only the remainder of resources is deployed
+
+        Args:
+            resources (Sequence): Resources of the run, in the order of the checkpointed run
+
+        Returns:
+            list: Positions of the resources found on the cluster, kept in attached
+        """
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for index, entry in self.entries.items():
+            if index >= len(resources):
+                continue
+            resource = resources[index]
+            if (entry["kind"], entry["name"], entry["namespace"]) != (resource.kind, resource.name, resource.namespace):
+                LOGGER.warning(f"Checkpointed {entry['kind']} {entry['name']} does not match the resource at {index}")
+                continue
+            groups.setdefault((resource.client, resource.api_version, resource.kind, resource.namespace), []).append(
+                index
+            )
+
+        attached: set[int] = set()
+        for (_, _, _, namespace), indexes in groups.items():
+            names = {self.entries[index]["name"]: index for index in indexes}
+
+            def _on_item(_item: dict[str, Any]) -> None:
+                index = names.get(_item["metadata"]["name"])
+                if index is not None:
+                    attached.add(index)
+
+            list_resources(
+                api=resources[indexes[0]].full_api(), namespace=namespace, label_selector=None, on_item=_on_item
+            )
+
+        self.attached = attached
+        LOGGER.info(
+            f"Re-attached {len(attached)} of {len(self.entries)} checkpointed resources, "
+            f"{len(resources) - len(attached)} to deploy"
+        )
+        return sorted(attached)
+
+    def get_resources(self, client: DynamicClient) -> list[Resource]:
+        """
+        Bare resources of all checkpointed resources, holding only kind, name and namespace,
+        to delete them or wait for them without the Resource objects of the checkpointed run
+
+        Args:
+            client (DynamicClient): Client of the resources
+
+        Returns:
+            list: Resources in the order of indexes()
+        """
+        resources = []
+        for index in self.indexes():
+            entry = self.entries[index]
+            resource_class = _get_handle_class(
+                kind=entry["kind"],
+                api_group=entry["api_group"],
+                api_version=entry["api_version"],
+                namespaced=entry["namespace"] is not None,
+            )
+            kwargs = {"namespace": entry["namespace"]} if entry["namespace"] is not None else {}
+            resources.append(resource_class(name=entry["name"], client=client, **kwargs))
+        return resources
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> DeployCheckpoint:
+        return self
+
+    def __exit__(self, *exc_arguments: Any) -> None:
+        self.close()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Any, Generator, Optional, Sequence
+
+import kubernetes
+from kubernetes.dynamic import DynamicClient
+from ocp_resources.resource import Resource, get_client
+
+LOGGER = logging.getLogger(__name__)
+
+ROUND_ROBIN = "round-robin"
+LEAST_LOADED = "least-loaded"
+STRATEGIES = (ROUND_ROBIN, LEAST_LOADED)
+
+
+class ClientPool:
+    def __init__(self, clients: Sequence[DynamicClient], strategy: str = ROUND_ROBIN):
+        """
+        Spread API calls of many resources across multiple clients, each with its own connection pool.
+        A client is assigned to a resource for each call, round-robin or to the client with the fewest calls in flight.
+
+        Args:
+            clients (Sequence): Clients to spread calls across
+            strategy (str, optional): ROUND_ROBIN or LEAST_LOADED
+
+        Raises:
+            ValueError: If no clients are provided or strategy is unknown
+        """
+        if not clients:
+            raise ValueError("ClientPool requires at least one client")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}, expected one of {STRATEGIES}")
+        self.clients = list(clients)
+        self.strategy = strategy
+
+        self._lock = threading.Lock()
+        self._next = 0
+        self.reset()
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Calls the clients can serve at once, the sum of the connection_pool_maxsize of each client
+        """
+        return sum(client.configuration.connection_pool_maxsize or 1 for client in self.clients)
+
+    def reset(self) -> None:
+        """
+        Restart utilization statistics
+        """
+        with self._lock:
+            self.start_time = time.monotonic()
+            self.in_flight = [0] * len(self.clients)
+            self.peak_in_flight = [0] * len(self.clients)
+            self.calls = [0] * len(self.clients)
+            self.busy_seconds = [0.0] * len(self.clients)
+
+    def _select(self) -> int:
+        if self.strategy == LEAST_LOADED:
+            return min(range(len(self.clients)), key=lambda index: (self.in_flight[index], self.calls[index]))
+        index = self._next
+        self._next = (self._next + 1) % len(self.clients)
+        return index
+
+    @contextmanager
+    def assign(self, resource: Resource) -> Generator[DynamicClient, None, None]:
+        """
+        Assign a client to resource for the duration of a call
+
+        Args:
+            resource (Resource): Resource to call, its client is replaced by the assigned client
+                and restored once the call returns, so watches keep grouping resources by their own client
+
+        Yields:
+            DynamicClient: Assigned client
+        """
+        with self._lock:
+            index = self._select()
+            self.in_flight[index] += 1
+            self.peak_in_flight[index] = max(self.peak_in_flight[index], self.in_flight[index])
+            self.calls[index] += 1
+        client = resource.client
+        resource.client = self.clients[index]
+        start_time = time.monotonic()
+        try:
+            yield self.clients[index]
+        finally:
+            resource.client = client
+            with self._lock:
+                self.in_flight[index] -= 1
+                self.busy_seconds[index] += time.monotonic() - start_time
+
+    def utilization(self) -> list[dict[str, Any]]:
+        """
+        Utilization of each client since the pool was created or reset
+
+        Returns:
+            list: Per client, its number of "calls", "busy_seconds" spent in calls, "peak_in_flight" calls,
+                and "utilization", the fraction of its connection pool busy over the elapsed time
+        """
+        with self._lock:
+            elapsed = max(time.monotonic() - self.start_time, 1e-9)
+            return [
+                {
+                    "calls": self.calls[index],
+                    "busy_seconds": self.busy_seconds[index],
+                    "peak_in_flight": self.peak_in_flight[index],
+                    "utilization": self.busy_seconds[index]
+                    / (elapsed * (client.configuration.connection_pool_maxsize or 1)),
+                }
+                for index, client in enumerate(self.clients)
+            ]
+
+
+def get_client_pool(
+    size: int,
+    max_workers: int,
+    strategy: str = ROUND_ROBIN,
+    client_configuration: Optional[kubernetes.client.Configuration] = None,
+    **client_kwargs: Any,
+) -> ClientPool:
+    """
+    Open size clients from one kubeconfig, sizing the connection pool of each to its share of max_workers
+
+    Args:
+        size (int): Number of clients
+        max_workers (int): Number of worker threads the clients serve together
+        strategy (str, optional): ROUND_ROBIN or LEAST_LOADED
+        client_configuration (Configuration, optional): Configuration copied for each client
+        **client_kwargs: Arguments of get_client() from ocp_resources, eg: config_file, context
+
+    Returns:
+        ClientPool: Pool of the clients
+    """
+    connection_pool_maxsize = math.ceil(max_workers / size)
+    clients = []
+    for _ in range(size):
+        configuration = deepcopy(client_configuration) if client_configuration else kubernetes.client.Configuration()
+        configuration.connection_pool_maxsize = connection_pool_maxsize
+        clients.append(get_client(client_configuration=configuration, **client_kwargs))
+    LOGGER.info(f"Opened {size} clients with connection pools of {connection_pool_maxsize}")
+    return ClientPool(clients=clients, strategy=strategy)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import Any, Optional, Sequence
+
+from ocp_resources.namespace import Namespace
+from ocp_resources.resource import Resource
+
+from ocp_scale_utilities.retry import RetryPolicy, call_with_retry
+from ocp_scale_utilities.threaded.watch import get_common_label_selector, get_resources_groups, list_resources
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _delete_collection(resources: Sequence[Resource]) -> bool:
+    """
+    Delete resources of one kind and namespace with a single deletecollection call
+
+    Returns:
+        bool: True if deleted, False if the resources must be deleted one by one
+    """
+    first_resource = resources[0]
+    label_selector = get_common_label_selector(resources=resources)
+    if not label_selector:
+        return False
+
+    names = {resource.name for resource in resources}
+    foreign_names: list[str] = []
+
+    def _on_item(_item: dict[str, Any]) -> None:
+        if _item["metadata"]["name"] not in names:
+            foreign_names.append(_item["metadata"]["name"])
+
+    api = first_resource.full_api()
+    list_resources(api=api, namespace=first_resource.namespace, label_selector=label_selector, on_item=_on_item)
+    if foreign_names:
+        LOGGER.info(
+            f"Label selector {label_selector!r} also selects {len(foreign_names)} other {first_resource.kind} "
+            f"in namespace {first_resource.namespace}, deleting one by one"
+        )
+        return False
+
+    LOGGER.info(
+        f"Delete {len(resources)} {first_resource.kind} in namespace {first_resource.namespace} "
+        f"with label selector {label_selector!r}"
+    )
+    api.delete(namespace=first_resource.namespace, label_selector=label_selector, serialize=False)
+    return True
+
+
+def _delete_namespace(resources: Sequence[Resource]) -> bool:
+    namespace = Namespace(name=resources[0].namespace, client=resources[0].client)
+    LOGGER.info(f"Delete namespace {namespace.name} holding {len(resources)} {resources[0].kind}")
+    return namespace.delete()
+
+
+def threaded_delete_collections(
+    resources: Sequence[Resource],
+    executor: Executor,
+    namespaces: Optional[Sequence[str]] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> list[Optional[bool]]:
+    """
+    Delete groups of resources sharing kind, namespace and labels with one call per group
+
+    Resources are grouped by client, kind and namespace.
+    Groups in one of namespaces are deleted with their namespace.
+    Other groups are deleted with deletecollection, using the labels common to the group as label selector,
+    as long as the label selector does not select any other object.
+    Groups whose call fails are left to be deleted one by one.
+
+    Args:
+        resources (list): List of Resources
+        executor (Executor): Executor to run one call per group on
+        namespaces (list, optional): Namespaces holding only scale objects, deleted as a whole
+        retry_policy (RetryPolicy, optional): Retry of calls failing with a retryable status
+
+    Returns:
+        list: Result per resource, None for resources to be deleted one by one
+    """
+    results: list[Optional[bool]] = [None] * len(resources)
+    namespace_futures: dict[tuple[Any, str], Future] = {}
+    futures: list[tuple[Future, list[int]]] = []
+    for (client, _, _, namespace), indexes in get_resources_groups(resources=resources).items():
+        group = [resources[index] for index in indexes]
+        if namespace and namespace in (namespaces or ()):
+            if (client, namespace) not in namespace_futures:
+                namespace_futures[client, namespace] = executor.submit(
+                    call_with_retry,
+                    func=partial(_delete_namespace, resources=group),
+                    retry_policy=retry_policy,
+                    description=f"Delete namespace {namespace}",
+                )
+            futures.append((namespace_futures[client, namespace], indexes))
+        elif len(group) > 1:
+            futures.append((
+                executor.submit(
+                    call_with_retry,
+                    func=partial(_delete_collection, resources=group),
+                    retry_policy=retry_policy,
+                    description=f"Delete collection of {group[0].kind} in namespace {namespace}",
+                ),
+                indexes,
+            ))
+
+    for future, indexes in futures:
+        try:
+            deleted = future.result()
+        except Exception as exp:
+            # Resources of the group are deleted one by one instead
+            LOGGER.warning(f"Failed to delete {len(indexes)} {resources[indexes[0]].kind} as a group: {exp!r}")
+            continue
+        if deleted:
+            for index in indexes:
+                results[index] = True
+    return results
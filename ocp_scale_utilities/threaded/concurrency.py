@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+
+LOGGER = logging.getLogger(__name__)
+
+# HTTP status: overload signal
+OVERLOAD_STATUSES = {429: "throttled", 503: "unavailable", 504: "timeout"}
+
+
+def get_overload_reason(exception: BaseException) -> Optional[str]:
+    """
+    Classify an API call error as an overload signal
+
+    Returns:
+        str: Reason to cut concurrency, None if the error does not indicate overload
+    """
+    if isinstance(exception, ApiException):
+        return OVERLOAD_STATUSES.get(exception.status)
+    if isinstance(exception, (TimeoutError, Urllib3TimeoutError)):
+        return "timeout"
+    return None
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        latency_spike_ratio: float = 3.0,
+        latency_smoothing: float = 0.1,
+    ):
+        """
+        Additive increase, multiplicative decrease (AIMD) limit on concurrent API calls.
+        The limit grows by one for every limit successful calls, and is multiplied by backoff_ratio
+        on 429, 503, 504 or timeout errors, and on latency spikes.
+        Only calls started after the last decrease can decrease the limit again,
+        so a burst of errors from calls in flight at the same time counts once.
+        Executors running limited calls need at least max_limit threads.
+
+        Args:
+            initial_limit (int): Initial number of concurrent calls
+            min_limit (int): Lowest number of concurrent calls
+            max_limit (int): Highest number of concurrent calls
+            backoff_ratio (float): Ratio applied to the limit on overload
+            latency_threshold (float, optional): Latency in seconds considered overload
+            latency_spike_ratio (float): Latency above this ratio of the smoothed latency is considered overload
+            latency_smoothing (float): Weight of the latest call in the smoothed latency
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_threshold = latency_threshold
+        self.latency_spike_ratio = latency_spike_ratio
+        self.latency_smoothing = latency_smoothing
+
+        self.limit = float(max(min_limit, min(max_limit, initial_limit)))
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        # (time, limit, reason) for each change of the limit
+        self.history: list[tuple[float, int, str]] = [(time.time(), int(self.limit), "initial")]
+
+        self._condition = threading.Condition()
+        self._last_decrease = 0.0
+
+    @property
+    def concurrency(self) -> int:
+        return int(self.limit)
+
+    def acquire(self) -> float:
+        """
+        Wait for a slot under the limit
+
+        Returns:
+            float: Monotonic start time of the call, to pass to release()
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def _record(self, limit: float, reason: str) -> None:
+        if int(limit) != int(self.limit):
+            self.history.append((time.time(), int(limit), reason))
+            if reason != "increase":
+                LOGGER.info(f"Concurrency limit {int(self.limit)} -> {int(limit)}: {reason}")
+        self.limit = limit
+
+    def release(self, start_time: float, overload_reason: Optional[str] = None) -> None:
+        """
+        Release the slot of a call, adjusting the limit from its outcome
+
+        Args:
+            start_time (float): Value returned by acquire()
+            overload_reason (str, optional): Reason the call failed from overload, None if it succeeded
+        """
+        now = time.monotonic()
+        latency = now - start_time
+        with self._condition:
+            self.in_flight -= 1
+            if overload_reason is None:
+                if self.latency_threshold and latency > self.latency_threshold:
+                    overload_reason = "latency"
+                elif self.latency and latency > self.latency * self.latency_spike_ratio:
+                    overload_reason = "latency spike"
+                self.latency = (
+                    latency
+                    if self.latency is None
+                    else self.latency + self.latency_smoothing * (latency - self.latency)
+                )
+
+            if overload_reason:
+                if start_time >= self._last_decrease:
+                    self._last_decrease = now
+                    self._record(limit=max(self.min_limit, self.limit * self.backoff_ratio), reason=overload_reason)
+            else:
+                self._record(limit=min(self.max_limit, self.limit + 1 / self.limit), reason="increase")
+            self._condition.notify_all()
+
+    def call(self, func: Callable[[], Any]) -> Any:
+        """
+        Call func within the limit, errors not indicating overload leave the limit unchanged
+        """
+        start_time = self.acquire()
+        try:
+            result = func()
+        except BaseException as exp:
+            overload_reason = get_overload_reason(exception=exp)
+            if overload_reason:
+                self.release(start_time=start_time, overload_reason=overload_reason)
+            else:
+                with self._condition:
+                    self.in_flight -= 1
+                    self._condition.notify_all()
+            raise
+        self.release(start_time=start_time)
+        return result
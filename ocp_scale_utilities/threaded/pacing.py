@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from array import array
+from typing import Any, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Pacer:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        wave_size: Optional[int] = None,
+        wave_settle: float = 0.0,
+    ):
+        """
+        Pace operations shared by many threads, with a token bucket and optional waves.
+        With waves, an operation of the next wave starts once all operations of the current wave were released
+        and wave_settle seconds passed.
+
+        Args:
+            rate (float, optional): Target operations per second, unlimited if not provided
+            burst (int): Operations allowed at once above rate, after being idle
+            wave_size (int, optional): Number of operations per wave
+            wave_settle (float): Seconds to wait after a wave completed before starting the next one
+        """
+        self.rate = rate
+        self.burst = burst
+        self.wave_size = wave_size
+        self.wave_settle = wave_settle
+
+        # Time each operation started
+        self.timestamps = array("d")
+
+        self._condition = threading.Condition()
+        self._tokens = float(burst)
+        self._refill_time = time.monotonic()
+        self._acquired = 0
+        self._released = 0
+        self._wave = 0
+        self._wave_start = 0.0
+
+    def _wait_for_wave(self, wave: int) -> None:
+        while True:
+            now = time.monotonic()
+            if wave <= self._wave and now >= self._wave_start:
+                return
+            self._condition.wait(timeout=self._wave_start - now if wave <= self._wave else None)
+
+    def _wait_for_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._refill_time) * (self.rate or 0))
+            self._refill_time = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            self._condition.wait(timeout=(1 - self._tokens) / (self.rate or 1))
+
+    def acquire(self) -> None:
+        """
+        Wait until the next operation may start
+        """
+        with self._condition:
+            number = self._acquired
+            self._acquired += 1
+            if self.wave_size:
+                self._wait_for_wave(wave=number // self.wave_size)
+            if self.rate:
+                self._wait_for_token()
+            self.timestamps.append(time.time())
+
+    def release(self) -> None:
+        """
+        Mark an operation as completed, starting the settle period once its wave completed
+        """
+        if not self.wave_size:
+            return
+        with self._condition:
+            self._released += 1
+            if self._released >= (self._wave + 1) * self.wave_size:
+                self._wave += 1
+                self._wave_start = time.monotonic() + self.wave_settle
+                LOGGER.info(f"Wave {self._wave} of {self.wave_size} completed, settling for {self.wave_settle}s")
+                self._condition.notify_all()
+
+    def __enter__(self) -> Pacer:
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_arguments: Any) -> None:
+        self.release()
+
+    @property
+    def achieved_rate(self) -> Optional[float]:
+        """
+        Operations started per second, from the first to the last operation
+        """
+        if len(self.timestamps) < 2 or self.timestamps[-1] <= self.timestamps[0]:
+            return None
+        return (len(self.timestamps) - 1) / (self.timestamps[-1] - self.timestamps[0])
+
+    def statistics(self) -> dict[str, Any]:
+        """
+        Achieved against target pacing
+
+        Returns:
+            dict: count, target_rate, achieved_rate, wave_size and number of waves
+        """
+        return {
+            "count": len(self.timestamps),
+            "target_rate": self.rate,
+            "achieved_rate": self.achieved_rate,
+            "wave_size": self.wave_size,
+            "waves": math.ceil(len(self.timestamps) / self.wave_size) if self.wave_size else None,
+        }
@@ -2,24 +2,37 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
 from typing import Any, Optional, Sequence
 
 import pytest
 from ocp_resources.resource import Resource
 
+from ocp_scale_utilities.constants import TIMEOUT_2MIN
+from ocp_scale_utilities.monitoring import PrometheusDataCollector
+from ocp_scale_utilities.results import ResultsStore
+from ocp_scale_utilities.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from ocp_scale_utilities.scale import ScaleResourcesMixin
+from ocp_scale_utilities.threaded.checkpoint import DeployCheckpoint
+from ocp_scale_utilities.threaded.client_pool import ClientPool
+from ocp_scale_utilities.threaded.concurrency import AdaptiveConcurrencyLimiter
+from ocp_scale_utilities.threaded.pacing import Pacer
 from ocp_scale_utilities.threaded.utils import (
+    get_max_workers,
     threaded_delete_resources,
     threaded_deploy_requested_resources,
     threaded_deploy_resources,
+    threaded_deploy_resources_wait_for_status,
     threaded_wait_deleted_resources,
     threaded_wait_for_resources_status,
 )
+from ocp_scale_utilities.timing import ResourceTimings
 
 LOGGER = logging.getLogger(__name__)
 
 
-class ThreadedScaleResources(ExitStack):
+class ThreadedScaleResources(ScaleResourcesMixin, ExitStack):
     def __init__(
         self,
         resources: Sequence[Resource],
@@ -27,13 +40,63 @@ class ThreadedScaleResources(ExitStack):
         pytest_cache: Optional[pytest.Cache] = None,
         cache_key_prefix: Optional[str] = None,
         wait_for_status: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        watch_status: bool = False,
+        watch_deleted: bool = True,
+        delete_collection: bool = False,
+        delete_namespaces: Optional[Sequence[str]] = None,
+        wait_for_status_timeout: int = TIMEOUT_2MIN,
+        pipeline: bool = False,
+        throughput_bucket_seconds: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        deploy_pacer: Optional[Pacer] = None,
+        delete_pacer: Optional[Pacer] = None,
+        data_collector: Optional[PrometheusDataCollector] = None,
+        results_store: Optional[ResultsStore] = None,
+        run_metadata: Optional[dict[str, Any]] = None,
+        client_pool: Optional[ClientPool] = None,
+        checkpoint: Optional[DeployCheckpoint] = None,
     ):
         """
         Args:
-            resources (Sequence): List of Resource objects to be managed
+            resources (Sequence): List of Resource objects to be managed,
+                or ResourceTemplate building each resource only when it is processed
             pytest_cache (pytest.Cache): config.cache from python run to store results in
             cache_key_prefix (str): prefix to use for cache_keys
             wait_for_status (str): Wait for provided status upon deploy
+            executor (Executor, optional): Shared executor to run all threaded operations on
+            max_workers (int, optional): Concurrency ceiling when executor is not provided,
+                defaults to connection_pool_maxsize of the Resource client
+            watch_status (bool, optional): Wait for status from shared list+watch streams instead of polling
+            watch_deleted (bool, optional): Wait for deletion from shared list+watch streams instead of polling
+            delete_collection (bool, optional): Delete resources sharing kind, namespace and labels
+                with one deletecollection call per group
+            delete_namespaces (list, optional): With delete_collection,
+                namespaces holding only scale objects, deleted as a whole
+            wait_for_status_timeout (int, optional): Time to wait for resources to reach wait_for_status
+            pipeline (bool, optional): With wait_for_status, wait for status of each resource
+                as soon as its own create returns instead of after all resources are deployed,
+                wait_for_status_timeout is then a deadline shared by deploy and status
+            throughput_bucket_seconds (float, optional): Width of the time buckets of throughput statistics
+            retry_policy (RetryPolicy, optional): Retry of deploys and deletes failing with a retryable status,
+                None to disable
+            limiter (AdaptiveConcurrencyLimiter, optional): Adapt the number of concurrent deploys and deletes
+                to apiserver feedback, the executor created when not provided then has max_limit threads
+            deploy_pacer (Pacer, optional): Pace deploys with a token bucket and optional waves,
+                when pipelined without watch_status a wave completes once its resources reached wait_for_status
+            delete_pacer (Pacer, optional): Pace deletes with a token bucket and optional waves
+            data_collector (PrometheusDataCollector, optional): Collect prometheus data
+                at post-enter, pre-exit and cleanup-on-error, instead of collect_data() of child classes
+            results_store (ResultsStore, optional): Append a run named cache_key_prefix with its phases,
+                per-resource timings and data collected by data_collector
+            run_metadata (dict, optional): Metadata of the run in results_store, eg: build, cluster version
+            client_pool (ClientPool, optional): Spread deploys, deletes and status polls across the clients
+                of the pool, the executor created when not provided then has a thread per pooled connection
+            checkpoint (DeployCheckpoint, optional): Append resources as they are created, reach wait_for_status
+                and are deleted. Checkpointed resources of an interrupted run that still exist are re-attached,
+                only the remainder is deployed, and all of them are deleted on exit.
         """
         super().__init__()
         self.resources = resources
@@ -41,36 +104,130 @@ class ThreadedScaleResources(ExitStack):
         self.pytest_cache = pytest_cache
         self.cache_key_prefix = cache_key_prefix
         self.wait_for_status = wait_for_status
+        self.executor = executor
+        self.max_workers = max_workers
+        self.watch_status = watch_status
+        self.watch_deleted = watch_deleted
+        self.delete_collection = delete_collection
+        self.delete_namespaces = delete_namespaces
+        self.wait_for_status_timeout = wait_for_status_timeout
+        self.pipeline = pipeline
+        self.throughput_bucket_seconds = throughput_bucket_seconds
+        self.retry_policy = retry_policy
+        self.limiter = limiter
+        self.deploy_pacer = deploy_pacer
+        self.delete_pacer = delete_pacer
+        self.data_collector = data_collector
+        self.results_store = results_store
+        self.run_metadata = run_metadata
+        self.client_pool = client_pool
+        self.checkpoint = checkpoint
+        self.run_id: Optional[str] = None
 
+        # Lifecycle timestamps per resource, indexed like resources
+        self.timings = ResourceTimings(count=len(resources))
+        self._owned_executor: Optional[ThreadPoolExecutor] = None
         self.collect_data_start_time = time.time()
 
     @contextmanager
-    def _cleanup_on_error(self, stack_exit):
+    def _cleanup_on_error(self, stack_exit, phase: str):
         with ExitStack() as stack:
             stack.push(exit=stack_exit)
+            # Recorded before resources are unwound
+            stack.callback(self._record_failed_phase, phase=phase, start_time=time.time())
             yield
             self.collect_data(id="cleanup-on-error", start_time=self.collect_data_start_time)
             stack.pop_all()
 
     def __enter__(self) -> ThreadedScaleResources:
-        with self._cleanup_on_error(stack_exit=super().__exit__):
+        with self._cleanup_on_error(stack_exit=super().__exit__, phase="deploy"):
+            if not self.executor:
+                # Registered first, so it is unwound last
+                self.executor = self._owned_executor = ThreadPoolExecutor(
+                    max_workers=get_max_workers(
+                        resources=self.resources,
+                        max_workers=self.max_workers
+                        or (self.limiter.max_limit if self.limiter else None)
+                        or (self.client_pool.max_workers if self.client_pool else None),
+                    )
+                )
+                self.callback(self._shutdown_executor)
+
             start_time = time.time()
-            if self.request_resources:
+            if self.client_pool:
+                self.client_pool.reset()
+            if self.checkpoint:
+                self.checkpoint.attach(resources=self.resources)
+            self._start_run()
+            if self.pipeline and self.wait_for_status:
+                threaded_deploy_resources_wait_for_status(
+                    resources=self.resources,
+                    status=self.wait_for_status,
+                    timeout=self.wait_for_status_timeout,
+                    request_resources=self.request_resources,
+                    exit_stack=self,
+                    executor=self.executor,
+                    watch=self.watch_status,
+                    timings=self.timings,
+                    retry_policy=self.retry_policy,
+                    limiter=self.limiter,
+                    pacer=self.deploy_pacer,
+                    client_pool=self.client_pool,
+                    checkpoint=self.checkpoint,
+                )
+            elif self.request_resources:
                 threaded_deploy_requested_resources(
-                    resources=self.resources, request_resources=self.request_resources, exit_stack=self
+                    resources=self.resources,
+                    request_resources=self.request_resources,
+                    exit_stack=self,
+                    executor=self.executor,
+                    timings=self.timings,
+                    retry_policy=self.retry_policy,
+                    limiter=self.limiter,
+                    pacer=self.deploy_pacer,
+                    client_pool=self.client_pool,
+                    checkpoint=self.checkpoint,
                 )
             else:
-                threaded_deploy_resources(resources=self.resources, exit_stack=self)
+                threaded_deploy_resources(
+                    resources=self.resources,
+                    exit_stack=self,
+                    executor=self.executor,
+                    timings=self.timings,
+                    retry_policy=self.retry_policy,
+                    limiter=self.limiter,
+                    pacer=self.deploy_pacer,
+                    client_pool=self.client_pool,
+                    checkpoint=self.checkpoint,
+                )
 
-            if self.wait_for_status:
-                threaded_wait_for_resources_status(resources=self.resources, status=self.wait_for_status)
+            if self.wait_for_status and not self.pipeline:
+                threaded_wait_for_resources_status(
+                    resources=self.resources,
+                    status=self.wait_for_status,
+                    timeout=self.wait_for_status_timeout,
+                    executor=self.executor,
+                    watch=self.watch_status,
+                    timings=self.timings,
+                    client_pool=self.client_pool,
+                    checkpoint=self.checkpoint,
+                )
 
             self.collect_data_start_time = stop_time = time.time()
+            self._record_deploy(start_time=start_time, stop_time=stop_time)
             if self.pytest_cache and self.cache_key_prefix:
-                self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-count", len(self.resources))
-                self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-start", start_time)
-                self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-stop", stop_time)
-                self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-elapsed", stop_time - start_time)
+                if self.checkpoint:
+                    self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-attached", len(self.checkpoint.attached))
+                if self.deploy_pacer:
+                    self.pytest_cache.set(f"{self.cache_key_prefix}-deploy-pacing", self.deploy_pacer.statistics())
+                if self.client_pool:
+                    self.pytest_cache.set(
+                        f"{self.cache_key_prefix}-deploy-client-utilization", self.client_pool.utilization()
+                    )
+            if self.deploy_pacer:
+                LOGGER.info(f"Deploy pacing: {self.deploy_pacer.statistics()}")
+            if self.client_pool:
+                LOGGER.info(f"Deploy client utilization: {self.client_pool.utilization()}")
 
             self.collect_data(id="post-enter", start_time=start_time)
 
@@ -79,25 +236,46 @@ class ThreadedScaleResources(ExitStack):
     def __exit__(self: ThreadedScaleResources, *exc_arguments: Any) -> Any:
         """
         Delete all resources, mark the start and end fields.
-        Deletion when exiting context manager will unwind ExitStack,
-        including any sleeps between batches.
-        Wait for resources to be deleted in reverse order of creation.
+        On error, deletion will unwind ExitStack,
+        exiting the resources of each threaded deploy in parallel batches,
+        in reverse order of creation between batches.
         """
-        with self._cleanup_on_error(stack_exit=super().__exit__):
+        with self._cleanup_on_error(stack_exit=super().__exit__, phase="delete"):
             self.collect_data(id="pre-exit", start_time=self.collect_data_start_time)
             start_time = time.time()
-            threaded_delete_resources(resources=self.resources)
-            threaded_wait_deleted_resources(resources=self.resources)
+            if self.client_pool:
+                self.client_pool.reset()
+            threaded_delete_resources(
+                resources=self.resources,
+                executor=self.executor,
+                collection=self.delete_collection,
+                namespaces=self.delete_namespaces,
+                timings=self.timings,
+                retry_policy=self.retry_policy,
+                limiter=self.limiter,
+                pacer=self.delete_pacer,
+                client_pool=self.client_pool,
+            )
+            threaded_wait_deleted_resources(
+                resources=self.resources,
+                executor=self.executor,
+                watch=self.watch_deleted,
+                timings=self.timings,
+                client_pool=self.client_pool,
+                checkpoint=self.checkpoint,
+            )
             stop_time = time.time()
+            self._record_delete(start_time=start_time, stop_time=stop_time)
             if self.pytest_cache and self.cache_key_prefix:
-                self.pytest_cache.set(f"{self.cache_key_prefix}-delete-start", start_time)
-                self.pytest_cache.set(f"{self.cache_key_prefix}-delete-stop", stop_time)
-                self.pytest_cache.set(f"{self.cache_key_prefix}-delete-elapsed", stop_time - start_time)
-
-    def collect_data(self, id: str, start_time: float):
-        # Placeholder to be defined by child classes for any data collection required
-        #
-        # Args:
-        #    id (str): A string to be utilized to identify where the call occured
-        #    start_time (float): Beginning time to collect data from
-        LOGGER.warning("No data collected. collect_data() should be defined by child classes")
+                if self.delete_pacer:
+                    self.pytest_cache.set(f"{self.cache_key_prefix}-delete-pacing", self.delete_pacer.statistics())
+                if self.client_pool:
+                    self.pytest_cache.set(
+                        f"{self.cache_key_prefix}-delete-client-utilization", self.client_pool.utilization()
+                    )
+            if self.delete_pacer:
+                LOGGER.info(f"Delete pacing: {self.delete_pacer.statistics()}")
+            if self.client_pool:
+                LOGGER.info(f"Delete client utilization: {self.client_pool.utilization()}")
+
+        self._shutdown_executor()
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import importlib
+import logging
+import math
+import os
+import pickle
+import queue
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.queues import Queue
+from typing import Any, Callable, Generator, Optional, Sequence
+
+from ocp_resources.resource import Resource, get_client
+
+from ocp_scale_utilities.constants import TIMEOUT_2MIN, TIMEOUT_4MIN
+from ocp_scale_utilities.exceptions import ShardWorkerError, ThreadedResourcesError
+from ocp_scale_utilities.logger import get_log_queue, setup_worker_logging
+from ocp_scale_utilities.retry import DEFAULT_RETRY_POLICY, RetryPolicy, call_with_retry
+from ocp_scale_utilities.threaded.as_completed import CompletedResource, threaded_as_completed
+from ocp_scale_utilities.threaded.utils import deploy_resource, wait_for_resource_status, wait_resource_deleted
+from ocp_scale_utilities.timing import DELETE_REQUEST, LIFECYCLE_EVENTS, ResourceTimings
+
+LOGGER = logging.getLogger(__name__)
+
+# Sent by a worker in place of a deployed resource, which holds a client and cannot be pickled
+DEPLOYED = "deployed"
+
+# Seconds to wait for a worker message before checking workers are alive
+WORKER_POLL_INTERVAL = 1.0
+
+# (module, class name, name, namespace, body) rebuilding a resource in a worker process
+ResourceDefinition = tuple[str, str, Optional[str], Optional[str], dict[str, Any]]
+
+
+def get_resource_definition(resource: Resource) -> ResourceDefinition:
+    """
+    Picklable definition of resource, rebuilt with its own client in a worker process
+    """
+    resource.to_dict()
+    return (
+        type(resource).__module__,
+        type(resource).__qualname__,
+        resource.name,
+        getattr(resource, "namespace", None),
+        resource.res,
+    )
+
+
+def _build_resource(definition: ResourceDefinition, client: Any) -> Resource:
+    module, class_name, name, namespace, body = definition
+    resource_class = getattr(importlib.import_module(module), class_name)
+    if namespace:
+        return resource_class(name=name, namespace=namespace, client=client, kind_dict=body)
+    return resource_class(name=name, client=client, kind_dict=body)
+
+
+def _delete_resource(
+    resource: Resource, timings: ResourceTimings, index: int, retry_policy: Optional[RetryPolicy] = None
+) -> Any:
+    timings.record(event=DELETE_REQUEST, index=index)
+    return call_with_retry(
+        func=resource.delete, retry_policy=retry_policy, description=f"Delete {resource.kind} {resource.name}"
+    )
+
+
+def _deploy_resource_wait_for_status(
+    resource: Resource,
+    timings: ResourceTimings,
+    index: int,
+    status: Optional[str] = None,
+    timeout: int = TIMEOUT_2MIN,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> Any:
+    deploy_resource(resource=resource, timings=timings, index=index, retry_policy=retry_policy)
+    if status:
+        wait_for_resource_status(resource=resource, status=status, timeout=timeout, timings=timings, index=index)
+    return DEPLOYED
+
+
+def _wait_deleted(resource: Resource, timings: ResourceTimings, index: int, timeout: int = TIMEOUT_4MIN) -> Any:
+    return wait_resource_deleted(resource=resource, timeout=timeout, timings=timings, index=index)
+
+
+# Operations run by worker processes, called with (resource, timings, index, **operation_kwargs)
+OPERATIONS: dict[str, Callable[..., Any]] = {
+    "deploy": _deploy_resource_wait_for_status,
+    "delete": _delete_resource,
+    "wait_deleted": _wait_deleted,
+}
+
+
+def _picklable_exception(exception: BaseException) -> BaseException:
+    try:
+        pickle.loads(pickle.dumps(exception))
+    except Exception:
+        return ShardWorkerError(f"{type(exception).__name__}: {exception}")
+    return exception
+
+
+def _shard_worker(
+    operation: str,
+    indexes: list[int],
+    definitions: list[ResourceDefinition],
+    client_kwargs: dict[str, Any],
+    result_queue: Queue,
+    log_queue: Optional[Queue] = None,
+    log_level: int = logging.INFO,
+    max_workers: Optional[int] = None,
+    operation_kwargs: Optional[dict[str, Any]] = None,
+) -> None:
+    """
+    Worker process entry point, running operation on its shard of resources via threads
+    and sending (index, result, elapsed seconds, lifecycle timestamps) per resource as it completes
+    """
+    if log_queue:
+        setup_worker_logging(log_queue=log_queue, log_level=log_level)
+    client = get_client(**client_kwargs)
+    resources = [_build_resource(definition=definition, client=client) for definition in definitions]
+    timings = ResourceTimings(count=len(resources))
+    local_indexes = {id(resource): local_index for local_index, resource in enumerate(resources)}
+    func = OPERATIONS[operation]
+    LOGGER.info(f"Worker {os.getpid()} running {operation} of {len(resources)} resources")
+
+    for resource, result, elapsed in threaded_as_completed(
+        resources=resources,
+        func=lambda x: func(resource=resources[x], timings=timings, index=x, **(operation_kwargs or {})),
+        max_in_flight=max_workers,
+    ):
+        local_index = local_indexes[id(resource)]
+        timestamps = {
+            event: timings.timestamps[event][local_index]
+            for event in LIFECYCLE_EVENTS
+            if not math.isnan(timings.timestamps[event][local_index])
+        }
+        if isinstance(result, BaseException):
+            result = _picklable_exception(exception=result)
+        result_queue.put((indexes[local_index], result, elapsed, timestamps))
+    result_queue.put((None, os.getpid(), None, None))
+
+
+def _sharded_as_completed(
+    resources: Sequence[Resource],
+    operation: str,
+    processes: Optional[int] = None,
+    client_kwargs: Optional[dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    timings: Optional[ResourceTimings] = None,
+    log_queue: Optional[Queue] = None,
+    log_level: int = logging.INFO,
+    mp_context: Optional[BaseContext] = None,
+    operation_kwargs: Optional[dict[str, Any]] = None,
+) -> Generator[tuple[int, Any, float], None, None]:
+    """
+    Run operation on resources sharded across worker processes,
+    yielding (index, result or raised exception, elapsed seconds) in completion order
+    """
+    if not resources:
+        return
+    mp_context = mp_context or get_context("spawn")
+    processes = max(1, min(processes or os.cpu_count() or 1, len(resources)))
+    log_queue = log_queue or get_log_queue()
+    result_queue = mp_context.Queue()
+    shards = [list(range(shard, len(resources), processes)) for shard in range(processes)]
+    pending: dict[int, set[int]] = {}
+    workers = []
+    for indexes in shards:
+        worker = mp_context.Process(  # type: ignore[attr-defined]
+            target=_shard_worker,
+            kwargs={
+                "operation": operation,
+                "indexes": indexes,
+                "definitions": [get_resource_definition(resource=resources[index]) for index in indexes],
+                "client_kwargs": client_kwargs or {},
+                "result_queue": result_queue,
+                "log_queue": log_queue,
+                "log_level": log_level,
+                "max_workers": max_workers,
+                "operation_kwargs": operation_kwargs,
+            },
+            daemon=True,
+        )
+        worker.start()
+        pending[worker.pid] = set(indexes)
+        workers.append(worker)
+    LOGGER.info(f"Running {operation} of {len(resources)} resources on {processes} worker processes")
+
+    try:
+        while pending:
+            try:
+                index, result, elapsed, timestamps = result_queue.get(timeout=WORKER_POLL_INTERVAL)
+            except queue.Empty:
+                for worker in workers:
+                    if worker.pid in pending and not worker.is_alive():
+                        # Let messages sent before exiting be read first
+                        if not result_queue.empty():
+                            break
+                        error = ShardWorkerError(f"Worker {worker.pid} exited with code {worker.exitcode}")
+                        for index in sorted(pending.pop(worker.pid)):
+                            yield index, error, 0.0
+                continue
+
+            if index is None:
+                pending.pop(result, None)
+                continue
+            for shard_indexes in pending.values():
+                shard_indexes.discard(index)
+            for event, timestamp in timestamps.items():
+                if timings:
+                    timings.record(event=event, index=index, timestamp=timestamp)
+            yield index, resources[index] if result == DEPLOYED else result, elapsed
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        result_queue.close()
+
+
+def sharded_as_completed(
+    resources: Sequence[Resource],
+    operation: str,
+    processes: Optional[int] = None,
+    client_kwargs: Optional[dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    timings: Optional[ResourceTimings] = None,
+    log_queue: Optional[Queue] = None,
+    log_level: int = logging.INFO,
+    mp_context: Optional[BaseContext] = None,
+    operation_kwargs: Optional[dict[str, Any]] = None,
+) -> Generator[CompletedResource, None, None]:
+    """
+    Run operation on resources sharded across worker processes, yielding results in completion order.
+    Each worker builds its own client, so JSON serialization, TLS and model handling
+    are spread across cores instead of being bound by the GIL of a single process.
+    Resources are rebuilt in workers from their class and to_dict() body.
+
+    Args:
+        resources (list): List of Resources
+        operation (str): One of OPERATIONS: "deploy", "delete" or "wait_deleted"
+        processes (int, optional): Number of worker processes, defaults to the number of CPUs
+        client_kwargs (dict, optional): Keyword arguments of get_client() building the client of each worker,
+            eg: {"config_file": kubeconfig, "context": "admin"}, defaults to the default kubeconfig
+        max_workers (int, optional): Number of threads per worker process,
+            defaults to connection_pool_maxsize of the client of the worker
+        timings (ResourceTimings, optional): Record lifecycle timestamps of each resource sent back by the workers
+        log_queue (Queue, optional): Queue worker logs are sent to, defaults to the queue set up by setup_logging(),
+            workers keep their default logging when neither is available
+        log_level (int): Log level of the workers
+        mp_context (BaseContext, optional): Multiprocessing context, defaults to "spawn",
+            as forking a process running threads is unsafe
+        operation_kwargs (dict, optional): Keyword arguments of operation, eg: {"status": "Running"} for "deploy"
+
+    Yields:
+        tuple: (resource, result or raised exception, elapsed seconds) in completion order
+    """
+    for index, result, elapsed in _sharded_as_completed(
+        resources=resources,
+        operation=operation,
+        processes=processes,
+        client_kwargs=client_kwargs,
+        max_workers=max_workers,
+        timings=timings,
+        log_queue=log_queue,
+        log_level=log_level,
+        mp_context=mp_context,
+        operation_kwargs=operation_kwargs,
+    ):
+        yield resources[index], result, elapsed
+
+
+def _sharded_map(resources: Sequence[Resource], operation: str, **kwargs: Any) -> list[Any]:
+    """
+    Run operation on resources sharded across worker processes, returning results in resources order
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them failed
+    """
+    results: list[Any] = [None] * len(resources)
+    for index, result, _ in _sharded_as_completed(resources=resources, operation=operation, **kwargs):
+        results[index] = result
+    failures = [(resources[index], result) for index, result in enumerate(results) if isinstance(result, BaseException)]
+    if failures:
+        raise ThreadedResourcesError(failures=failures, results=results) from failures[0][1]
+    return results
+
+
+def sharded_deploy_resources(
+    resources: Sequence[Resource],
+    processes: Optional[int] = None,
+    client_kwargs: Optional[dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    status: Optional[str] = None,
+    timeout: int = TIMEOUT_2MIN,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    log_queue: Optional[Queue] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> list[Any]:
+    """
+    Deploy multiple resources sharded across worker processes
+
+    Args:
+        resources (list): List of Resources
+        processes (int, optional): Number of worker processes, defaults to the number of CPUs
+        client_kwargs (dict, optional): Keyword arguments of get_client() building the client of each worker
+        max_workers (int, optional): Number of threads per worker process
+        status (str, optional): Wait for each resource to reach status as soon as its own create returns
+        timeout (int): Length of time to wait for each resource to reach status
+        timings (ResourceTimings, optional): Record create-request, create-ack and status-reached times
+            of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+        log_queue (Queue, optional): Queue worker logs are sent to, defaults to the queue set up by setup_logging()
+        mp_context (BaseContext, optional): Multiprocessing context, defaults to "spawn"
+
+    Returns:
+        list: Deployed resources
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them failed
+    """
+    return _sharded_map(
+        resources=resources,
+        operation="deploy",
+        processes=processes,
+        client_kwargs=client_kwargs,
+        max_workers=max_workers,
+        timings=timings,
+        log_queue=log_queue,
+        mp_context=mp_context,
+        operation_kwargs={"status": status, "timeout": timeout, "retry_policy": retry_policy},
+    )
+
+
+def sharded_delete_resources(
+    resources: Sequence[Resource],
+    processes: Optional[int] = None,
+    client_kwargs: Optional[dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    wait_deleted: bool = True,
+    timeout: int = TIMEOUT_4MIN,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    log_queue: Optional[Queue] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> list[Any]:
+    """
+    Delete multiple resources sharded across worker processes
+
+    Args:
+        resources (list): List of Resources
+        processes (int, optional): Number of worker processes, defaults to the number of CPUs
+        client_kwargs (dict, optional): Keyword arguments of get_client() building the client of each worker
+        max_workers (int, optional): Number of threads per worker process
+        wait_deleted (bool): Wait for all resources to be deleted once all deletes were requested
+        timeout (int): Length of time to wait for each resource to be deleted
+        timings (ResourceTimings, optional): Record delete-request and gone times of each resource
+        retry_policy (RetryPolicy, optional): Retry of deletes failing with a retryable status, None to disable
+        log_queue (Queue, optional): Queue worker logs are sent to, defaults to the queue set up by setup_logging()
+        mp_context (BaseContext, optional): Multiprocessing context, defaults to "spawn"
+
+    Returns:
+        list: Result per resource, True for each deleted resource when waiting
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them failed
+    """
+    kwargs: dict[str, Any] = {
+        "processes": processes,
+        "client_kwargs": client_kwargs,
+        "max_workers": max_workers,
+        "timings": timings,
+        "log_queue": log_queue,
+        "mp_context": mp_context,
+    }
+    results = _sharded_map(
+        resources=resources, operation="delete", operation_kwargs={"retry_policy": retry_policy}, **kwargs
+    )
+    if not wait_deleted:
+        return results
+    return _sharded_map(resources=resources, operation="wait_deleted", operation_kwargs={"timeout": timeout}, **kwargs)
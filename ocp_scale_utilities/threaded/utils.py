@@ -1,61 +1,484 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import ExitStack
-from typing import Any, Optional, Sequence
-
+import math
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, AsyncExitStack, ExitStack, contextmanager, nullcontext
+from functools import partial
+from types import TracebackType
+from typing import Any, Callable, Generator, Optional, Sequence
+
+from kubernetes.dynamic import DynamicClient
 from ocp_resources.resource import Resource
-
-from ocp_scale_utilities.constants import TIMEOUT_2MIN
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_scale_utilities.constants import TIMEOUT_2MIN, TIMEOUT_4MIN
+from ocp_scale_utilities.exceptions import ThreadedResourcesError
+from ocp_scale_utilities.retry import DEFAULT_RETRY_POLICY, RetryPolicy, call_with_retry
+from ocp_scale_utilities.template import get_exit_callback
+from ocp_scale_utilities.threaded.checkpoint import DeployCheckpoint
+from ocp_scale_utilities.threaded.client_pool import ClientPool
+from ocp_scale_utilities.threaded.collection import threaded_delete_collections
+from ocp_scale_utilities.threaded.concurrency import AdaptiveConcurrencyLimiter
+from ocp_scale_utilities.threaded.pacing import Pacer
+from ocp_scale_utilities.threaded.watch import ResourcesWatcher
+from ocp_scale_utilities.timing import (
+    CREATE_ACK,
+    CREATE_REQUEST,
+    DELETE_REQUEST,
+    GONE,
+    STATUS_REACHED,
+    ResourceTimings,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 
-def threaded_clean_up_resources(resources: Sequence[Resource]) -> list[Any]:
+def get_max_workers(resources: Sequence[Resource], max_workers: Optional[int] = None) -> int:
     """
-    Call clean_up() for multiple resources via threads
+    Get the number of worker threads to use for multiple resources
 
     Args:
         resources (list): List of Resources
+        max_workers (int, optional): Concurrency ceiling,
+            defaults to connection_pool_maxsize of the client of the first Resource
 
     Returns:
-        list: Data related to the results of the threaded function
+        int: Number of worker threads, never more than the number of resources
+    """
+    if not max_workers and resources:
+        max_workers = resources[0].client.configuration.connection_pool_maxsize
+    return max(1, min(len(resources), max_workers or 1))
+
+
+@contextmanager
+def resources_executor(
+    resources: Sequence[Resource],
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    client_pool: Optional[ClientPool] = None,
+) -> Generator[Executor, None, None]:
     """
-    with ThreadPoolExecutor(max_workers=len(resources)) as executor:
-        return list(executor.map(lambda x: x.clean_up(), resources))
+    Yield the provided executor, or a bounded executor scoped to the resources,
+    sized to the connection pools of client_pool if provided and max_workers is not
+
+    Args:
+        resources (list): List of Resources
+        executor (Executor, optional): Shared executor, yielded as is
+        max_workers (int, optional): Concurrency ceiling of the scoped executor
+        client_pool (ClientPool, optional): Pool whose connection pools size the scoped executor
 
+    Yields:
+        Executor: executor, or the scoped executor shut down on exit
+    """
+    if executor:
+        yield executor
+    else:
+        max_workers = max_workers or (client_pool.max_workers if client_pool else None)
+        with ThreadPoolExecutor(max_workers=get_max_workers(resources=resources, max_workers=max_workers)) as _executor:
+            yield _executor
+
+
+def record_times(
+    timings: Optional[ResourceTimings],
+    event: str,
+    times: Sequence[Optional[float]],
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> None:
+    """
+    Record times observed for many resources, skipping None, appending the events to checkpoint if provided
 
-def threaded_delete_resources(resources: Sequence[Resource]) -> list[Any]:
+    Args:
+        timings (ResourceTimings, optional): Timings to record the times with
+        event (str): Lifecycle event, eg: STATUS_REACHED
+        times (list): Time of event per resource position, None for resources without it
+        checkpoint (DeployCheckpoint, optional): Checkpoint to append the events to
     """
-    Call delete() for multiple resources via threads
+    for index, timestamp in enumerate(times):
+        if timestamp is None:
+            continue
+        if timings:
+            timings.record(event=event, index=index, timestamp=timestamp)
+        if checkpoint:
+            checkpoint.record(event=event, index=index)
+
+
+def _assign_client(resource: Resource, client_pool: Optional[ClientPool] = None) -> AbstractContextManager[Any]:
+    """
+    Assign a client of client_pool to resource for the duration of a call, if provided
+    """
+    return client_pool.assign(resource=resource) if client_pool else nullcontext()
+
+
+def _collect_results(resources: Sequence[Resource], result: Callable[[int], Any]) -> list[Any]:
+    """
+    Get the result of each resource with the index of the resource, letting every resource complete
+
+    Raises:
+        ThreadedResourcesError: Once all results were collected, if any of them failed
+    """
+    results: list[Any] = []
+    failures: list[tuple[Resource, BaseException]] = []
+    for index in range(len(resources)):
+        try:
+            results.append(result(index))
+        except Exception as exp:
+            results.append(exp)
+            failures.append((resources[index], exp))
+    if failures:
+        raise ThreadedResourcesError(failures=failures, results=results) from failures[0][1]
+    return results
+
+
+def _threaded_map(resources: Sequence[Resource], func: Callable[[int], Any], executor: Executor) -> list[Any]:
+    """
+    Call func with the index of each resource on executor, letting every call complete
+
+    Raises:
+        ThreadedResourcesError: Once all calls completed, if any of them failed
+    """
+    futures = [executor.submit(func, index) for index in range(len(resources))]
+    return _collect_results(resources=resources, result=lambda x: futures[x].result())
+
+
+class ThreadedExitCallbacks:
+    def __init__(self, max_workers: int, executor: Optional[Executor] = None):
+        """
+        Exit callbacks registered by a threaded helper, pushed as a single callback onto an ExitStack.
+        Callbacks are unwound in reverse order of registration, in parallel batches of max_workers,
+        each batch completing before the next one starts.
+
+        Args:
+            max_workers (int): Number of callbacks unwound in parallel per batch
+            executor (Executor, optional): Executor to unwind on, defaults to an executor created when unwinding
+        """
+        self.max_workers = max_workers
+        self.executor = executor
+        self.callbacks: list[Callable[..., Any]] = []
+
+    def append(self, callback: Callable[..., Any]) -> None:
+        self.callbacks.append(callback)
+
+    def _unwind(self, executor: Executor, exc_details: tuple[Any, ...]) -> list[BaseException]:
+        errors: list[BaseException] = []
+
+        def _exit(_callback: Callable[..., Any]) -> None:
+            try:
+                _callback(*exc_details)
+            except BaseException as exp:
+                errors.append(exp)
+
+        callbacks = self.callbacks[::-1]
+        self.callbacks = []
+        for batch_start in range(0, len(callbacks), self.max_workers):
+            list(executor.map(_exit, callbacks[batch_start : batch_start + self.max_workers]))
+        return errors
+
+    def __call__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        exc_details = (exc_type, exc_val, exc_tb)
+        if self.executor:
+            errors = self._unwind(executor=self.executor, exc_details=exc_details)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                errors = self._unwind(executor=executor, exc_details=exc_details)
+
+        for error in errors[1:]:
+            LOGGER.error(f"Error unwinding resource: {error!r}")
+        if errors:
+            raise errors[0]
+        return False
+
+
+def threaded_clean_up_resources(resources: Sequence[Resource], *, executor: Optional[Executor] = None) -> list[Any]:
+    """
+    Call clean_up() for multiple resources via threads
 
     Args:
         resources (list): List of Resources
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
 
     Returns:
         list: Data related to the results of the threaded function
     """
-    with ThreadPoolExecutor(max_workers=len(resources)) as executor:
-        return list(executor.map(lambda x: x.delete(), resources))
+    with resources_executor(resources=resources, executor=executor) as _executor:
+        return list(_executor.map(lambda x: x.clean_up(), resources))
+
+
+def threaded_delete_resources(
+    resources: Sequence[Resource],
+    *,
+    executor: Optional[Executor] = None,
+    collection: bool = False,
+    namespaces: Optional[Sequence[str]] = None,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    pacer: Optional[Pacer] = None,
+    client_pool: Optional[ClientPool] = None,
+) -> list[Any]:
+    """
+    Call delete() for multiple resources via threads
+
+    Args:
+        resources (list): List of Resources
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        collection (bool, optional): Delete resources sharing kind, namespace and labels with one deletecollection
+            call per group, falling back to delete() when a group cannot be selected exclusively
+        namespaces (list, optional): With collection, namespaces holding only scale objects, deleted as a whole
+        timings (ResourceTimings, optional): Record the delete-request time of each resource
+        retry_policy (RetryPolicy, optional): Retry of deletes failing with a retryable status, None to disable
+        limiter (AdaptiveConcurrencyLimiter, optional): Adapt the number of concurrent deletes to apiserver feedback
+        pacer (Pacer, optional): Pace deletes of resources not deleted with their collection
+        client_pool (ClientPool, optional): Spread deletes across the clients of the pool,
+            defaults to the client of each resource
+
+    Returns:
+        list: Data related to the results of the threaded function, one result per resource
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deleted
+    """
+    collection_results: list[Optional[bool]] = [None] * len(resources)
+
+    def _delete(_index: int) -> Any:
+        if collection_results[_index] is not None:
+            return collection_results[_index]
+        _resource = resources[_index]
+        with pacer or nullcontext(), _assign_client(resource=_resource, client_pool=client_pool):
+            if timings:
+                timings.record(event=DELETE_REQUEST, index=_index)
+            return call_with_retry(
+                func=partial(limiter.call, func=_resource.delete) if limiter else _resource.delete,
+                retry_policy=retry_policy,
+                description=f"Delete {_resource.kind} {_resource.name}",
+            )
+
+    with resources_executor(
+        resources=resources,
+        executor=executor,
+        max_workers=limiter.max_limit if limiter else None,
+        client_pool=client_pool,
+    ) as _executor:
+        if collection:
+            record_times(timings=timings, event=DELETE_REQUEST, times=[time.time()] * len(resources))
+            collection_results = threaded_delete_collections(
+                resources=resources, executor=_executor, namespaces=namespaces, retry_policy=retry_policy
+            )
+        return _threaded_map(resources=resources, func=_delete, executor=_executor)
+
+
+def wait_resource_deleted(
+    resource: Resource,
+    timeout: int,
+    timings: Optional[ResourceTimings] = None,
+    index: int = 0,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> Any:
+    """
+    Wait for resource to be deleted, polling from a client of client_pool if provided,
+    recording the gone time of the resource at index with timings and checkpoint if provided
 
+    Args:
+        resource (Resource): Resource to wait for
+        timeout (int): Length of time to wait for resource to be deleted
+        timings (ResourceTimings, optional): Record the time resource was observed gone
+        index (int): Position of resource in timings and checkpoint
+        client_pool (ClientPool, optional): Poll from a client of the pool, defaults to the client of resource
+        checkpoint (DeployCheckpoint, optional): Append resource once observed gone
 
-def threaded_wait_deleted_resources(resources: Sequence[Resource]) -> list[Any]:
+    Returns:
+        bool: True if resource was deleted
+    """
+    with _assign_client(resource=resource, client_pool=client_pool):
+        result = resource.wait_deleted(timeout=timeout)
+    if result and timings:
+        timings.record(event=GONE, index=index)
+    if result and checkpoint:
+        checkpoint.record(event=GONE, index=index)
+    return result
+
+
+def threaded_wait_deleted_resources(
+    resources: Sequence[Resource],
+    *,
+    timeout: int = TIMEOUT_4MIN,
+    executor: Optional[Executor] = None,
+    watch: bool = False,
+    timings: Optional[ResourceTimings] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> list[Any]:
     """
     Call wait_deleted() for multiple resources via threads
 
     Args:
         resources (list): List of Resources
+        timeout (int): Length of time for each thread to wait for resource to be deleted
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        watch (bool, optional): Track all resources from one list+watch stream per kind and namespace
+            instead of polling each resource, timeout is then shared by all resources
+        timings (ResourceTimings, optional): Record the time each resource was observed gone
+        client_pool (ClientPool, optional): Spread polls across the clients of the pool,
+            watch streams use the client of the resources
+        checkpoint (DeployCheckpoint, optional): Append each resource observed gone
 
     Returns:
-        list: Data related to the results of the threaded function
+        list: Data related to the results of the threaded function, True for each deleted resource
+    """
+    if watch:
+        deleted_times = ResourcesWatcher(resources=resources, timeout=timeout, executor=executor).wait_deleted()
+        record_times(timings=timings, event=GONE, times=deleted_times, checkpoint=checkpoint)
+        return [deleted is not None for deleted in deleted_times]
+
+    with resources_executor(resources=resources, executor=executor, client_pool=client_pool) as _executor:
+        return list(
+            _executor.map(
+                lambda x: wait_resource_deleted(
+                    resource=resources[x],
+                    timeout=timeout,
+                    timings=timings,
+                    index=x,
+                    client_pool=client_pool,
+                    checkpoint=checkpoint,
+                ),
+                range(len(resources)),
+            )
+        )
+
+
+def push_exit_callbacks(
+    resources: Sequence[Resource],
+    exit_stack: Optional[ExitStack | AsyncExitStack] = None,
+    executor: Optional[Executor] = None,
+) -> Optional[ThreadedExitCallbacks]:
     """
-    with ThreadPoolExecutor(max_workers=len(resources)) as executor:
-        return list(executor.map(lambda x: x.wait_deleted(), resources))
+    Push a ThreadedExitCallbacks onto exit_stack before deploying,
+    so resources entered before a failing deploy are still unwound.
+    An AsyncExitStack unwinds them on a thread outside of the event loop.
+
+    Args:
+        resources (list): List of Resources to deploy
+        exit_stack (ExitStack or AsyncExitStack, optional): Exit stack to push onto
+        executor (Executor, optional): Shared executor of the exit callbacks
+
+    Returns:
+        ThreadedExitCallbacks: Pushed exit callbacks, None without exit_stack
+    """
+    if not exit_stack:
+        return None
+    exit_callbacks = ThreadedExitCallbacks(max_workers=get_max_workers(resources=resources), executor=executor)
+    if isinstance(exit_stack, AsyncExitStack):
+        exit_stack.push_async_exit(lambda *exc_details: asyncio.to_thread(exit_callbacks, *exc_details))
+    else:
+        exit_stack.push(exit=exit_callbacks)
+    return exit_callbacks
+
+
+def get_deploy_func(
+    resource: Resource, enter: bool = False, request_resource: Optional[Resource] = None
+) -> Callable[[], Any]:
+    """
+    Call deploying resource: deploy of its request resource if provided, else __enter__ or deploy of resource
+
+    Args:
+        resource (Resource): Resource to deploy
+        enter (bool): Deploy resource with __enter__, for its __exit__ to be registered afterwards
+        request_resource (Resource, optional): Resource requesting resource, eg: ProjectRequest of a Project
+
+    Returns:
+        Callable: Deploying call
+    """
+    if request_resource:
+        return request_resource.deploy
+    if enter:
+        return resource.__enter__
+    return resource.deploy
+
+
+def deploy_resource(
+    resource: Resource,
+    exit_callbacks: Optional[ThreadedExitCallbacks] = None,
+    exit_callback: Optional[Callable[..., Any]] = None,
+    request_resource: Optional[Resource] = None,
+    timings: Optional[ResourceTimings] = None,
+    index: int = 0,
+    retry_policy: Optional[RetryPolicy] = None,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    pacer: Optional[Pacer] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> Any:
+    """
+    Deploy resource, or its request resource, once pacer allows it if provided,
+    from a client of client_pool if provided,
+    retrying according to retry_policy, each attempt within the limit of limiter if provided,
+    registering exit_callback, or resource.__exit__, with exit_callbacks if provided,
+    recording create-request and create-ack times of the resource at index with timings if provided
+    and appending its create-ack to checkpoint if provided.
+    Resources of the checkpoint re-attached by DeployCheckpoint.attach() are only registered with exit_callbacks.
+
+    Args:
+        resource (Resource): Resource to deploy
+        exit_callbacks (ThreadedExitCallbacks, optional): Exit callbacks to register the deployed resource with
+        exit_callback (Callable, optional): Callback registered instead of resource.__exit__
+        request_resource (Resource, optional): Resource requesting resource, deployed instead of it
+        timings (ResourceTimings, optional): Record create-request and create-ack times of resource
+        index (int): Position of resource in timings and checkpoint
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+        limiter (AdaptiveConcurrencyLimiter, optional): Limit of concurrent deploy attempts
+        pacer (Pacer, optional): Pace the deploy with a token bucket and optional waves
+        client_pool (ClientPool, optional): Deploy from a client of the pool, defaults to the client of resource
+        checkpoint (DeployCheckpoint, optional): Append resource once deployed
+
+    Returns:
+        Any: Result of the deploy, None when registered with exit_callbacks or re-attached
+    """
+    if checkpoint and index in checkpoint.attached:
+        if exit_callbacks:
+            exit_callbacks.append(callback=exit_callback or resource.__exit__)
+        return None
+
+    deploy = get_deploy_func(resource=resource, enter=bool(exit_callbacks), request_resource=request_resource)
+    with pacer or nullcontext(), _assign_client(resource=request_resource or resource, client_pool=client_pool):
+        if timings:
+            timings.record(event=CREATE_REQUEST, index=index)
+        result = call_with_retry(
+            func=partial(limiter.call, func=deploy) if limiter else deploy,
+            retry_policy=retry_policy,
+            description=f"Deploy {resource.kind} {resource.name}",
+            create=True,
+        )
+        if timings:
+            timings.record(event=CREATE_ACK, index=index)
+        if checkpoint:
+            checkpoint.record(event=CREATE_ACK, index=index, resource=resource)
+
+    if not exit_callbacks:
+        return result
+    exit_callbacks.append(callback=exit_callback or resource.__exit__)
+    return None
 
 
 def threaded_deploy_requested_resources(
-    resources: Sequence[Resource], request_resources: Sequence[Resource], exit_stack: Optional[ExitStack] = None
+    resources: Sequence[Resource],
+    request_resources: Sequence[Resource],
+    exit_stack: Optional[ExitStack] = None,
+    *,
+    executor: Optional[Executor] = None,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    pacer: Optional[Pacer] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
 ) -> list[Any]:
     """
     Deploy multiple resources via threads
@@ -63,48 +486,155 @@ def threaded_deploy_requested_resources(
     Args:
         resources (list): List of Resources eg: Project
         request_resources (list): List of Request Resources eg: ProjectRequest
-        exit_stack (ExitStack, optional): ExitStack if desired, will use enter_context to deploy Resources
+        exit_stack (ExitStack, optional): ExitStack if desired, will enter Resources to deploy them
+            and push a single ThreadedExitCallbacks unwinding them in parallel
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        timings (ResourceTimings, optional): Record create-request and create-ack times of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+        limiter (AdaptiveConcurrencyLimiter, optional): Adapt the number of concurrent deploys to apiserver feedback
+        pacer (Pacer, optional): Pace deploys with a token bucket and optional waves
+        client_pool (ClientPool, optional): Spread deploys across the clients of the pool,
+            defaults to the client of each resource
+        checkpoint (DeployCheckpoint, optional): Append each deployed resource,
+            resources it re-attached to are not deployed again
 
     Returns:
         list: Data related to the results of the threaded function
-    """
-
-    def _deploy(_resource: tuple[Resource, Resource]) -> Any:
-        _request_resource, _managed_resource = _resource
-        if exit_stack:
-            _request_resource.deploy()
-            exit_stack.push(exit=_managed_resource.__exit__)
-        else:
-            return _request_resource.deploy()
-
-    with ThreadPoolExecutor(max_workers=len(resources)) as executor:
-        return list(executor.map(_deploy, zip(request_resources, resources)))
-
 
-def threaded_deploy_resources(resources: Sequence[Resource], exit_stack: Optional[ExitStack] = None) -> list[Any]:
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deployed
+    """
+    exit_callbacks = push_exit_callbacks(resources=resources, exit_stack=exit_stack, executor=executor)
+
+    with resources_executor(
+        resources=resources,
+        executor=executor,
+        max_workers=limiter.max_limit if limiter else None,
+        client_pool=client_pool,
+    ) as _executor:
+        return _threaded_map(
+            resources=resources,
+            func=lambda x: deploy_resource(
+                resource=resources[x],
+                exit_callbacks=exit_callbacks,
+                exit_callback=get_exit_callback(resources=resources, index=x),
+                request_resource=request_resources[x],
+                timings=timings,
+                index=x,
+                retry_policy=retry_policy,
+                limiter=limiter,
+                pacer=pacer,
+                client_pool=client_pool,
+                checkpoint=checkpoint,
+            ),
+            executor=_executor,
+        )
+
+
+def threaded_deploy_resources(
+    resources: Sequence[Resource],
+    exit_stack: Optional[ExitStack] = None,
+    *,
+    executor: Optional[Executor] = None,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    pacer: Optional[Pacer] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> list[Any]:
     """
     Deploy multiple resources via threads
 
     Args:
         resources (list): List of Resources
-        exit_stack (ExitStack, optional): ExitStack if desired, will use enter_context to deploy Resources
+        exit_stack (ExitStack, optional): ExitStack if desired, will enter Resources to deploy them
+            and push a single ThreadedExitCallbacks unwinding them in parallel
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        timings (ResourceTimings, optional): Record create-request and create-ack times of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+        limiter (AdaptiveConcurrencyLimiter, optional): Adapt the number of concurrent deploys to apiserver feedback
+        pacer (Pacer, optional): Pace deploys with a token bucket and optional waves
+        client_pool (ClientPool, optional): Spread deploys across the clients of the pool,
+            defaults to the client of each resource
+        checkpoint (DeployCheckpoint, optional): Append each deployed resource,
+            resources it re-attached to are not deployed again
 
     Returns:
         list: Data related to the results of the threaded function
-    """
 
-    def _deploy(_resource: Resource) -> Any:
-        if exit_stack:
-            exit_stack.enter_context(cm=_resource)
-        else:
-            return _resource.deploy()
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deployed
+    """
+    exit_callbacks = push_exit_callbacks(resources=resources, exit_stack=exit_stack, executor=executor)
+
+    with resources_executor(
+        resources=resources,
+        executor=executor,
+        max_workers=limiter.max_limit if limiter else None,
+        client_pool=client_pool,
+    ) as _executor:
+        return _threaded_map(
+            resources=resources,
+            func=lambda x: deploy_resource(
+                resource=resources[x],
+                exit_callbacks=exit_callbacks,
+                exit_callback=get_exit_callback(resources=resources, index=x),
+                timings=timings,
+                index=x,
+                retry_policy=retry_policy,
+                limiter=limiter,
+                pacer=pacer,
+                client_pool=client_pool,
+                checkpoint=checkpoint,
+            ),
+            executor=_executor,
+        )
+
+
+def wait_for_resource_status(
+    resource: Resource,
+    status: str,
+    timeout: int,
+    timings: Optional[ResourceTimings] = None,
+    index: int = 0,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> None:
+    """
+    Wait for resource to reach status, polling from a client of client_pool if provided,
+    recording the status-reached time of the resource at index with timings and checkpoint if provided
 
-    with ThreadPoolExecutor(max_workers=len(resources)) as executor:
-        return list(executor.map(_deploy, resources))
+    Args:
+        resource (Resource): Resource to wait for
+        status (str): Status to wait for
+        timeout (int): Length of time to wait for resource to reach status
+        timings (ResourceTimings, optional): Record the time resource reached status
+        index (int): Position of resource in timings and checkpoint
+        client_pool (ClientPool, optional): Poll from a client of the pool, defaults to the client of resource
+        checkpoint (DeployCheckpoint, optional): Append resource once it reached status
+
+    Raises:
+        TimeoutExpiredError: If resource did not reach status within timeout
+    """
+    with _assign_client(resource=resource, client_pool=client_pool):
+        resource.wait_for_status(status=status, timeout=timeout)
+    if timings:
+        timings.record(event=STATUS_REACHED, index=index)
+    if checkpoint:
+        checkpoint.record(event=STATUS_REACHED, index=index)
 
 
 def threaded_wait_for_resources_status(
-    resources: Sequence[Resource], status: str, timeout: int = TIMEOUT_2MIN
+    resources: Sequence[Resource],
+    status: str,
+    timeout: int = TIMEOUT_2MIN,
+    *,
+    executor: Optional[Executor] = None,
+    watch: bool = False,
+    timings: Optional[ResourceTimings] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
 ) -> list[Any]:
     """
     Wait for multiple resources to to reach status via threads
@@ -113,9 +643,221 @@ def threaded_wait_for_resources_status(
         resources (list): List of Resources
         status: (str): Status to wait for
         timeout: (int): Length of time for each thread to wait for resource to reach status
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        watch (bool, optional): Track all resources from one list+watch stream per kind and namespace
+            instead of polling each resource, timeout is then shared by all resources
+        timings (ResourceTimings, optional): Record the time each resource reached status
+        client_pool (ClientPool, optional): Spread polls across the clients of the pool,
+            watch streams use the client of the resources
+        checkpoint (DeployCheckpoint, optional): Append each resource reaching status
 
     Returns:
-        list: Data related to the results of the threaded function
+        list: Data related to the results of the threaded function,
+            time each resource reached status when watching
+
+    Raises:
+        TimeoutExpiredError: If resources did not reach status
+    """
+    if watch:
+        watcher = ResourcesWatcher(resources=resources, timeout=timeout, executor=executor)
+        try:
+            return watcher.wait_for_status(status=status)
+        finally:
+            record_times(timings=timings, event=STATUS_REACHED, times=watcher.results, checkpoint=checkpoint)
+
+    with resources_executor(resources=resources, executor=executor, client_pool=client_pool) as _executor:
+        return list(
+            _executor.map(
+                lambda x: wait_for_resource_status(
+                    resource=resources[x],
+                    status=status,
+                    timeout=timeout,
+                    timings=timings,
+                    index=x,
+                    client_pool=client_pool,
+                    checkpoint=checkpoint,
+                ),
+                range(len(resources)),
+            )
+        )
+
+
+def threaded_deploy_resources_wait_for_status(
+    resources: Sequence[Resource],
+    status: str,
+    timeout: int = TIMEOUT_2MIN,
+    *,
+    request_resources: Optional[Sequence[Resource]] = None,
+    exit_stack: Optional[ExitStack] = None,
+    executor: Optional[Executor] = None,
+    watch: bool = False,
+    timings: Optional[ResourceTimings] = None,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    pacer: Optional[Pacer] = None,
+    client_pool: Optional[ClientPool] = None,
+    checkpoint: Optional[DeployCheckpoint] = None,
+) -> list[tuple[Optional[float], Optional[float]]]:
+    """
+    Deploy multiple resources via threads, each resource waiting for status as soon as its own create returns.
+    All resources share a single deadline.
+    Resources re-attached by checkpoint are not deployed again and are left out of timings.
+
+    Without watch, each deployed resource is handed to a pool of status waits of its own,
+    sized to the connection pools of client_pool if provided, else of the client of the resources,
+    so that waits never hold the threads deploys are queued on.
+
+    Args:
+        resources (list): List of Resources
+        status (str): Status to wait for
+        timeout (int): Shared deadline in seconds for all resources to be deployed and reach status
+        request_resources (list, optional): List of Request Resources eg: ProjectRequest
+        exit_stack (ExitStack, optional): ExitStack if desired, will enter Resources to deploy them
+            and push a single ThreadedExitCallbacks unwinding them in parallel
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        watch (bool, optional): Track status from one list+watch stream per kind and namespace
+            started before the first create, instead of polling each resource
+        timings (ResourceTimings, optional): Record create-request, create-ack and status-reached times
+            of each resource
+        retry_policy (RetryPolicy, optional): Retry of deploys failing with a retryable status, None to disable
+        limiter (AdaptiveConcurrencyLimiter, optional): Adapt the number of concurrent creates to apiserver feedback,
+            waits for status are not limited
+        pacer (Pacer, optional): Pace creates with a token bucket and optional waves,
+            without watch a wave completes once its resources reached status
+        client_pool (ClientPool, optional): Spread creates and polls across the clients of the pool,
+            watch streams use the client of the resources
+        checkpoint (DeployCheckpoint, optional): Append each resource created and reaching status,
+            resources it re-attached to are not deployed again
+
+    Returns:
+        list: (create-ack time, status-reached time) per resource, None for times not recorded
+
+    Raises:
+        ThreadedResourcesError: Once all resources were processed, if any of them could not be deployed,
+            or was not deployed or did not reach status before the deadline without watch
+        TimeoutExpiredError: If watched resources did not reach status before the deadline
+    """
+    deadline = time.monotonic() + timeout
+    timings = timings or ResourceTimings(count=len(resources))
+    exit_callbacks = push_exit_callbacks(resources=resources, exit_stack=exit_stack, executor=executor)
+    attached = checkpoint.attached if checkpoint else set()
+
+    def _wait(_index: int) -> None:
+        _resource = resources[_index]
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutExpiredError(f"{_resource.kind} {_resource.name} was deployed after the deadline")
+            wait_for_resource_status(
+                resource=_resource,
+                status=status,
+                timeout=math.ceil(remaining),
+                timings=None if _index in attached else timings,
+                index=_index,
+                client_pool=client_pool,
+                checkpoint=checkpoint,
+            )
+        finally:
+            if pacer:
+                pacer.release()
+
+    def _deploy(_index: int) -> Optional[Future]:
+        # Without watch, a paced operation spans the deploy and the status wait of the resource
+        if pacer and not watch:
+            pacer.acquire()
+        try:
+            deploy_resource(
+                resource=resources[_index],
+                exit_callbacks=exit_callbacks,
+                exit_callback=get_exit_callback(resources=resources, index=_index),
+                request_resource=request_resources[_index] if request_resources else None,
+                timings=None if _index in attached else timings,
+                index=_index,
+                retry_policy=retry_policy,
+                limiter=limiter,
+                pacer=pacer if watch else None,
+                client_pool=client_pool,
+                checkpoint=checkpoint,
+            )
+        except BaseException:
+            if pacer and not watch:
+                pacer.release()
+            raise
+        return None if watch else wait_executor.submit(_wait, _index)
+
+    def _result(_index: int) -> None:
+        wait_future = deploy_futures[_index].result()
+        if wait_future:
+            wait_future.result()
+
+    watcher = ResourcesWatcher(resources=resources, timeout=timeout) if watch else None
+    # The watcher, or the status waits, run on their own threads, outside of the executor the deploys are queued on
+    wait_executor = ThreadPoolExecutor(
+        max_workers=1
+        if watch
+        else get_max_workers(resources=resources, max_workers=client_pool.max_workers if client_pool else None)
+    )
+    try:
+        watch_future = wait_executor.submit(watcher.wait_for_status, status=status) if watcher else None
+        with resources_executor(
+            resources=resources,
+            executor=executor,
+            max_workers=limiter.max_limit if limiter else None,
+            client_pool=client_pool,
+        ) as _executor:
+            deploy_futures = [_executor.submit(_deploy, index) for index in range(len(resources))]
+            _collect_results(resources=resources, result=_result)
+        if watch_future:
+            watch_future.result()
+    except BaseException:
+        if watcher:
+            watcher.stop()
+        raise
+    finally:
+        wait_executor.shutdown(wait=False, cancel_futures=True)
+        if watcher:
+            record_times(timings=None, event=STATUS_REACHED, times=watcher.results, checkpoint=checkpoint)
+            record_times(
+                timings=timings,
+                event=STATUS_REACHED,
+                times=[None if index in attached else status_time for index, status_time in enumerate(watcher.results)],
+            )
+
+    return [
+        (None if math.isnan(create_time) else create_time, None if math.isnan(status_time) else status_time)
+        for create_time, status_time in zip(timings.timestamps[CREATE_ACK], timings.timestamps[STATUS_REACHED])
+    ]
+
+
+def threaded_tear_down_checkpoint(
+    checkpoint: DeployCheckpoint,
+    client: DynamicClient,
+    timeout: int = TIMEOUT_4MIN,
+    *,
+    executor: Optional[Executor] = None,
+    watch: bool = True,
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+) -> list[Any]:
+    """
+    Delete all resources of a checkpoint via threads, without the Resource objects of the checkpointed run,
+    and wait for them to be deleted, appending each resource gone to the checkpoint
+
+    Args:
+        checkpoint (DeployCheckpoint): Checkpoint of the resources to delete
+        client (DynamicClient): Client of the resources
+        timeout (int): Length of time to wait for resources to be deleted
+        executor (Executor, optional): Shared executor, defaults to a bounded executor per call
+        watch (bool, optional): Track deletion from one list+watch stream per kind and namespace
+        retry_policy (RetryPolicy, optional): Retry of deletes failing with a retryable status, None to disable
+
+    Returns:
+        list: True for each deleted resource, in the order of checkpoint.indexes()
     """
-    with ThreadPoolExecutor(max_workers=len(resources)) as executor:
-        return list(executor.map(lambda x: x.wait_for_status(status=status, timeout=timeout), resources))
+    indexes = checkpoint.indexes()
+    resources = checkpoint.get_resources(client=client)
+    threaded_delete_resources(resources=resources, executor=executor, retry_policy=retry_policy)
+    results = threaded_wait_deleted_resources(resources=resources, timeout=timeout, executor=executor, watch=watch)
+    for index, deleted in zip(indexes, results):
+        if deleted:
+            checkpoint.record(event=GONE, index=index)
+    return results
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Sequence
+
+from kubernetes.client.rest import ApiException
+from kubernetes.watch import Watch
+from ocp_resources.resource import Resource
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_scale_utilities.constants import TIMEOUT_2MIN, TIMEOUT_30SEC
+
+LOGGER = logging.getLogger(__name__)
+
+HTTP_STATUS_GONE = 410
+LIST_PAGE_SIZE = 500
+# Watch requests are renewed from the last resourceVersion, bounding how long stop() takes effect
+WATCH_TIMEOUT_SECONDS = TIMEOUT_30SEC
+
+# Matcher result for a resource: True when done, False when failed, None while pending
+Matcher = Callable[[str, Optional[dict[str, Any]]], Optional[bool]]
+
+
+def get_resources_groups(resources: Sequence[Resource]) -> dict[tuple[Any, ...], list[int]]:
+    """
+    Group resources that can share a single list/watch stream
+
+    Args:
+        resources (list): List of Resources
+
+    Returns:
+        dict: Indexes of resources keyed by (client, api_version, kind, namespace)
+    """
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for index, resource in enumerate(resources):
+        groups.setdefault((resource.client, resource.api_version, resource.kind, resource.namespace), []).append(index)
+    return groups
+
+
+def get_common_label_selector(resources: Sequence[Resource]) -> Optional[str]:
+    """
+    Build a label selector from the labels shared by all resources
+
+    Args:
+        resources (list): List of Resources
+
+    Returns:
+        str: Label selector, or None if the resources do not share any label
+    """
+    common_labels: Optional[set[tuple[str, str]]] = None
+    for resource in resources:
+        labels = set((resource.label or {}).items())
+        common_labels = labels if common_labels is None else common_labels & labels
+        if not common_labels:
+            return None
+    return ",".join(f"{key}={value}" for key, value in sorted(common_labels or ()))
+
+
+def list_resources(
+    api: Any,
+    namespace: Optional[str],
+    label_selector: Optional[str],
+    on_item: Callable[[dict[str, Any]], Any],
+    page_size: int = LIST_PAGE_SIZE,
+) -> str:
+    """
+    Paged list of raw objects, without building a ResourceInstance per object
+
+    Args:
+        api (Resource): Dynamic client resource API, eg: Resource.full_api()
+        namespace (str): Namespace to list, None for all namespaces or cluster scoped resources
+        label_selector (str): Label selector to list
+        on_item (Callable): Called with each raw object dict
+        page_size (int): Number of items per list request
+
+    Returns:
+        str: resourceVersion of the list, to start watching from
+    """
+    # Watch from the first page, so changes made while paging through later pages are replayed
+    resource_version = None
+    _continue = None
+    while True:
+        response = api.get(
+            namespace=namespace,
+            label_selector=label_selector,
+            limit=page_size,
+            _continue=_continue,
+            serialize=False,
+        )
+        body = json.loads(response.data)
+        for item in body.get("items") or []:
+            on_item(item)
+        resource_version = resource_version or body["metadata"]["resourceVersion"]
+        _continue = body["metadata"].get("continue")
+        if not _continue:
+            return resource_version
+
+
+def status_matcher(status: str, stop_status: Optional[str] = None) -> Matcher:
+    """
+    Match resources reaching status, failing on stop_status
+    """
+
+    def _match(event_type: str, raw_object: Optional[dict[str, Any]]) -> Optional[bool]:
+        if raw_object is None or event_type == "DELETED":
+            return None
+        phase = (raw_object.get("status") or {}).get("phase")
+        if phase == status:
+            return True
+        if phase == (stop_status or Resource.Status.FAILED):
+            return False
+        return None
+
+    return _match
+
+
+def deleted_matcher() -> Matcher:
+    """
+    Match resources missing from a list or reported as DELETED
+    """
+
+    def _match(event_type: str, raw_object: Optional[dict[str, Any]]) -> Optional[bool]:
+        return raw_object is None or event_type == "DELETED" or None
+
+    return _match
+
+
+class ResourcesWatcher:
+    def __init__(
+        self,
+        resources: Sequence[Resource],
+        timeout: int = TIMEOUT_2MIN,
+        executor: Optional[Executor] = None,
+        page_size: int = LIST_PAGE_SIZE,
+    ):
+        """
+        Track many resources from shared list+watch streams instead of polling each resource.
+        One stream is opened per client, api_version, kind and namespace,
+        all streams share a single deadline.
+
+        Args:
+            resources (list): List of Resources
+            timeout (int): Shared deadline in seconds for all resources
+            executor (Executor, optional): Executor to run one stream per group on,
+                defaults to an executor with one thread per group
+            page_size (int): Number of items per list request
+        """
+        self.resources = resources
+        self.timeout = timeout
+        self.executor = executor
+        self.page_size = page_size
+
+        # Time each resource was observed done, None while pending
+        self.results: list[Optional[float]] = [None] * len(resources)
+        self.failed: dict[int, Optional[dict[str, Any]]] = {}
+        self._stopped = False
+
+    def stop(self) -> None:
+        """
+        Stop watching, streams end after their next event or watch request timeout
+        """
+        self._stopped = True
+
+    @property
+    def pending(self) -> list[Resource]:
+        """
+        Resources not yet observed done or failed
+        """
+        return [
+            resource
+            for index, resource in enumerate(self.resources)
+            if self.results[index] is None and index not in self.failed
+        ]
+
+    def _observe(
+        self, pending: dict[str, int], match: Matcher, event_type: str, raw_object: Optional[dict[str, Any]], name: str
+    ) -> None:
+        index = pending.get(name)
+        if index is None:
+            return
+        matched = match(event_type, raw_object)
+        if matched is None:
+            return
+        if matched:
+            self.results[index] = time.time()
+        else:
+            self.failed[index] = raw_object
+        pending.pop(name)
+
+    def _watch_group(self, indexes: list[int], match: Matcher, deadline: float) -> None:
+        first_resource = self.resources[indexes[0]]
+        namespace = first_resource.namespace
+        pending: dict[str, int] = {str(self.resources[index].name): index for index in indexes}
+        label_selector = get_common_label_selector(resources=[self.resources[index] for index in indexes])
+        api = first_resource.full_api()
+
+        LOGGER.info(
+            f"Watching {len(pending)} {first_resource.kind} in namespace {namespace} "
+            f"with label selector {label_selector!r}"
+        )
+        resource_version = None
+        while pending:
+            # List at least once, groups may start late when the executor is saturated
+            if resource_version is None:
+                listed: set[str] = set()
+
+                def _on_item(_item: dict[str, Any]) -> None:
+                    _name = _item["metadata"]["name"]
+                    listed.add(_name)
+                    self._observe(pending=pending, match=match, event_type="LISTED", raw_object=_item, name=_name)
+
+                resource_version = list_resources(
+                    api=api,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    on_item=_on_item,
+                    page_size=self.page_size,
+                )
+                for name in [name for name in pending if name not in listed]:
+                    self._observe(pending=pending, match=match, event_type="LISTED", raw_object=None, name=name)
+            if not pending or self._stopped or time.monotonic() >= deadline:
+                break
+
+            watcher = Watch()
+            try:
+                for event in watcher.stream(
+                    api.get,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, min(WATCH_TIMEOUT_SECONDS, int(deadline - time.monotonic()))),
+                    serialize=False,
+                    allow_watch_bookmarks=True,
+                ):
+                    raw_object = event["raw_object"]
+                    resource_version = raw_object["metadata"].get("resourceVersion", resource_version)
+                    if event["type"] != "BOOKMARK":
+                        self._observe(
+                            pending=pending,
+                            match=match,
+                            event_type=event["type"],
+                            raw_object=raw_object,
+                            name=raw_object["metadata"]["name"],
+                        )
+                    if not pending or self._stopped or time.monotonic() >= deadline:
+                        watcher.stop()
+            except ApiException as exp:
+                if exp.status != HTTP_STATUS_GONE:
+                    raise
+                LOGGER.info(f"Watch of {first_resource.kind} in namespace {namespace} expired, relisting")
+                resource_version = None
+
+    def wait(self, match: Matcher) -> list[Optional[float]]:
+        """
+        Wait for all resources to match
+
+        Args:
+            match (Matcher): Callable returning True when a resource is done, False when it failed
+
+        Returns:
+            list: Time each resource was observed done, None for pending or failed resources
+        """
+        deadline = time.monotonic() + self.timeout
+        groups = get_resources_groups(resources=self.resources)
+        if not groups:
+            return self.results
+
+        def _watch_groups(_executor: Executor) -> None:
+            futures = [
+                _executor.submit(self._watch_group, indexes=indexes, match=match, deadline=deadline)
+                for indexes in groups.values()
+            ]
+            for future in futures:
+                future.result()
+
+        if self.executor:
+            _watch_groups(_executor=self.executor)
+        else:
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                _watch_groups(_executor=executor)
+        return self.results
+
+    def wait_for_status(self, status: str, stop_status: Optional[str] = None) -> list[Optional[float]]:
+        """
+        Wait for all resources to reach status
+
+        Args:
+            status (str): Status to wait for
+            stop_status (str, optional): Status which fails the wait, defaults to Resource.Status.FAILED
+
+        Returns:
+            list: Time each resource reached status
+
+        Raises:
+            TimeoutExpiredError: If any resource did not reach status before the deadline
+        """
+        results = self.wait(match=status_matcher(status=status, stop_status=stop_status))
+        if self.failed or self.pending:
+            failed_names = [self.resources[index].name for index in self.failed]
+            pending_names = [resource.name for resource in self.pending]
+            LOGGER.error(
+                f"{len(pending_names)} resources did not reach status {status}: {pending_names[:10]}, "
+                f"{len(failed_names)} resources reached stop status: {failed_names[:10]}"
+            )
+            raise TimeoutExpiredError(
+                f"{len(pending_names) + len(failed_names)} of {len(self.resources)} resources "
+                f"did not reach status {status}"
+            )
+        return results
+
+    def wait_deleted(self) -> list[Optional[float]]:
+        """
+        Wait for all resources to be deleted
+
+        Returns:
+            list: Time each resource was observed deleted, None for resources still pending at the deadline
+        """
+        results = self.wait(match=deleted_matcher())
+        pending_names = [resource.name for resource in self.pending]
+        if pending_names:
+            LOGGER.warning(
+                f"Timeout expired while waiting for {len(pending_names)} of {len(self.resources)} resources "
+                f"to be deleted: {pending_names[:10]}"
+            )
+        return results
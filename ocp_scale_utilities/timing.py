@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from typing import Any, Optional
+
+CREATE_REQUEST = "create-request"
+CREATE_ACK = "create-ack"
+STATUS_REACHED = "status-reached"
+DELETE_REQUEST = "delete-request"
+GONE = "gone"
+
+LIFECYCLE_EVENTS = (CREATE_REQUEST, CREATE_ACK, STATUS_REACHED, DELETE_REQUEST, GONE)
+
+# phase: (start event, end event)
+PHASES: dict[str, tuple[str, str]] = {
+    "deploy": (CREATE_REQUEST, CREATE_ACK),
+    "status": (CREATE_ACK, STATUS_REACHED),
+    "ready": (CREATE_REQUEST, STATUS_REACHED),
+    "delete": (DELETE_REQUEST, GONE),
+}
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values
+    """
+    return sorted_values[max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)]
+
+
+class ResourceTimings:
+    def __init__(self, count: int):
+        """
+        Lifecycle timestamps of many resources, one array of doubles per event, indexed by resource position.
+        Unrecorded timestamps are NaN.
+
+        Args:
+            count (int): Number of resources
+        """
+        self.count = count
+        self.timestamps: dict[str, array] = {event: array("d", [math.nan]) * count for event in LIFECYCLE_EVENTS}
+
+    def record(self, event: str, index: int, timestamp: Optional[float] = None) -> None:
+        """
+        Record the time of a lifecycle event of the resource at index
+
+        Args:
+            event (str): Lifecycle event, eg: CREATE_REQUEST
+            index (int): Position of the resource
+            timestamp (float, optional): Time of the event, defaults to now
+        """
+        self.timestamps[event][index] = time.time() if timestamp is None else timestamp
+
+    def latencies(self, start_event: str, end_event: str) -> list[float]:
+        """
+        Durations between two lifecycle events, for resources where both were recorded
+        """
+        return [
+            end - start
+            for start, end in zip(self.timestamps[start_event], self.timestamps[end_event])
+            if not (math.isnan(start) or math.isnan(end))
+        ]
+
+    def percentiles(self, phase: str, percentiles: tuple[float, ...] = PERCENTILES) -> dict[str, float]:
+        """
+        Latency percentiles of a phase
+
+        Args:
+            phase (str): One of PHASES, eg: "deploy"
+            percentiles (tuple): Percentiles to compute
+
+        Returns:
+            dict: count, p<percentile> and max latency in seconds, empty if nothing was recorded
+        """
+        values = sorted(self.latencies(*PHASES[phase]))
+        if not values:
+            return {}
+        result: dict[str, float] = {"count": len(values)}
+        for percent in percentiles:
+            result[f"p{percent:g}"] = percentile(sorted_values=values, percent=percent)
+        result["max"] = values[-1]
+        return result
+
+    def throughput(self, phase: str, bucket_seconds: float = 1.0) -> dict[str, Any]:
+        """
+        Number of resources completing a phase per time bucket, starting when the phase started
+
+        Args:
+            phase (str): One of PHASES, eg: "deploy"
+            bucket_seconds (float): Width of each time bucket
+
+        Returns:
+            dict: start time, bucket_seconds and counts per bucket, empty if nothing was recorded
+        """
+        start_event, end_event = PHASES[phase]
+        starts = [value for value in self.timestamps[start_event] if not math.isnan(value)]
+        ends = [value for value in self.timestamps[end_event] if not math.isnan(value)]
+        if not starts or not ends:
+            return {}
+        start = min(starts)
+        counts = [0] * (int((max(ends) - start) // bucket_seconds) + 1)
+        for end in ends:
+            counts[max(0, int((end - start) // bucket_seconds))] += 1
+        return {"start": start, "bucket_seconds": bucket_seconds, "counts": counts}
+
+    def statistics(self, phases: Optional[tuple[str, ...]] = None, bucket_seconds: float = 1.0) -> dict[str, Any]:
+        """
+        Latency percentiles and throughput of each phase
+
+        Args:
+            phases (tuple, optional): Phases to include, defaults to all PHASES
+            bucket_seconds (float): Width of each throughput time bucket
+
+        Returns:
+            dict: {phase: {"latency": percentiles, "throughput": throughput}} for phases with recorded data
+        """
+        result: dict[str, Any] = {}
+        for phase in phases or tuple(PHASES):
+            latency = self.percentiles(phase=phase)
+            if latency:
+                result[phase] = {
+                    "latency": latency,
+                    "throughput": self.throughput(phase=phase, bucket_seconds=bucket_seconds),
+                }
+        return result
@@ -0,0 +1,107 @@
+import asyncio
+from contextlib import AsyncExitStack
+
+import pytest
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.aio.scale import AsyncScaleResources
+from ocp_scale_utilities.aio.utils import (
+    async_delete_resources,
+    async_deploy_resources,
+    async_deploy_resources_wait_for_status,
+    async_wait_deleted_resources,
+    async_wait_for_resources_status,
+)
+from ocp_scale_utilities.exceptions import ThreadedResourcesError
+from ocp_scale_utilities.retry import RetryPolicy
+
+
+def get_pods(client, count, prefix="test-aio-pod"):
+    return [
+        Pod(
+            name=f"{prefix}-{index}",
+            namespace="test-aio-namespace",
+            client=client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 0.5})], indirect=True)
+def test_async_deploy_wait_delete(fake_apiserver, fake_admin_client):
+    pods = get_pods(client=fake_admin_client, count=10)
+
+    async def _run():
+        await async_deploy_resources(resources=pods, max_concurrency=4)
+        await async_wait_for_resources_status(resources=pods, status=Pod.Status.RUNNING, poll_interval=0.1)
+        await async_delete_resources(resources=pods, max_concurrency=4)
+        return await async_wait_deleted_resources(resources=pods, poll_interval=0.1)
+
+    assert asyncio.run(_run()) == [True] * len(pods)
+    assert not fake_apiserver.get_objects(plural="pods", namespace="test-aio-namespace")
+
+
+def test_async_deploy_aggregates_failures(fake_apiserver, fake_admin_client):
+    pods = get_pods(client=fake_admin_client, count=4)
+    fake_apiserver.inject_errors(method="create", count=1, code=500)
+    with pytest.raises(ThreadedResourcesError) as exc_info:
+        asyncio.run(async_deploy_resources(resources=pods, retry_policy=None))
+    assert len(exc_info.value.failed_resources) == 1
+    assert len(fake_apiserver.get_objects(plural="pods", namespace="test-aio-namespace")) == len(pods) - 1
+    asyncio.run(async_delete_resources(resources=pods))
+
+
+@pytest.mark.parametrize("watch", [False, True])
+def test_async_deploy_resources_wait_for_status_aggregates_failures(fake_apiserver, fake_admin_client, watch):
+    pods = get_pods(client=fake_admin_client, count=4, prefix=f"test-aio-pipeline-{str(watch).lower()}")
+    fake_apiserver.inject_errors(method="create", count=1, code=500)
+
+    async def _run():
+        async with AsyncExitStack() as exit_stack:
+            await async_deploy_resources_wait_for_status(
+                resources=pods,
+                status=Pod.Status.RUNNING,
+                timeout=10,
+                exit_stack=exit_stack,
+                watch=watch,
+                retry_policy=None,
+                poll_interval=0.1,
+            )
+
+    with pytest.raises(ThreadedResourcesError) as exc_info:
+        asyncio.run(_run())
+    assert len(exc_info.value.failed_resources) == 1
+    assert len(exc_info.value.results) == len(pods)
+    # Deployed resources are unwound by the exit stack
+    assert not fake_apiserver.get_objects(plural="pods", namespace="test-aio-namespace")
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 0.5})], indirect=True)
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_async_scale_resources(fake_apiserver, fake_admin_client, pipeline):
+    pods = get_pods(client=fake_admin_client, count=20)
+    fake_apiserver.inject_errors(method="create", count=2, code=429, retry_after="0")
+
+    async def _run():
+        async with AsyncScaleResources(
+            resources=pods,
+            wait_for_status=Pod.Status.RUNNING,
+            max_concurrency=8,
+            pipeline=pipeline,
+            watch_status=True,
+            retry_policy=RetryPolicy(base_delay=0.01),
+        ) as scale:
+            assert len(fake_apiserver.get_objects(plural="pods", namespace="test-aio-namespace")) == len(pods)
+            return scale
+
+    scale = asyncio.run(_run())
+    assert not fake_apiserver.get_objects(plural="pods", namespace="test-aio-namespace")
+    statistics = scale.statistics()
+    assert statistics["ready"]["latency"]["count"] == len(pods)
+    assert statistics["delete"]["latency"]["count"] == len(pods)
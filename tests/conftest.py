@@ -8,6 +8,7 @@ from pathlib import Path
 from ocp_resources.namespace import Namespace
 
 from ocp_resources.resource import get_client
+from tests.fake_apiserver import FakeAPIServer
 from tests.utils import bash, get_crc_status
 
 
@@ -103,3 +104,14 @@ def crc_scale_developer_client(running_crc_kubeconfig, scale_client_configuratio
         config_file=running_crc_kubeconfig,
         context="crc-developer",
     )
+
+
+@pytest.fixture(scope="module")
+def fake_apiserver(request):
+    with FakeAPIServer(**getattr(request, "param", {})) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def fake_admin_client(fake_apiserver, tmp_path_factory):
+    return fake_apiserver.client(cache_file=str(tmp_path_factory.mktemp("discovery") / "cache.json"))
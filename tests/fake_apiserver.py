@@ -0,0 +1,534 @@
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+import kubernetes
+from kubernetes.dynamic import DynamicClient
+
+LOGGER = logging.getLogger(__name__)
+
+# plural: (kind, namespaced, initial phase, ready phase)
+RESOURCES: dict[str, tuple[str, bool, Optional[str], Optional[str]]] = {
+    "namespaces": ("Namespace", False, "Active", "Active"),
+    "pods": ("Pod", True, "Pending", "Running"),
+    "configmaps": ("ConfigMap", True, None, None),
+}
+
+
+def timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def status_body(code: int, reason: str, message: str) -> dict[str, Any]:
+    return {
+        "kind": "Status",
+        "apiVersion": "v1",
+        "metadata": {},
+        "status": "Failure",
+        "message": message,
+        "reason": reason,
+        "code": code,
+    }
+
+
+def match_label_selector(obj: dict[str, Any], label_selector: Optional[str]) -> bool:
+    if not label_selector:
+        return True
+    labels = obj["metadata"].get("labels") or {}
+    for requirement in label_selector.split(","):
+        key, _, value = requirement.replace("==", "=").partition("=")
+        if labels.get(key) != value:
+            return False
+    return True
+
+
+def get_fake_client(
+    host: str, cache_file: Optional[str] = None, connection_pool_maxsize: Optional[int] = None
+) -> DynamicClient:
+    """
+    Client of a fake apiserver at host, which may run in another process
+    """
+    configuration = kubernetes.client.Configuration()
+    configuration.host = host
+    if connection_pool_maxsize:
+        configuration.connection_pool_maxsize = connection_pool_maxsize
+    return DynamicClient(client=kubernetes.client.ApiClient(configuration=configuration), cache_file=cache_file)
+
+
+def write_fake_kubeconfig(host: str, path: str) -> str:
+    """
+    Write a kubeconfig pointing at a fake apiserver at host, which may run in another process
+
+    Returns:
+        str: path
+    """
+    kubeconfig = {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "clusters": [{"name": "fake", "cluster": {"server": host}}],
+        "users": [{"name": "fake", "user": {}}],
+        "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "fake"}}],
+        "current-context": "fake",
+    }
+    with open(path, "w") as kubeconfig_file:
+        json.dump(kubeconfig, kubeconfig_file)
+    return path
+
+
+class FakeAPIServer:
+    def __init__(
+        self,
+        ready_delay: float = 0.0,
+        delete_delay: float = 0.0,
+        event_history: int = 100000,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: Optional[str] = "1",
+        seed: Optional[int] = None,
+    ):
+        """
+        Minimal in-process stand-in for the kube apiserver, serving core/v1 Namespaces, Pods and ConfigMaps
+
+        Args:
+            ready_delay (float): Seconds before a created object moves to its ready phase
+            delete_delay (float): Seconds a deleted object lingers with a deletionTimestamp
+            event_history (int): Number of watch events retained before watches receive 410 Gone
+            latency (float): Seconds added before answering each request
+            error_rate (float): Fraction of creates and deletes failing with 500, besides inject_errors()
+            throttle_rate (float): Fraction of creates and deletes failing with 429, besides inject_errors()
+            retry_after (str, optional): Retry-After header of throttled requests
+            seed (int, optional): Seed of the random error and throttle draws
+        """
+        self.ready_delay = ready_delay
+        self.delete_delay = delete_delay
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+
+        self.condition = threading.Condition()
+        self.resource_version = 0
+        self.objects: dict[tuple[str, Optional[str]], dict[str, dict[str, Any]]] = {}
+        self.events: deque[tuple[int, str, str, Optional[str], dict[str, Any]]] = deque(maxlen=event_history)
+        self.requests: Counter = Counter()
+        self.stopped = False
+
+        self._scheduled: list[tuple[float, int, str, str, Optional[str], str]] = []
+        self._scheduled_count = 0
+        self._errors: dict[str, deque[tuple[int, Optional[str], bool]]] = {}
+        self._scheduler = threading.Thread(target=self._run_scheduler, daemon=True)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._server_thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self) -> FakeAPIServer:
+        self._scheduler.start()
+        self._server_thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> FakeAPIServer:
+        return self.start()
+
+    def __exit__(self, *exc_arguments: Any) -> None:
+        self.stop()
+
+    def client(self, cache_file: Optional[str] = None, connection_pool_maxsize: Optional[int] = None) -> DynamicClient:
+        return get_fake_client(host=self.host, cache_file=cache_file, connection_pool_maxsize=connection_pool_maxsize)
+
+    def write_kubeconfig(self, path: str) -> str:
+        """
+        Write a kubeconfig pointing at the server, for clients built by get_client() in other processes
+
+        Returns:
+            str: path
+        """
+        return write_fake_kubeconfig(host=self.host, path=path)
+
+    def inject_errors(
+        self, method: str, count: int, code: int = 429, retry_after: Optional[str] = None, applied: bool = False
+    ) -> None:
+        """
+        Fail the next count requests of method
+
+        Args:
+            method (str): Request counter key, eg: "create", "delete"
+            count (int): Number of requests to fail
+            code (int): HTTP status returned
+            retry_after (str, optional): Retry-After header returned
+            applied (bool): Process the request before failing it, as when a response is lost
+        """
+        with self.condition:
+            self._errors.setdefault(method, deque()).extend([(code, retry_after, applied)] * count)
+
+    def take_error(self, method: str) -> Optional[tuple[int, Optional[str], bool]]:
+        with self.condition:
+            errors = self._errors.get(method)
+            if errors:
+                return errors.popleft()
+            if self.throttle_rate or self.error_rate:
+                draw = self._random.random()
+                if draw < self.throttle_rate:
+                    self.requests[f"{method}-throttled"] += 1
+                    return 429, self.retry_after, False
+                if draw < self.throttle_rate + self.error_rate:
+                    self.requests[f"{method}-failed"] += 1
+                    return 500, None, False
+            return None
+
+    def get_objects(self, plural: str, namespace: Optional[str] = None) -> dict[str, dict[str, Any]]:
+        with self.condition:
+            return dict(self.objects.get((plural, namespace), {}))
+
+    # State changes, called with self.condition held
+
+    def _record(self, event_type: str, plural: str, namespace: Optional[str], obj: dict[str, Any]) -> None:
+        self.resource_version += 1
+        obj["metadata"]["resourceVersion"] = str(self.resource_version)
+        self.events.append((self.resource_version, event_type, plural, namespace, json.loads(json.dumps(obj))))
+        self.condition.notify_all()
+
+    def _schedule(self, delay: float, action: str, plural: str, namespace: Optional[str], name: str) -> None:
+        self._scheduled_count += 1
+        heapq.heappush(
+            self._scheduled, (time.monotonic() + delay, self._scheduled_count, action, plural, namespace, name)
+        )
+        self.condition.notify_all()
+
+    def _remove(self, plural: str, namespace: Optional[str], name: str) -> None:
+        obj = self.objects.get((plural, namespace), {}).pop(name, None)
+        if obj:
+            self._record(event_type="DELETED", plural=plural, namespace=namespace, obj=obj)
+        if plural == "namespaces":
+            for _plural in RESOURCES:
+                for _name in list(self.objects.get((_plural, name), {})):
+                    self._remove(plural=_plural, namespace=name, name=_name)
+
+    def _run_scheduler(self) -> None:
+        with self.condition:
+            while not self.stopped:
+                now = time.monotonic()
+                while self._scheduled and self._scheduled[0][0] <= now:
+                    _, _, action, plural, namespace, name = heapq.heappop(self._scheduled)
+                    obj = self.objects.get((plural, namespace), {}).get(name)
+                    if not obj:
+                        continue
+                    if action == "ready":
+                        obj["status"]["phase"] = RESOURCES[plural][3]
+                        self._record(event_type="MODIFIED", plural=plural, namespace=namespace, obj=obj)
+                    elif action == "remove":
+                        self._remove(plural=plural, namespace=namespace, name=name)
+                self.condition.wait(timeout=(self._scheduled[0][0] - now) if self._scheduled else None)
+
+    def create(self, plural: str, namespace: Optional[str], body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        kind, _, initial_phase, ready_phase = RESOURCES[plural]
+        name = body["metadata"]["name"]
+        with self.condition:
+            objects = self.objects.setdefault((plural, namespace), {})
+            if name in objects:
+                return 409, status_body(code=409, reason="AlreadyExists", message=f'{plural} "{name}" already exists')
+            obj = dict(body)
+            obj["kind"], obj["apiVersion"] = kind, "v1"
+            obj["metadata"] = dict(body["metadata"], uid=str(uuid.uuid4()), creationTimestamp=timestamp())
+            if namespace:
+                obj["metadata"]["namespace"] = namespace
+            if initial_phase:
+                obj["status"] = {"phase": initial_phase}
+            objects[name] = obj
+            self._record(event_type="ADDED", plural=plural, namespace=namespace, obj=obj)
+            if ready_phase and ready_phase != initial_phase:
+                self._schedule(delay=self.ready_delay, action="ready", plural=plural, namespace=namespace, name=name)
+            return 201, obj
+
+    def delete(self, plural: str, namespace: Optional[str], name: str) -> tuple[int, dict[str, Any]]:
+        with self.condition:
+            obj = self.objects.get((plural, namespace), {}).get(name)
+            if not obj:
+                return 404, status_body(code=404, reason="NotFound", message=f'{plural} "{name}" not found')
+            if self.delete_delay:
+                if not obj["metadata"].get("deletionTimestamp"):
+                    obj["metadata"]["deletionTimestamp"] = timestamp()
+                    self._record(event_type="MODIFIED", plural=plural, namespace=namespace, obj=obj)
+                    self._schedule(
+                        delay=self.delete_delay, action="remove", plural=plural, namespace=namespace, name=name
+                    )
+            else:
+                self._remove(plural=plural, namespace=namespace, name=name)
+            return 200, obj
+
+    def list(
+        self,
+        plural: str,
+        namespace: Optional[str],
+        label_selector: Optional[str],
+        limit: Optional[int],
+        _continue: Optional[str],
+    ) -> dict[str, Any]:
+        with self.condition:
+            if namespace or RESOURCES[plural][1] is False:
+                objects = self.objects.get((plural, namespace), {})
+                items = [objects[name] for name in sorted(objects)]
+            else:
+                items = [
+                    objects[name]
+                    for (_plural, _), objects in sorted(self.objects.items(), key=lambda item: str(item[0]))
+                    if _plural == plural
+                    for name in sorted(objects)
+                ]
+            items = [item for item in items if match_label_selector(obj=item, label_selector=label_selector)]
+            offset = int(_continue or 0)
+            metadata: dict[str, Any] = {"resourceVersion": str(self.resource_version)}
+            if limit and offset + limit < len(items):
+                metadata["continue"] = str(offset + limit)
+                items = items[offset : offset + limit]
+            else:
+                items = items[offset:]
+            return {
+                "kind": f"{RESOURCES[plural][0]}List",
+                "apiVersion": "v1",
+                "metadata": metadata,
+                "items": json.loads(json.dumps(items)),
+            }
+
+    def delete_collection(
+        self, plural: str, namespace: Optional[str], label_selector: Optional[str]
+    ) -> tuple[int, dict[str, Any]]:
+        body = self.list(plural=plural, namespace=namespace, label_selector=label_selector, limit=None, _continue=None)
+        for item in body["items"]:
+            self.delete(plural=plural, namespace=namespace, name=item["metadata"]["name"])
+        return 200, body
+
+    def watch_events(
+        self,
+        plural: str,
+        namespace: Optional[str],
+        label_selector: Optional[str],
+        resource_version: int,
+        timeout: float,
+    ) -> Any:
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            while not self.stopped and time.monotonic() < deadline:
+                if self.events and resource_version < self.events[0][0] - 1:
+                    yield {"type": "ERROR", "object": status_body(code=410, reason="Expired", message="too old")}
+                    return
+                matched = [
+                    (_resource_version, event_type, obj)
+                    for _resource_version, event_type, _plural, _namespace, obj in self.events
+                    if _resource_version > resource_version
+                    and _plural == plural
+                    and (namespace is None or _namespace == namespace)
+                    and match_label_selector(obj=obj, label_selector=label_selector)
+                ]
+                resource_version = self.resource_version
+                if matched:
+                    self.condition.release()
+                    try:
+                        for _, event_type, obj in matched:
+                            yield {"type": event_type, "object": obj}
+                    finally:
+                        self.condition.acquire()
+                else:
+                    self.condition.wait(timeout=max(0.0, deadline - time.monotonic()))
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                LOGGER.debug(format % args)
+
+            def _send(self, code: int, body: Any, headers: Optional[dict[str, str]] = None) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _read_body(self) -> dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+            def _route(self) -> tuple[Optional[str], Optional[str], Optional[str], dict[str, list[str]]]:
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                parts = [part for part in url.path.split("/") if part]
+                if parts[:2] != ["api", "v1"] or len(parts) < 3:
+                    return None, None, None, query
+                parts = parts[2:]
+                if len(parts) <= 2:
+                    return parts[0], None, parts[1] if len(parts) == 2 else None, query
+                return parts[2], parts[1], parts[3] if len(parts) == 4 else None, query
+
+            def _discovery(self) -> bool:
+                path = urlparse(self.path).path.rstrip("/")
+                if path == "/version":
+                    self._send(code=200, body={"major": "1", "minor": "30", "gitVersion": "v1.30.0"})
+                elif path == "/api":
+                    self._send(code=200, body={"kind": "APIVersions", "versions": ["v1"]})
+                elif path == "/apis":
+                    self._send(code=200, body={"kind": "APIGroupList", "apiVersion": "v1", "groups": []})
+                elif path == "/api/v1":
+                    self._send(
+                        code=200,
+                        body={
+                            "kind": "APIResourceList",
+                            "groupVersion": "v1",
+                            "resources": [
+                                {
+                                    "name": plural,
+                                    "singularName": kind.lower(),
+                                    "namespaced": namespaced,
+                                    "kind": kind,
+                                    "verbs": ["create", "delete", "deletecollection", "get", "list", "watch"],
+                                }
+                                for plural, (kind, namespaced, _, _) in RESOURCES.items()
+                            ],
+                        },
+                    )
+                else:
+                    return False
+                return True
+
+            def _watch(self, plural: str, namespace: Optional[str], query: dict[str, list[str]]) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for event in server.watch_events(
+                        plural=plural,
+                        namespace=namespace,
+                        label_selector=query.get("labelSelector", [None])[0],
+                        resource_version=int(query.get("resourceVersion", ["0"])[0] or 0),
+                        timeout=float(query.get("timeoutSeconds", ["60"])[0]),
+                    ):
+                        data = json.dumps(event).encode() + b"\n"
+                        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                        self.wfile.flush()
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+            def do_GET(self) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                server.requests["get"] += 1
+                if self._discovery():
+                    return
+                plural, namespace, name, query = self._route()
+                if plural not in RESOURCES:
+                    self._send(code=404, body=status_body(code=404, reason="NotFound", message=self.path))
+                elif query.get("watch", ["false"])[0] in ("true", "True", "1"):
+                    server.requests["watch"] += 1
+                    self._watch(plural=plural, namespace=namespace, query=query)
+                elif name:
+                    obj = server.get_objects(plural=plural, namespace=namespace).get(name)
+                    if obj:
+                        self._send(code=200, body=obj)
+                    else:
+                        self._send(
+                            code=404,
+                            body=status_body(code=404, reason="NotFound", message=f'{plural} "{name}" not found'),
+                        )
+                else:
+                    server.requests["list"] += 1
+                    self._send(
+                        code=200,
+                        body=server.list(
+                            plural=plural,
+                            namespace=namespace,
+                            label_selector=query.get("labelSelector", [None])[0],
+                            limit=int(query["limit"][0]) if "limit" in query else None,
+                            _continue=query.get("continue", [None])[0],
+                        ),
+                    )
+
+            def _send_injected_error(self, method: str, apply: Callable[[], Any]) -> bool:
+                error = server.take_error(method=method)
+                if not error:
+                    return False
+                code, retry_after, applied = error
+                if applied:
+                    apply()
+                self._send(
+                    code=code,
+                    body=status_body(code=code, reason="Injected", message=f"injected {method} error"),
+                    headers={"Retry-After": retry_after} if retry_after else None,
+                )
+                return True
+
+            def do_POST(self) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                server.requests["create"] += 1
+                plural, namespace, _, _ = self._route()
+                body = self._read_body()
+                if plural not in RESOURCES:
+                    self._send(code=404, body=status_body(code=404, reason="NotFound", message=self.path))
+                    return
+                if self._send_injected_error(
+                    method="create", apply=lambda: server.create(plural=plural, namespace=namespace, body=body)
+                ):
+                    return
+                code, response = server.create(plural=plural, namespace=namespace, body=body)
+                self._send(code=code, body=response)
+
+            def do_DELETE(self) -> None:
+                if server.latency:
+                    time.sleep(server.latency)
+                plural, namespace, name, query = self._route()
+                self._read_body()
+                if plural not in RESOURCES:
+                    self._send(code=404, body=status_body(code=404, reason="NotFound", message=self.path))
+                    return
+                if name:
+                    server.requests["delete"] += 1
+                    if self._send_injected_error(
+                        method="delete", apply=lambda: server.delete(plural=plural, namespace=namespace, name=name)
+                    ):
+                        return
+                    code, response = server.delete(plural=plural, namespace=namespace, name=name)
+                else:
+                    server.requests["deletecollection"] += 1
+                    delete_collection = partial(
+                        server.delete_collection,
+                        plural=plural,
+                        namespace=namespace,
+                        label_selector=query.get("labelSelector", [None])[0],
+                    )
+                    if self._send_injected_error(method="deletecollection", apply=delete_collection):
+                        return
+                    code, response = delete_collection()
+                self._send(code=code, body=response)
+
+        return Handler
@@ -62,14 +62,16 @@ def setup_log_queue_listener(request):
                 ("basic", logging.WARNING, "hello world"),
                 ("basic", logging.WARNING, "hello world"),
             ],
+            # Duplicates are dropped by the listener, caplog sees every record logged
             "caplog_expected": [
-                ("root", logging.INFO, "blah blah blah"),
+                *[("root", logging.INFO, "blah blah blah")] * 10,
                 (
                     "root",
                     logging.ERROR,
                     "wah wah wah wah --- [DuplicateFilter: Last log `blah blah blah` repeated 9 times]",
                 ),
                 ("root", logging.CRITICAL, "you should hear this"),
+                *[("basic", logging.WARNING, "hello world")] * 3,
             ],
             "file_expected": [
                 "root \x1b[32mINFO\x1b[0m blah blah blah",
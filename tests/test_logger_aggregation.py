@@ -0,0 +1,134 @@
+import gzip
+import json
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.logger import (
+    GzipRotatingFileHandler,
+    LogAggregator,
+    get_message_template,
+    resource_extra,
+    setup_logging,
+)
+
+
+@pytest.mark.parametrize(
+    "message, template",
+    [
+        pytest.param("waiting for VM x-1234 to be Running", "waiting for VM <name> to be Running", id="name"),
+        pytest.param("Deploy Pod pod-3 retry 2/5 in 1.2s", "Deploy Pod <name> retry <n>/<n> in <n>", id="numbers"),
+        pytest.param("Status of vm-1 is Running", "Status of <name> is Running", id="status"),
+    ],
+)
+def test_get_message_template(message, template):
+    assert get_message_template(message=message) == template
+
+
+def test_log_aggregator():
+    aggregator = LogAggregator(interval=60, samples=2)
+    records = [
+        logging.makeLogRecord({"name": "root", "levelno": logging.INFO, "msg": f"waiting for VM x-{index}"})
+        for index in range(100)
+    ]
+    assert [aggregator.filter(record=record) for record in records].count(True) == 2
+    assert aggregator.filter(
+        record=logging.makeLogRecord({"name": "root", "levelno": logging.WARNING, "msg": "waiting for VM x-1"})
+    )
+    assert not aggregator.summaries()
+
+    summaries = aggregator.summaries(force=True)
+    assert len(summaries) == 1
+    assert summaries[0].getMessage().startswith("100 × waiting for VM <name> in the last")
+    assert not aggregator.summaries(force=True)
+
+
+def test_setup_logging_aggregate(tmp_path):
+    log_file = str(tmp_path / "aggregate.log")
+    log_listener = setup_logging(log_file=log_file, aggregate_interval=60)
+    logger = logging.getLogger("test_setup_logging_aggregate")
+    try:
+        for index in range(1500):
+            logger.info(f"waiting for VM x-{index} to be Running")
+        logger.error("VM x-1 failed")
+    finally:
+        log_listener.stop()
+        for _logger in (logging.getLogger(), logging.getLogger("basic")):
+            for handler in list(_logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    _logger.removeHandler(handler)
+
+    with open(log_file) as file:
+        log_data = file.readlines()
+    assert len(log_data) == 3
+    assert "waiting for VM x-0 to be Running" in log_data[0]
+    assert "VM x-1 failed" in log_data[1]
+    assert "1,500 × waiting for VM <name> to be Running in the last" in log_data[2]
+
+
+def test_setup_logging_json_lines(tmp_path):
+    json_log_file = str(tmp_path / "run.jsonl.gz")
+    log_listener = setup_logging(json_log_file=json_log_file, json_log_file_max_bytes=2000)
+    logger = logging.getLogger("test_setup_logging_json_lines")
+    pod = Pod(name="pod-1", namespace="test-namespace", client=object())
+    try:
+        logger.info("Deployed", extra=resource_extra(resource=pod))
+        for index in range(20):
+            logger.warning(f"Message {index}")
+    finally:
+        log_listener.stop()
+        for _logger in (logging.getLogger(), logging.getLogger("basic")):
+            for handler in list(_logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    _logger.removeHandler(handler)
+
+    log_files = [json_log_file, str(tmp_path / "run.jsonl.1.gz")]
+    entries = []
+    for log_file in reversed(log_files):
+        with gzip.open(log_file, "rt") as file:
+            entries.extend(json.loads(line) for line in file)
+    assert len(entries) == 21
+    assert entries[0]["message"] == "Deployed"
+    assert entries[0]["resource_kind"] == "Pod"
+    assert entries[0]["resource_name"] == "pod-1"
+    assert entries[0]["resource_namespace"] == "test-namespace"
+    assert entries[0]["logger"] == "test_setup_logging_json_lines"
+    assert entries[0]["level"] == "INFO"
+    assert entries[0]["thread"] == "MainThread"
+    assert entries[-1]["message"] == "Message 19"
+
+
+def test_gzip_rotating_file_handler_encoded_bytes(tmp_path):
+    log_file = str(tmp_path / "run.jsonl.gz")
+    message = "é" * 99
+    handler = GzipRotatingFileHandler(filename=log_file, max_bytes=1000)
+    try:
+        for _ in range(6):
+            handler.emit(logging.makeLogRecord({"msg": message}))
+    finally:
+        handler.close()
+
+    with gzip.open(str(tmp_path / "run.jsonl.1.gz"), "rt", encoding="utf-8") as file:
+        assert len(file.readlines()) == 5
+    with gzip.open(log_file, "rt", encoding="utf-8") as file:
+        assert len(file.readlines()) == 1
+
+
+def test_gzip_rotating_file_handler_append(tmp_path):
+    log_file = str(tmp_path / "run.jsonl.gz")
+    message = "x" * 199
+    for bytes_written in (0, 600):
+        handler = GzipRotatingFileHandler(filename=log_file, max_bytes=1000)
+        try:
+            assert handler.bytes_written == bytes_written
+            for _ in range(3):
+                handler.emit(logging.makeLogRecord({"msg": message}))
+        finally:
+            handler.close()
+
+    with gzip.open(str(tmp_path / "run.jsonl.1.gz"), "rt") as file:
+        assert len(file.readlines()) == 5
+    with gzip.open(log_file, "rt") as file:
+        assert len(file.readlines()) == 1
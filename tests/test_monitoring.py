@@ -0,0 +1,172 @@
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from ocp_resources.datavolume import DataVolume
+from ocp_resources.virtual_machine import VirtualMachine
+
+from ocp_scale_utilities.monitoring import (
+    SAMPLE_INTERVAL,
+    MonitorResourceAPIServerRequests,
+    MonitorResourcesAPIServerRequests,
+    PrometheusDataCollector,
+    get_range_step,
+    load_collected_data,
+    query_range,
+)
+
+
+class FakePrometheus:
+    def __init__(self, range_values, instant_values=None, resource="virtualmachines"):
+        """
+        Prometheus answering range queries with range_values and instant queries with instant_values in turn,
+        values being either a list of a single resource or a dict of lists per resource
+        """
+        self.api_v1 = "/api/v1"
+        self.range_values = range_values if isinstance(range_values, dict) else {resource: range_values}
+        self.instant_values = list(instant_values or [])
+        self.resource = resource
+        self.range_queries = []
+        self.instant_queries = 0
+
+    def _get_response(self, query):
+        url = urlparse(query)
+        assert url.path == "/api/v1/query_range"
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.range_queries.append(params)
+        start = float(params["start"])
+        result = [
+            {
+                "metric": {"resource": resource},
+                "values": [[start + index * float(params["step"]), str(value)] for index, value in enumerate(values)],
+            }
+            for resource, values in self.range_values.items()
+            if values
+        ]
+        return {"status": "success", "data": {"result": result}}
+
+    def query_sampler(self, query):
+        self.instant_queries += 1
+        values = self.instant_values.pop(0)
+        if not isinstance(values, dict):
+            values = {self.resource: values}
+        return [
+            {"metric": {"resource": resource}, "value": [time.time(), str(value)]} for resource, value in values.items()
+        ]
+
+
+def test_query_range():
+    prometheus = FakePrometheus(range_values=[1, 2])
+    result = query_range(prometheus=prometheus, query='sum(rate(x{group="a"}[5m]))', start=100, end=110)
+    assert [value for _, value in result[0]["values"]] == ["1", "2"]
+    assert prometheus.range_queries == [
+        {"query": 'sum(rate(x{group="a"}[5m]))', "start": "100", "end": "110", "step": "5"}
+    ]
+
+
+def test_wait_for_idle_quiet_window():
+    prometheus = FakePrometheus(range_values=[0.1] * 7)
+    monitor = MonitorResourceAPIServerRequests(
+        prometheus=prometheus, resource_class=VirtualMachine, idle_requests_value=1
+    )
+    start_time = time.monotonic()
+    monitor.wait_for_idle()
+    assert time.monotonic() - start_time < 1
+    assert len(prometheus.range_queries) == 1
+    assert prometheus.instant_queries == 0
+
+
+@pytest.mark.parametrize("range_values", [pytest.param([0.1] * 4 + [5] * 3, id="recent-noise")])
+def test_wait_for_idle_recent_noise(range_values):
+    prometheus = FakePrometheus(range_values=range_values, instant_values=[0.5])
+    monitor = MonitorResourceAPIServerRequests(
+        prometheus=prometheus, resource_class=VirtualMachine, idle_requests_value=1
+    )
+    monitor.wait_for_idle()
+    # Noise already seen, only live sampling until idle
+    assert prometheus.instant_queries == 1
+
+
+def test_multiple_resources_query():
+    monitor = MonitorResourcesAPIServerRequests(
+        prometheus=FakePrometheus(range_values=[]),
+        idle_requests_values={VirtualMachine: 1, DataVolume: 2},
+        time_duration_seconds=60,
+    )
+    assert monitor.apiserver_requests_query == (
+        "sum by (resource) (rate(apiserver_request_total{"
+        'group=~"cdi\\\\.kubevirt\\\\.io|kubevirt\\\\.io",resource=~"datavolumes|virtualmachines"'
+        "}[60s]))"
+    )
+
+
+def test_multiple_resources_quiet_window():
+    prometheus = FakePrometheus(range_values={"virtualmachines": [0.5] * 7, "datavolumes": [1.5] * 7})
+    monitor = MonitorResourcesAPIServerRequests(
+        prometheus=prometheus, idle_requests_values={VirtualMachine: 1, DataVolume: 2}
+    )
+    monitor.wait_for_idle()
+    assert len(prometheus.range_queries) == 1
+    assert prometheus.instant_queries == 0
+
+
+def test_multiple_resources_one_noisy():
+    prometheus = FakePrometheus(
+        range_values={"virtualmachines": [0.5] * 7, "datavolumes": [1.5] * 4 + [5] * 3},
+        instant_values=[{"virtualmachines": 0.5, "datavolumes": 3}, {"virtualmachines": 0.5}],
+    )
+    monitor = MonitorResourcesAPIServerRequests(
+        prometheus=prometheus, idle_requests_values={VirtualMachine: 1, DataVolume: 2}
+    )
+    monitor.wait_for_idle()
+    # Idle only once every resource is below its value, a resource without requests being idle
+    assert prometheus.instant_queries == 2
+
+
+def test_calibrate():
+    prometheus = FakePrometheus(range_values={"virtualmachines": [1, 3] * 30, "datavolumes": [0.0] * 60})
+    monitor = MonitorResourcesAPIServerRequests(
+        prometheus=prometheus, idle_requests_values={VirtualMachine: 100, DataVolume: 100}
+    )
+    baseline = monitor.calibrate(sigmas=2)
+    assert baseline["virtualmachines"] == {"mean": 2, "stdev": 1, "idle_value": 4, "tolerance": 2}
+    assert baseline["datavolumes"]["idle_value"] == 0.1
+    assert monitor.idle_requests_values == {"virtualmachines": 4, "datavolumes": 0.1}
+
+
+def test_wait_for_settle(monkeypatch):
+    monkeypatch.setattr("ocp_scale_utilities.monitoring.SAMPLE_INTERVAL", 0.01)
+    prometheus = FakePrometheus(range_values=[], instant_values=[5, 0.9, 0.2, 0.2, 0.1, 0.2, 0.1, 0.2, 0.1, 0.1])
+    monitor = MonitorResourceAPIServerRequests(
+        prometheus=prometheus, resource_class=VirtualMachine, idle_requests_value=1
+    )
+    result = monitor.wait_for_settle(window=4)
+    # Below the idle value from the second sample, settled once the EWMA catches up and the window is steady
+    assert result["samples"] == prometheus.instant_queries < 10
+    assert result["ewma"]["virtualmachines"] < 1
+    assert result["settle_seconds"] > 0
+
+
+def test_prometheus_data_collector(tmp_path):
+    prometheus = FakePrometheus(range_values={"virtualmachines": [1, 2, 3], "datavolumes": [4]})
+    collector = PrometheusDataCollector(
+        prometheus=prometheus, output_dir=str(tmp_path), queries={"first": "up", "second": "down"}
+    )
+    index = collector.collect(id="post-enter", start_time=1000, end_time=1000 + 7200)
+    # Two hours at 1000 points per series
+    assert index["step"] == 8
+    assert sorted(params["query"] for params in prometheus.range_queries) == ["down", "up"]
+    assert {params["step"] for params in prometheus.range_queries} == {"8"}
+
+    data = load_collected_data(directory=str(tmp_path / "post-enter"))
+    assert sorted(data) == ["first", "second"]
+    virtualmachines, datavolumes = data["first"]
+    assert virtualmachines["metric"] == {"resource": "virtualmachines"}
+    assert list(virtualmachines["timestamps"]) == [1000, 1008, 1016]
+    assert list(virtualmachines["values"]) == [1, 2, 3]
+    assert list(datavolumes["values"]) == [4]
+
+
+def test_get_range_step():
+    assert get_range_step(start=0, end=60) == SAMPLE_INTERVAL
+    assert get_range_step(start=0, end=86400, max_points=1000) == 87
@@ -0,0 +1,88 @@
+import sqlite3
+import threading
+from array import array
+
+import pytest
+from ocp_resources.namespace import Namespace
+
+from ocp_scale_utilities.results import ResultsStore
+from ocp_scale_utilities.timing import CREATE_ACK, CREATE_REQUEST, ResourceTimings
+
+
+def record_run(store, name, deploy_latencies, client):
+    resources = [Namespace(name=f"scale-{index}", client=client) for index in range(len(deploy_latencies))]
+    timings = ResourceTimings(count=len(resources))
+    for index, latency in enumerate(deploy_latencies):
+        timings.record(event=CREATE_REQUEST, index=index, timestamp=100)
+        timings.record(event=CREATE_ACK, index=index, timestamp=100 + latency)
+    run_id = store.start_run(name=name, metadata={"build": len(store.runs())})
+    store.record_phase(run_id=run_id, phase="deploy", start=100, stop=100 + max(deploy_latencies), count=10)
+    store.record_timings(run_id=run_id, resources=resources, timings=timings)
+    return run_id
+
+
+@pytest.fixture()
+def results_store(tmp_path):
+    with ResultsStore(path=str(tmp_path / "results.db"), batch_size=2) as store:
+        yield store
+
+
+def test_results_store_timings(results_store, fake_admin_client):
+    run_id = record_run(store=results_store, name="vms", deploy_latencies=[1, 2, 3], client=fake_admin_client)
+    assert [(run["name"], run["metadata"]) for run in results_store.runs()] == [("vms", {"build": 0})]
+    timings = results_store.timings(run_id=run_id)
+    assert timings.percentiles(phase="deploy") == {"count": 3, "p50": 2, "p90": 3, "p99": 3, "max": 3}
+    assert timings.percentiles(phase="delete") == {}
+
+
+def test_results_store_regressions(results_store, fake_admin_client):
+    baseline_run_id = record_run(
+        store=results_store, name="vms", deploy_latencies=[1] * 99 + [10], client=fake_admin_client
+    )
+    record_run(store=results_store, name="other", deploy_latencies=[100], client=fake_admin_client)
+    run_id = record_run(store=results_store, name="vms", deploy_latencies=[1] * 99 + [11.8], client=fake_admin_client)
+
+    comparison = results_store.compare(run_id=run_id, baseline_run_id=baseline_run_id)
+    assert comparison["deploy"]["p99"] == {"run": 1, "baseline": 1, "change": 0}
+    assert comparison["deploy"]["max"]["change"] == pytest.approx(0.18)
+    # Baseline defaults to the previous run of the same name
+    assert results_store.regressions(run_id=run_id) == ["max deploy latency regressed 18%"]
+    assert results_store.regressions(run_id=baseline_run_id) == []
+
+
+def test_results_store_metrics(results_store):
+    run_id = results_store.start_run(name="vms")
+    data = {
+        "resource-counts": [
+            {"metric": {"resource": "pods"}, "timestamps": array("d", [1, 2]), "values": array("d", [10, 20])}
+        ]
+    }
+    results_store.record_metrics(run_id=run_id, collect_id="post-enter", data=data)
+    assert results_store.metrics(run_id=run_id, collect_id="post-enter") == data
+    assert results_store.metrics(run_id=run_id, collect_id="pre-exit") == {}
+
+
+def test_results_store_closed(tmp_path, fake_admin_client):
+    with ResultsStore(path=str(tmp_path / "results.db")) as store:
+        run_id = record_run(store=store, name="vms", deploy_latencies=[1, 2], client=fake_admin_client)
+    # Reads do not wait for the writer thread once closed
+    assert [run["id"] for run in store.runs()] == [run_id]
+    assert store.timings(run_id=run_id).percentiles(phase="deploy")["max"] == 2
+    with pytest.raises(ValueError):
+        store.start_run(name="vms")
+
+
+def test_results_store_commit_error(results_store, monkeypatch):
+    def _commit(connection, writes):
+        raise sqlite3.OperationalError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ResultsStore, "_commit", staticmethod(_commit))
+        results_store.start_run(name="vms")
+        flush = threading.Thread(target=results_store.flush)
+        flush.start()
+        flush.join(timeout=5)
+        assert not flush.is_alive()
+    # The writer thread survives the failed commit
+    run_id = results_store.start_run(name="vms")
+    assert [run["id"] for run in results_store.runs()] == [run_id]
@@ -0,0 +1,45 @@
+import pytest
+from kubernetes.client.rest import ApiException
+
+from ocp_scale_utilities.retry import RetryPolicy, call_with_retry, get_retry_after
+
+
+def api_exception(status, retry_after=None):
+    exception = ApiException(status=status, reason="test")
+    exception.headers = {"Retry-After": retry_after} if retry_after else None
+    return exception
+
+
+def test_get_retry_after():
+    assert get_retry_after(exception=api_exception(status=429, retry_after="3")) == 3
+    assert get_retry_after(exception=api_exception(status=429, retry_after="Thu, 01 Jan 1970 00:00:00 GMT")) == 0
+    assert get_retry_after(exception=api_exception(status=429, retry_after="soon")) is None
+    assert get_retry_after(exception=api_exception(status=429)) is None
+
+
+def test_retry_policy_get_delay():
+    retry_policy = RetryPolicy(base_delay=1, max_delay=4)
+    assert retry_policy.get_delay(attempt=0, exception=api_exception(status=429, retry_after="3")) == 3
+    assert retry_policy.get_delay(attempt=0, exception=api_exception(status=429, retry_after="7")) == 4
+    assert all([0 <= retry_policy.get_delay(attempt=attempt) <= min(4, 2**attempt) for attempt in range(10)])
+
+
+def test_call_with_retry():
+    retry_policy = RetryPolicy(max_retries=3, base_delay=0.01)
+    errors = [api_exception(status=503), api_exception(status=429, retry_after="0")]
+
+    def _call():
+        if errors:
+            raise errors.pop(0)
+        return "done"
+
+    assert call_with_retry(func=_call, retry_policy=retry_policy) == "done"
+
+    errors = [api_exception(status=403)]
+    with pytest.raises(ApiException):
+        call_with_retry(func=_call, retry_policy=retry_policy)
+
+    errors = [api_exception(status=503)] * 4
+    with pytest.raises(ApiException):
+        call_with_retry(func=_call, retry_policy=retry_policy)
+    assert not errors
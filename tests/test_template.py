@@ -0,0 +1,68 @@
+from contextlib import ExitStack
+
+import pytest
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.namespace import Namespace
+
+from ocp_scale_utilities.template import ResourceTemplate
+from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
+from ocp_scale_utilities.threaded.utils import threaded_deploy_resources
+
+SCALE_RESOURCE_COUNT = 10
+
+
+@pytest.fixture()
+def config_maps(fake_admin_client):
+    return ResourceTemplate(
+        resource_class=ConfigMap,
+        count=SCALE_RESOURCE_COUNT,
+        name_pattern="test-template-{index:03d}",
+        namespace="test-template-namespace",
+        client=fake_admin_client,
+        data={"key": "value"},
+        label={"scale": "template"},
+    )
+
+
+def test_resource_template_items(config_maps):
+    assert len(config_maps) == SCALE_RESOURCE_COUNT
+    assert config_maps[0].name == "test-template-000"
+    assert config_maps[-1].name == "test-template-009"
+    assert [config_map.name for config_map in config_maps[2:4]] == ["test-template-002", "test-template-003"]
+    assert config_maps[1].namespace == "test-template-namespace"
+    # Every resource has its own copy of the template arguments
+    config_maps[0].data["key"] = "changed"
+    assert config_maps[0].data == {"key": "value"}
+    with pytest.raises(IndexError):
+        config_maps[SCALE_RESOURCE_COUNT]
+
+
+def test_resource_template_kind_dict(fake_admin_client):
+    namespaces = ResourceTemplate(
+        resource_class=Namespace,
+        count=2,
+        name_pattern="test-template-{index}",
+        client=fake_admin_client,
+        kind_dict={"apiVersion": "v1", "kind": "Namespace", "metadata": {"labels": {"scale": "template"}}},
+    )
+    namespace = namespaces[1]
+    namespace.to_dict()
+    assert namespace.name == "test-template-1"
+    assert namespace.res["metadata"] == {"name": "test-template-1", "labels": {"scale": "template"}}
+
+
+def test_resource_template_exit_stack(fake_apiserver, config_maps):
+    with ExitStack() as exit_stack:
+        threaded_deploy_resources(resources=config_maps, exit_stack=exit_stack)
+        assert len(fake_apiserver.get_objects(plural="configmaps", namespace="test-template-namespace")) == len(
+            config_maps
+        )
+    assert not fake_apiserver.get_objects(plural="configmaps", namespace="test-template-namespace")
+
+
+def test_resource_template_scale_resources(fake_apiserver, config_maps):
+    with ThreadedScaleResources(resources=config_maps, delete_collection=True) as scale:
+        objects = fake_apiserver.get_objects(plural="configmaps", namespace="test-template-namespace")
+        assert sorted(objects) == [f"test-template-{index:03d}" for index in range(SCALE_RESOURCE_COUNT)]
+    assert scale.statistics()["delete"]["latency"]["count"] == SCALE_RESOURCE_COUNT
+    assert not fake_apiserver.get_objects(plural="configmaps", namespace="test-template-namespace")
@@ -0,0 +1,42 @@
+import math
+
+from ocp_scale_utilities.timing import (
+    CREATE_ACK,
+    CREATE_REQUEST,
+    DELETE_REQUEST,
+    GONE,
+    STATUS_REACHED,
+    ResourceTimings,
+)
+
+
+def test_resource_timings_percentiles():
+    timings = ResourceTimings(count=100)
+    for index in range(100):
+        timings.record(event=CREATE_REQUEST, index=index, timestamp=1000.0)
+        timings.record(event=CREATE_ACK, index=index, timestamp=1000.0 + index + 1)
+    latency = timings.percentiles(phase="deploy")
+    assert latency == {"count": 100, "p50": 50, "p90": 90, "p99": 99, "max": 100}
+
+
+def test_resource_timings_skips_unrecorded():
+    timings = ResourceTimings(count=3)
+    timings.record(event=CREATE_ACK, index=0, timestamp=10.0)
+    timings.record(event=STATUS_REACHED, index=0, timestamp=12.0)
+    timings.record(event=CREATE_ACK, index=1, timestamp=10.0)
+    assert math.isnan(timings.timestamps[STATUS_REACHED][1])
+    assert timings.latencies(start_event=CREATE_ACK, end_event=STATUS_REACHED) == [2.0]
+    assert timings.percentiles(phase="delete") == {}
+    assert set(timings.statistics()) == {"status"}
+
+
+def test_resource_timings_throughput():
+    timings = ResourceTimings(count=4)
+    for index, gone in enumerate((100.5, 100.7, 102.1, 103.9)):
+        timings.record(event=DELETE_REQUEST, index=index, timestamp=100.0)
+        timings.record(event=GONE, index=index, timestamp=gone)
+    assert timings.throughput(phase="delete", bucket_seconds=1) == {
+        "start": 100.0,
+        "bucket_seconds": 1,
+        "counts": [2, 0, 1, 1],
+    }
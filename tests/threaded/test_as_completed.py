@@ -0,0 +1,107 @@
+import time
+
+import pytest
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.threaded.as_completed import (
+    threaded_deploy_resources_as_completed,
+    threaded_wait_deleted_resources_as_completed,
+    threaded_wait_for_resources_status_as_completed,
+)
+from ocp_scale_utilities.threaded.checkpoint import DeployCheckpoint
+from ocp_scale_utilities.threaded.client_pool import ClientPool
+from ocp_scale_utilities.threaded.utils import threaded_delete_resources
+from ocp_scale_utilities.timing import STATUS_REACHED, ResourceTimings
+
+SCALE_RESOURCE_COUNT = 20
+
+
+@pytest.fixture()
+def fake_pods(fake_admin_client):
+    return [
+        Pod(
+            name=f"test-as-completed-pod-{index}",
+            namespace="test-as-completed-namespace",
+            client=fake_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(SCALE_RESOURCE_COUNT)
+    ]
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 1})], indirect=True)
+def test_threaded_resources_as_completed(fake_apiserver, fake_pods):
+    timings = ResourceTimings(count=len(fake_pods))
+    deployed = list(threaded_deploy_resources_as_completed(resources=fake_pods, timings=timings))
+    assert {id(resource) for resource, _, _ in deployed} == {id(pod) for pod in fake_pods}
+    assert not [result for _, result, _ in deployed if isinstance(result, Exception)]
+
+    running = list(
+        threaded_wait_for_resources_status_as_completed(
+            resources=fake_pods, status=Pod.Status.RUNNING, max_in_flight=len(fake_pods), timings=timings
+        )
+    )
+    assert [result for _, result, _ in running] == [None] * len(fake_pods)
+    assert timings.percentiles(phase="ready")["count"] == len(fake_pods)
+
+    threaded_delete_resources(resources=fake_pods, timings=timings)
+    deleted = list(threaded_wait_deleted_resources_as_completed(resources=fake_pods, timings=timings))
+    assert all([result is True for _, result, _ in deleted])
+    assert timings.percentiles(phase="delete")["count"] == len(fake_pods)
+
+
+def test_threaded_as_completed_backpressure(fake_apiserver, fake_pods):
+    create_count = fake_apiserver.requests["create"]
+    deployed = threaded_deploy_resources_as_completed(resources=fake_pods, max_in_flight=2)
+    next(deployed)
+    time.sleep(1)
+    assert fake_apiserver.requests["create"] - create_count <= 3
+    deployed.close()
+
+    results = [result for _, result, _ in threaded_deploy_resources_as_completed(resources=fake_pods)]
+    assert len(results) == len(fake_pods)
+    # Pods not created by the closed generator are created, the others are yielded as errors
+    assert len(fake_apiserver.get_objects(plural="pods", namespace="test-as-completed-namespace")) == len(fake_pods)
+    assert [result for result in results if isinstance(result, Exception)]
+    threaded_delete_resources(resources=fake_pods)
+
+
+def test_threaded_resources_as_completed_client_pool_checkpoint(fake_apiserver, fake_admin_client, fake_pods, tmp_path):
+    client_pool = ClientPool(
+        clients=[
+            fake_apiserver.client(cache_file=str(tmp_path / f"discovery-{index}.json"), connection_pool_maxsize=2)
+            for index in range(2)
+        ]
+    )
+    with DeployCheckpoint(path=str(tmp_path / "checkpoint.jsonl")) as checkpoint:
+        deployed = list(
+            threaded_deploy_resources_as_completed(resources=fake_pods, client_pool=client_pool, checkpoint=checkpoint)
+        )
+        assert not [result for _, result, _ in deployed if isinstance(result, Exception)]
+        assert checkpoint.indexes() == list(range(len(fake_pods)))
+
+        running = list(
+            threaded_wait_for_resources_status_as_completed(
+                resources=fake_pods, status=Pod.Status.RUNNING, client_pool=client_pool, checkpoint=checkpoint
+            )
+        )
+        assert [result for _, result, _ in running] == [None] * len(fake_pods)
+        assert checkpoint.indexes(event=STATUS_REACHED) == list(range(len(fake_pods)))
+
+        threaded_delete_resources(resources=fake_pods)
+        deleted = list(
+            threaded_wait_deleted_resources_as_completed(
+                resources=fake_pods, client_pool=client_pool, checkpoint=checkpoint
+            )
+        )
+        assert all([result is True for _, result, _ in deleted])
+        assert checkpoint.indexes() == []
+
+    # Deploys, status polls and deletion polls spread across the pool
+    assert [client["calls"] for client in client_pool.utilization()] == [len(fake_pods) * 3 // 2] * 2
+    assert all(pod.client is fake_admin_client for pod in fake_pods)
@@ -0,0 +1,102 @@
+import pytest
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.threaded.checkpoint import DeployCheckpoint
+from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
+from ocp_scale_utilities.threaded.utils import (
+    threaded_deploy_resources,
+    threaded_deploy_resources_wait_for_status,
+    threaded_tear_down_checkpoint,
+)
+from ocp_scale_utilities.timing import CREATE_ACK, GONE, STATUS_REACHED, ResourceTimings
+
+
+def config_maps(client, prefix, count):
+    return [
+        ConfigMap(name=f"{prefix}-{index}", namespace="test-checkpoint-namespace", client=client, data={"a": "b"})
+        for index in range(count)
+    ]
+
+
+def test_checkpoint_load(fake_admin_client, tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    resources = config_maps(client=fake_admin_client, prefix="test-checkpoint-load", count=3)
+    with DeployCheckpoint(path=path) as checkpoint:
+        for index, resource in enumerate(resources):
+            checkpoint.record(event=CREATE_ACK, index=index, resource=resource)
+        checkpoint.record(event=STATUS_REACHED, index=1)
+        checkpoint.record(event=GONE, index=2)
+    # Line being written when the process was killed
+    with open(path, "a") as checkpoint_file:
+        checkpoint_file.write('{"event": "create-ack", "ind')
+
+    with DeployCheckpoint(path=path) as checkpoint:
+        assert checkpoint.indexes() == [0, 1]
+        assert checkpoint.indexes(event=STATUS_REACHED) == [1]
+        assert checkpoint.entries[0]["name"] == "test-checkpoint-load-0"
+        assert checkpoint.entries[0]["namespace"] == "test-checkpoint-namespace"
+
+
+def test_threaded_scale_resources_resume(fake_apiserver, fake_admin_client, tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    resources = config_maps(client=fake_admin_client, prefix="test-checkpoint-resume", count=8)
+    # Interrupted run, which created the first 5 resources before dying
+    with DeployCheckpoint(path=path) as checkpoint:
+        threaded_deploy_resources(resources=resources[:5], checkpoint=checkpoint)
+    resources[0].delete()
+
+    create_count = fake_apiserver.requests["create"]
+    with DeployCheckpoint(path=path) as checkpoint:
+        with ThreadedScaleResources(resources=resources, checkpoint=checkpoint):
+            assert checkpoint.attached == {1, 2, 3, 4}
+            assert fake_apiserver.requests["create"] - create_count == 4
+            assert all(resource.exists for resource in resources)
+        assert all(not resource.exists for resource in resources)
+        assert checkpoint.indexes() == []
+
+
+@pytest.mark.parametrize("watch", [False, True])
+def test_threaded_deploy_resources_wait_for_status_resume(fake_admin_client, tmp_path, watch):
+    path = str(tmp_path / "checkpoint.jsonl")
+    pods = [
+        Pod(
+            name=f"test-checkpoint-pipeline-{str(watch).lower()}-{index}",
+            namespace="test-checkpoint-namespace",
+            client=fake_admin_client,
+            containers=[dict(name="pause", image="registry.k8s.io/pause:3.9")],
+        )
+        for index in range(5)
+    ]
+    with DeployCheckpoint(path=path) as checkpoint:
+        threaded_deploy_resources(resources=pods[:2], checkpoint=checkpoint)
+
+    timings = ResourceTimings(count=len(pods))
+    with DeployCheckpoint(path=path) as checkpoint:
+        checkpoint.attach(resources=pods)
+        times = threaded_deploy_resources_wait_for_status(
+            resources=pods, status=Pod.Status.RUNNING, watch=watch, timings=timings, checkpoint=checkpoint
+        )
+        assert checkpoint.indexes(event=STATUS_REACHED) == list(range(len(pods)))
+        # Re-attached resources are not part of the deploy timings
+        assert times[:2] == [(None, None)] * 2
+        assert all(None not in resource_times for resource_times in times[2:])
+        statistics = timings.statistics()
+        assert [statistics[phase]["latency"]["count"] for phase in ("deploy", "status", "ready")] == [3] * 3
+        assert sum(statistics["status"]["throughput"]["counts"]) == 3
+        assert threaded_tear_down_checkpoint(checkpoint=checkpoint, client=fake_admin_client) == [True] * 5
+
+
+def test_threaded_tear_down_checkpoint(fake_admin_client, tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    resources = config_maps(client=fake_admin_client, prefix="test-checkpoint-tear-down", count=5)
+    with DeployCheckpoint(path=path) as checkpoint:
+        threaded_deploy_resources(resources=resources, checkpoint=checkpoint)
+
+    # Without the Resource objects of the checkpointed run
+    with DeployCheckpoint(path=path) as checkpoint:
+        assert threaded_tear_down_checkpoint(checkpoint=checkpoint, client=fake_admin_client) == [True] * 5
+        assert checkpoint.indexes() == []
+    assert all(not resource.exists for resource in resources)
+    with DeployCheckpoint(path=path) as checkpoint:
+        assert checkpoint.entries == {}
@@ -0,0 +1,114 @@
+import pytest
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.threaded.client_pool import LEAST_LOADED, ClientPool, get_client_pool
+from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
+from ocp_scale_utilities.threaded.utils import (
+    threaded_delete_resources,
+    threaded_deploy_resources,
+    threaded_wait_deleted_resources,
+)
+
+
+@pytest.fixture(scope="module")
+def fake_clients(fake_apiserver, tmp_path_factory):
+    return [
+        fake_apiserver.client(
+            cache_file=str(tmp_path_factory.mktemp("discovery") / "cache.json"), connection_pool_maxsize=2
+        )
+        for _ in range(3)
+    ]
+
+
+def test_client_pool_invalid(fake_clients):
+    with pytest.raises(ValueError):
+        ClientPool(clients=[])
+    with pytest.raises(ValueError):
+        ClientPool(clients=fake_clients, strategy="random")
+
+
+def test_client_pool_round_robin(fake_apiserver, fake_clients, fake_admin_client):
+    client_pool = ClientPool(clients=fake_clients)
+    assert client_pool.max_workers == 6
+    config_maps = [
+        ConfigMap(
+            name=f"test-client-pool-{index}",
+            namespace="test-client-pool-namespace",
+            client=fake_admin_client,
+            data={"a": "b"},
+        )
+        for index in range(9)
+    ]
+    threaded_deploy_resources(resources=config_maps, client_pool=client_pool)
+    assert [client["calls"] for client in client_pool.utilization()] == [3, 3, 3]
+    assert all(config_map.client is fake_admin_client for config_map in config_maps)
+    assert all(config_map.exists for config_map in config_maps)
+
+    client_pool.reset()
+    threaded_delete_resources(resources=config_maps, client_pool=client_pool)
+    threaded_wait_deleted_resources(resources=config_maps, client_pool=client_pool)
+    utilization = client_pool.utilization()
+    assert [client["calls"] for client in utilization] == [6, 6, 6]
+    assert all(0 < client["utilization"] <= 1 for client in utilization)
+
+
+def test_client_pool_least_loaded(fake_clients, fake_admin_client):
+    client_pool = ClientPool(clients=fake_clients, strategy=LEAST_LOADED)
+    resources = [
+        ConfigMap(name=f"test-least-loaded-{index}", namespace="test-client-pool-namespace", client=fake_admin_client)
+        for index in range(3)
+    ]
+    with client_pool.assign(resource=resources[0]) as first_client:
+        assert resources[0].client is first_client
+        with client_pool.assign(resource=resources[1]) as second_client:
+            assert second_client is not first_client
+        # The client released by the second call has fewer calls in flight than the first one
+        with client_pool.assign(resource=resources[2]) as third_client:
+            assert third_client is not first_client
+    # The client of each resource is restored once its call returns
+    assert all(resource.client is fake_admin_client for resource in resources)
+    assert [client["peak_in_flight"] for client in client_pool.utilization()] == [1, 1, 1]
+
+
+def test_get_client_pool(fake_apiserver, tmp_path):
+    client_pool = get_client_pool(
+        size=4, max_workers=10, config_file=fake_apiserver.write_kubeconfig(path=str(tmp_path / "config"))
+    )
+    assert len({id(client.client.rest_client.pool_manager) for client in client_pool.clients}) == 4
+    assert [client.configuration.connection_pool_maxsize for client in client_pool.clients] == [3] * 4
+    assert client_pool.max_workers == 12
+
+
+def test_threaded_scale_resources_client_pool(fake_apiserver, fake_clients, fake_admin_client, pytestconfig):
+    pods = [
+        Pod(
+            name=f"test-client-pool-pod-{index}",
+            namespace="test-client-pool-namespace",
+            client=fake_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(6)
+    ]
+    with ThreadedScaleResources(
+        resources=pods,
+        pytest_cache=pytestconfig.cache,
+        cache_key_prefix="client-pool",
+        wait_for_status=Pod.Status.RUNNING,
+        client_pool=ClientPool(clients=fake_clients),
+    ):
+        assert all(pod.exists for pod in pods)
+        list_count = fake_apiserver.requests["list"]
+    # Deletion of all pods is watched from a single stream
+    assert fake_apiserver.requests["list"] - list_count == 1
+    assert all(not pod.exists for pod in pods)
+    deploy_utilization = pytestconfig.cache.get("client-pool-deploy-client-utilization", [])
+    delete_utilization = pytestconfig.cache.get("client-pool-delete-client-utilization", [])
+    # Deploys and status polls, then deletes while deletion is watched
+    assert [client["calls"] for client in deploy_utilization] == [4, 4, 4]
+    assert [client["calls"] for client in delete_utilization] == [2, 2, 2]
@@ -0,0 +1,83 @@
+import pytest
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.namespace import Namespace
+
+from ocp_scale_utilities.threaded.utils import (
+    threaded_delete_resources,
+    threaded_deploy_resources,
+    threaded_wait_deleted_resources,
+)
+
+SCALE_RESOURCE_COUNT = 50
+NAMESPACE_NAME = "test-collection-namespace"
+
+
+def config_maps(client, name_prefix, label):
+    return [
+        ConfigMap(
+            name=f"{name_prefix}-{index}",
+            namespace=NAMESPACE_NAME,
+            client=client,
+            label=label,
+            data={"index": str(index)},
+        )
+        for index in range(SCALE_RESOURCE_COUNT)
+    ]
+
+
+@pytest.fixture()
+def scale_namespace(fake_admin_client):
+    namespace = Namespace(name=NAMESPACE_NAME, client=fake_admin_client)
+    namespace.deploy()
+    yield namespace
+    namespace.clean_up()
+
+
+@pytest.fixture()
+def labeled_config_maps(fake_admin_client, scale_namespace):
+    resources = config_maps(client=fake_admin_client, name_prefix="test-labeled", label={"test": "collection"})
+    threaded_deploy_resources(resources=resources)
+    yield resources
+
+
+@pytest.fixture()
+def foreign_config_map(fake_admin_client, labeled_config_maps):
+    with ConfigMap(
+        name="test-foreign",
+        namespace=NAMESPACE_NAME,
+        client=fake_admin_client,
+        label={"test": "collection"},
+        data={},
+    ) as config_map:
+        yield config_map
+
+
+def test_threaded_delete_resources_collection(fake_apiserver, labeled_config_maps):
+    requests = fake_apiserver.requests.copy()
+    assert all(threaded_delete_resources(resources=labeled_config_maps, collection=True))
+    assert fake_apiserver.requests["deletecollection"] - requests["deletecollection"] == 1
+    assert fake_apiserver.requests["delete"] == requests["delete"]
+    assert all(threaded_wait_deleted_resources(resources=labeled_config_maps, watch=True))
+
+
+def test_threaded_delete_resources_collection_fallback(fake_apiserver, labeled_config_maps, foreign_config_map):
+    requests = fake_apiserver.requests.copy()
+    assert all(threaded_delete_resources(resources=labeled_config_maps, collection=True))
+    assert fake_apiserver.requests["deletecollection"] == requests["deletecollection"]
+    assert fake_apiserver.requests["delete"] - requests["delete"] == SCALE_RESOURCE_COUNT
+    assert foreign_config_map.exists
+
+
+def test_threaded_delete_resources_namespace(fake_apiserver, labeled_config_maps, scale_namespace):
+    assert all(threaded_delete_resources(resources=labeled_config_maps, collection=True, namespaces=[NAMESPACE_NAME]))
+    assert not scale_namespace.exists
+    assert not fake_apiserver.get_objects(plural="configmaps", namespace=NAMESPACE_NAME)
+
+
+def test_threaded_delete_resources_collection_error(fake_apiserver, labeled_config_maps):
+    fake_apiserver.inject_errors(method="deletecollection", count=1, code=403)
+    requests = fake_apiserver.requests.copy()
+    assert all(threaded_delete_resources(resources=labeled_config_maps, collection=True))
+    assert fake_apiserver.requests["deletecollection"] - requests["deletecollection"] == 1
+    assert fake_apiserver.requests["delete"] - requests["delete"] == SCALE_RESOURCE_COUNT
+    assert all(threaded_wait_deleted_resources(resources=labeled_config_maps, watch=True))
@@ -0,0 +1,101 @@
+import threading
+import time
+
+import pytest
+from kubernetes.client.rest import ApiException
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.retry import RetryPolicy
+from ocp_scale_utilities.threaded.concurrency import AdaptiveConcurrencyLimiter
+from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
+
+
+def test_limiter_additive_increase():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+    for _ in range(20):
+        limiter.call(func=lambda: None)
+    assert limiter.concurrency == 4
+    assert [limit for _, limit, _ in limiter.history] == [2, 3, 4]
+
+
+def test_limiter_multiplicative_decrease():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2)
+
+    def _fail(status):
+        raise ApiException(status=status)
+
+    for _ in range(3):
+        with pytest.raises(ApiException):
+            limiter.call(func=lambda: _fail(status=429))
+    assert limiter.concurrency == 2
+    assert limiter.history[-1][2] == "throttled"
+
+    with pytest.raises(ApiException):
+        limiter.call(func=lambda: _fail(status=404))
+    assert limiter.concurrency == 2
+    assert limiter.in_flight == 0
+
+
+def test_limiter_decreases_once_per_burst():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    start_times = [limiter.acquire() for _ in range(8)]
+    for start_time in start_times:
+        limiter.release(start_time=start_time, overload_reason="throttled")
+    assert limiter.concurrency == 4
+
+
+def test_limiter_latency_spike():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_spike_ratio=3)
+    for _ in range(5):
+        limiter.call(func=lambda: time.sleep(0.01))
+    limit = limiter.concurrency
+    limiter.call(func=lambda: time.sleep(0.2))
+    assert limiter.concurrency == limit // 2
+    assert limiter.history[-1][2] == "latency spike"
+
+
+def test_limiter_bounds_concurrency():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def _call():
+        with lock:
+            running.append(True)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    threads = [threading.Thread(target=limiter.call, kwargs={"func": _call}) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(max_running) == 2
+
+
+def test_threaded_scale_resources_limiter(fake_apiserver, fake_admin_client):
+    pods = [
+        Pod(
+            name=f"test-limiter-pod-{index}",
+            namespace="test-limiter-namespace",
+            client=fake_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(20)
+    ]
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+    fake_apiserver.inject_errors(method="create", count=2, code=429, retry_after="0")
+    with ThreadedScaleResources(
+        resources=pods, limiter=limiter, retry_policy=RetryPolicy(base_delay=0.01), watch_deleted=False
+    ):
+        assert len(fake_apiserver.get_objects(plural="pods", namespace="test-limiter-namespace")) == len(pods)
+    assert "throttled" in [reason for _, _, reason in limiter.history]
+    assert limiter.in_flight == 0
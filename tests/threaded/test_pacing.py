@@ -0,0 +1,77 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.threaded.pacing import Pacer
+from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
+
+
+def paced_calls(pacer, count, duration=0.0):
+    def _call(_):
+        with pacer:
+            time.sleep(duration)
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        list(executor.map(_call, range(count)))
+
+
+def test_pacer_rate():
+    pacer = Pacer(rate=20)
+    start_time = time.monotonic()
+    paced_calls(pacer=pacer, count=11)
+    assert time.monotonic() - start_time >= 0.45
+    assert pacer.achieved_rate == pytest.approx(20, rel=0.2)
+    assert pacer.statistics()["count"] == 11
+
+
+def test_pacer_burst():
+    pacer = Pacer(rate=1, burst=5)
+    start_time = time.monotonic()
+    paced_calls(pacer=pacer, count=5)
+    assert time.monotonic() - start_time < 0.5
+
+
+def test_pacer_waves():
+    pacer = Pacer(wave_size=3, wave_settle=0.3)
+    paced_calls(pacer=pacer, count=7, duration=0.1)
+    timestamps = sorted(pacer.timestamps)
+    assert timestamps[2] - timestamps[0] < 0.1
+    assert timestamps[3] - timestamps[2] >= 0.4
+    assert timestamps[6] - timestamps[5] >= 0.4
+    assert pacer.statistics()["waves"] == 3
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 0.5})], indirect=True)
+def test_threaded_scale_resources_waves(fake_apiserver, fake_admin_client):
+    pods = [
+        Pod(
+            name=f"test-pacing-pod-{index}",
+            namespace="test-pacing-namespace",
+            client=fake_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(6)
+    ]
+    deploy_pacer = Pacer(rate=50, wave_size=3, wave_settle=0.2)
+    delete_pacer = Pacer(rate=10)
+    with ThreadedScaleResources(
+        resources=pods,
+        wait_for_status=Pod.Status.RUNNING,
+        pipeline=True,
+        max_workers=len(pods),
+        deploy_pacer=deploy_pacer,
+        delete_pacer=delete_pacer,
+    ) as scale:
+        # The second wave is created once the first wave is running
+        ready_times = sorted(scale.timings.timestamps["status-reached"])
+        create_times = sorted(scale.timings.timestamps["create-request"])
+        assert create_times[3] >= ready_times[2] + 0.2
+    assert delete_pacer.statistics()["count"] == len(pods)
+    assert delete_pacer.achieved_rate == pytest.approx(10, rel=0.3)
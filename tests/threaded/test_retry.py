@@ -0,0 +1,79 @@
+import pytest
+from ocp_resources.pod import Pod
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_scale_utilities.exceptions import ThreadedResourcesError
+from ocp_scale_utilities.retry import RetryPolicy
+from ocp_scale_utilities.threaded.utils import (
+    threaded_delete_resources,
+    threaded_deploy_resources,
+    threaded_deploy_resources_wait_for_status,
+)
+
+SCALE_RESOURCE_COUNT = 10
+RETRY_POLICY = RetryPolicy(max_retries=3, base_delay=0.01)
+
+
+@pytest.fixture()
+def fake_pods(fake_apiserver, fake_admin_client):
+    pods = [
+        Pod(
+            name=f"test-retry-pod-{index}",
+            namespace="test-retry-namespace",
+            client=fake_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(SCALE_RESOURCE_COUNT)
+    ]
+    yield pods
+    threaded_delete_resources(resources=pods)
+
+
+def test_threaded_deploy_resources_retry(fake_apiserver, fake_pods):
+    fake_apiserver.inject_errors(method="create", count=3, code=429, retry_after="0")
+    fake_apiserver.inject_errors(method="create", count=2, code=503, applied=True)
+    threaded_deploy_resources(resources=fake_pods, retry_policy=RETRY_POLICY)
+    assert len(fake_apiserver.get_objects(plural="pods", namespace="test-retry-namespace")) == SCALE_RESOURCE_COUNT
+
+
+def test_threaded_deploy_resources_aggregate_errors(fake_apiserver, fake_pods):
+    fake_apiserver.inject_errors(method="create", count=2, code=403)
+    with pytest.raises(ThreadedResourcesError) as exc_info:
+        threaded_deploy_resources(resources=fake_pods, retry_policy=RETRY_POLICY)
+    assert len(exc_info.value.failed_resources) == 2
+    assert len(exc_info.value.results) == SCALE_RESOURCE_COUNT
+    assert len(fake_apiserver.get_objects(plural="pods", namespace="test-retry-namespace")) == SCALE_RESOURCE_COUNT - 2
+
+
+def test_threaded_deploy_resources_wait_for_status_aggregate_errors(fake_apiserver, fake_pods):
+    fake_apiserver.inject_errors(method="create", count=2, code=403)
+    with pytest.raises(ThreadedResourcesError) as exc_info:
+        threaded_deploy_resources_wait_for_status(
+            resources=fake_pods, status=Pod.Status.RUNNING, timeout=30, retry_policy=RETRY_POLICY
+        )
+    assert len(exc_info.value.failed_resources) == 2
+    assert len(exc_info.value.results) == SCALE_RESOURCE_COUNT
+    assert len(fake_apiserver.get_objects(plural="pods", namespace="test-retry-namespace")) == SCALE_RESOURCE_COUNT - 2
+
+
+def test_threaded_deploy_resources_wait_for_status_deadline(fake_apiserver, fake_pods):
+    # One create is only retried after the deadline
+    fake_apiserver.inject_errors(method="create", count=1, code=429, retry_after="2")
+    with pytest.raises(ThreadedResourcesError) as exc_info:
+        threaded_deploy_resources_wait_for_status(
+            resources=fake_pods, status=Pod.Status.RUNNING, timeout=1, retry_policy=RETRY_POLICY
+        )
+    assert len(exc_info.value.failures) == 1
+    assert isinstance(exc_info.value.failures[0][1], TimeoutExpiredError)
+
+
+def test_threaded_delete_resources_retry(fake_apiserver, fake_pods):
+    threaded_deploy_resources(resources=fake_pods)
+    fake_apiserver.inject_errors(method="delete", count=3, code=429, retry_after="0")
+    threaded_delete_resources(resources=fake_pods, retry_policy=RETRY_POLICY)
+    assert not fake_apiserver.get_objects(plural="pods", namespace="test-retry-namespace")
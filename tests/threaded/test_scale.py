@@ -1,5 +1,8 @@
 import pytest
+from ocp_resources.namespace import Namespace
 from ocp_resources.pod import Pod
+from ocp_scale_utilities.exceptions import ThreadedResourcesError
+from ocp_scale_utilities.results import ResultsStore
 from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
 
 
@@ -25,3 +28,66 @@ def scaled_pods(crc_admin_client, namespace):
 
 def test_threaded_deploy_resources(scaled_pods):
     assert all([pod.exists and pod.status == Pod.Status.RUNNING for pod in scaled_pods])
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 1})], indirect=True)
+@pytest.mark.parametrize("watch_status", [True, False])
+def test_threaded_scale_resources_pipeline(fake_apiserver, tmp_path, watch_status):
+    # More resources than threads of the default executor, sized to the connection pool of the client
+    client = fake_apiserver.client(cache_file=str(tmp_path / "discovery.json"), connection_pool_maxsize=4)
+    pods = [
+        Pod(
+            name=f"test-pipeline-pod-{index}",
+            namespace="test-pipeline-namespace",
+            client=client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(20)
+    ]
+    with ThreadedScaleResources(
+        resources=pods,
+        wait_for_status=Pod.Status.RUNNING,
+        watch_status=watch_status,
+        wait_for_status_timeout=4,
+        pipeline=True,
+    ) as scale:
+        statistics = scale.statistics()
+        assert statistics["ready"]["latency"]["count"] == len(pods)
+        assert statistics["ready"]["latency"]["p50"] >= 1
+        assert sum(statistics["ready"]["throughput"]["counts"]) == len(pods)
+    assert scale.statistics()["delete"]["latency"]["count"] == len(pods)
+    assert not fake_apiserver.get_objects(plural="pods", namespace="test-pipeline-namespace")
+
+
+def test_threaded_scale_resources_results_store(fake_admin_client, tmp_path):
+    namespaces = [Namespace(name=f"test-results-{index}", client=fake_admin_client) for index in range(5)]
+    with ResultsStore(path=str(tmp_path / "results.db")) as results_store:
+        with ThreadedScaleResources(
+            resources=namespaces, cache_key_prefix="namespaces", results_store=results_store, run_metadata={"a": 1}
+        ) as scale:
+            pass
+        assert [(run["id"], run["name"], run["metadata"]) for run in results_store.runs()] == [
+            (scale.run_id, "namespaces", {"a": 1})
+        ]
+        timings = results_store.timings(run_id=scale.run_id)
+        assert timings.percentiles(phase="deploy")["count"] == len(namespaces)
+        assert timings.percentiles(phase="delete")["count"] == len(namespaces)
+
+
+def test_threaded_scale_resources_results_store_failed_deploy(fake_apiserver, fake_admin_client, tmp_path):
+    namespaces = [Namespace(name=f"test-results-failed-{index}", client=fake_admin_client) for index in range(5)]
+    fake_apiserver.inject_errors(method="create", count=1, code=403)
+    with ResultsStore(path=str(tmp_path / "results.db")) as results_store:
+        scale = ThreadedScaleResources(resources=namespaces, results_store=results_store, retry_policy=None)
+        with pytest.raises(ThreadedResourcesError):
+            with scale:
+                pass
+        # Failed runs are stored with the timings of the resources deployed before the failure
+        assert [run["id"] for run in results_store.runs()] == [scale.run_id]
+        assert results_store.timings(run_id=scale.run_id).percentiles(phase="deploy")["count"] == len(namespaces) - 1
+    assert not any(namespace.exists for namespace in namespaces)
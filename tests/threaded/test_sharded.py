@@ -0,0 +1,112 @@
+import logging
+from logging.handlers import QueueHandler
+from multiprocessing import get_context
+
+import pytest
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.exceptions import ThreadedResourcesError
+from ocp_scale_utilities.logger import setup_logging
+from ocp_scale_utilities.template import ResourceTemplate
+from ocp_scale_utilities.threaded.sharded import sharded_deploy_resources, sharded_delete_resources
+from ocp_scale_utilities.timing import ResourceTimings
+
+
+def get_pods(client, count, prefix="test-sharded-pod"):
+    return [
+        Pod(
+            name=f"{prefix}-{index}",
+            namespace="test-sharded-namespace",
+            client=client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def fake_client_kwargs(fake_apiserver, tmp_path_factory):
+    return {
+        "config_file": fake_apiserver.write_kubeconfig(path=str(tmp_path_factory.mktemp("kube") / "config")),
+        "temp_file_path": str(tmp_path_factory.mktemp("kube-temp")),
+    }
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 0.5})], indirect=True)
+def test_sharded_deploy_delete_resources(fake_apiserver, fake_admin_client, fake_client_kwargs):
+    pods = get_pods(client=fake_admin_client, count=12)
+    timings = ResourceTimings(count=len(pods))
+    log_queue = get_context("spawn").Queue()
+
+    deployed = sharded_deploy_resources(
+        resources=pods,
+        processes=3,
+        client_kwargs=fake_client_kwargs,
+        status=Pod.Status.RUNNING,
+        timings=timings,
+        log_queue=log_queue,
+    )
+    assert deployed == pods
+    assert len(fake_apiserver.get_objects(plural="pods", namespace="test-sharded-namespace")) == len(pods)
+    assert timings.percentiles(phase="ready")["count"] == len(pods)
+
+    assert sharded_delete_resources(
+        resources=pods, processes=3, client_kwargs=fake_client_kwargs, timings=timings, log_queue=log_queue
+    ) == [True] * len(pods)
+    assert not fake_apiserver.get_objects(plural="pods", namespace="test-sharded-namespace")
+    assert timings.percentiles(phase="delete")["count"] == len(pods)
+
+    messages = []
+    while not log_queue.empty():
+        messages.append(log_queue.get().getMessage())
+    assert any("Worker" in message and "running deploy of 4 resources" in message for message in messages)
+
+
+def test_sharded_deploy_failures(fake_apiserver, fake_admin_client, fake_client_kwargs):
+    pods = get_pods(client=fake_admin_client, count=4, prefix="test-sharded-failure-pod")
+    fake_apiserver.inject_errors(method="create", count=1, code=500)
+    with pytest.raises(ThreadedResourcesError) as exc_info:
+        sharded_deploy_resources(resources=pods, processes=2, client_kwargs=fake_client_kwargs, retry_policy=None)
+    assert len(exc_info.value.failed_resources) == 1
+    sharded_delete_resources(resources=pods, processes=2, client_kwargs=fake_client_kwargs)
+
+
+def test_sharded_worker_logs(fake_apiserver, fake_admin_client, fake_client_kwargs, tmp_path):
+    log_file = str(tmp_path / "sharded.log")
+    log_listener = setup_logging(log_file=log_file)
+    pods = get_pods(client=fake_admin_client, count=2, prefix="test-sharded-log-pod")
+    try:
+        sharded_deploy_resources(resources=pods, processes=2, client_kwargs=fake_client_kwargs)
+        sharded_delete_resources(resources=pods, processes=2, client_kwargs=fake_client_kwargs)
+    finally:
+        log_listener.stop()
+        for logger in (logging.getLogger(), logging.getLogger("basic")):
+            for handler in list(logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    logger.removeHandler(handler)
+    with open(log_file) as file:
+        log_data = file.read()
+    assert log_data.count("running deploy of 1 resources") == 2
+
+
+def test_sharded_resource_template(fake_apiserver, fake_admin_client, fake_client_kwargs):
+    pods = ResourceTemplate(
+        resource_class=Pod,
+        count=6,
+        name_pattern="test-sharded-template-pod-{index}",
+        namespace="test-sharded-namespace",
+        client=fake_admin_client,
+        containers=[dict(name="pause", image="registry.k8s.io/pause:3.9")],
+    )
+    deployed = sharded_deploy_resources(resources=pods, processes=2, client_kwargs=fake_client_kwargs)
+    assert [pod.name for pod in deployed] == [pods.get_name(index=index) for index in range(len(pods))]
+    assert sharded_delete_resources(resources=pods, processes=2, client_kwargs=fake_client_kwargs) == [True] * 6
+    assert not any(
+        name.startswith("test-sharded-template-pod")
+        for name in fake_apiserver.get_objects(plural="pods", namespace="test-sharded-namespace")
+    )
@@ -0,0 +1,66 @@
+import time
+from contextlib import ExitStack
+
+import pytest
+from ocp_resources.pod import Pod
+
+from ocp_scale_utilities.threaded.utils import ThreadedExitCallbacks, threaded_deploy_resources
+
+SCALE_RESOURCE_COUNT = 50
+NAMESPACE_NAME = "test-unwind-namespace"
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"delete_delay": 1})], indirect=True)
+def test_threaded_deploy_resources_exit_stack_unwind(fake_apiserver, fake_admin_client):
+    pods = [
+        Pod(
+            name=f"test-unwind-pod-{index}",
+            namespace=NAMESPACE_NAME,
+            client=fake_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(SCALE_RESOURCE_COUNT)
+    ]
+    with ExitStack() as stack:
+        threaded_deploy_resources(resources=pods, exit_stack=stack)
+        assert len(fake_apiserver.get_objects(plural="pods", namespace=NAMESPACE_NAME)) == SCALE_RESOURCE_COUNT
+        start_time = time.time()
+
+    # Each clean_up() waits at least delete_delay for deletion
+    assert time.time() - start_time < SCALE_RESOURCE_COUNT * fake_apiserver.delete_delay / 2
+    assert not fake_apiserver.get_objects(plural="pods", namespace=NAMESPACE_NAME)
+
+
+def test_threaded_exit_callbacks_order():
+    order = []
+    exit_callbacks = ThreadedExitCallbacks(max_workers=2)
+    for index in range(6):
+        exit_callbacks.append(callback=lambda *_, _index=index: order.append(_index // 2))
+
+    with ExitStack() as stack:
+        stack.callback(lambda: order.append("first"))
+        stack.push(exit=exit_callbacks)
+
+    assert order == [2, 2, 1, 1, 0, 0, "first"]
+
+
+def test_threaded_exit_callbacks_errors():
+    called = []
+
+    def _fail(*_):
+        called.append(True)
+        raise ValueError("unwind error")
+
+    exit_callbacks = ThreadedExitCallbacks(max_workers=2)
+    for _ in range(3):
+        exit_callbacks.append(callback=_fail)
+
+    with pytest.raises(ValueError, match="unwind error"):
+        with ExitStack() as stack:
+            stack.push(exit=exit_callbacks)
+    assert len(called) == 3
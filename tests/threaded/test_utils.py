@@ -1,5 +1,6 @@
 import pytest
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 
 from ocp_resources.namespace import Namespace
 from ocp_resources.pod import Pod
@@ -12,6 +13,7 @@ from ocp_scale_utilities.threaded.utils import (
     threaded_wait_for_resources_status,
     threaded_wait_deleted_resources,
     threaded_deploy_requested_resources,
+    get_max_workers,
 )
 
 
@@ -83,6 +85,35 @@ def cleaned_up_pods(deployed_pods):
     yield deployed_pods
 
 
+@pytest.fixture(scope="class")
+def shared_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="class")
+def pods_with_shared_executor(crc_scale_admin_client, utils_test_namespace, shared_executor):
+    pods = [
+        Pod(
+            name=f"test-shared-executor-pod-{index}",
+            namespace=utils_test_namespace.name,
+            client=crc_scale_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(SCALE_RESOURCE_COUNT)
+    ]
+    threaded_deploy_resources(resources=pods, executor=shared_executor)
+    threaded_wait_for_resources_status(resources=pods, status=Pod.Status.RUNNING, executor=shared_executor)
+    yield pods
+    threaded_delete_resources(resources=pods, executor=shared_executor)
+    threaded_wait_deleted_resources(resources=pods, executor=shared_executor)
+
+
 @pytest.fixture()
 def created_projects(crc_scale_developer_client):
     project_requests = []
@@ -137,3 +168,15 @@ class TestThreadedUtilsCleanUp:
 
 def test_threaded_wait_for_resources_status(created_projects):
     assert all([project.exists and project.status == Project.Status.ACTIVE for project in created_projects])
+
+
+@pytest.mark.usefixtures("utils_test_namespace")
+class TestThreadedUtilsSharedExecutor:
+    def test_get_max_workers(self, pods_with_shared_executor):
+        assert get_max_workers(resources=pods_with_shared_executor) == min(
+            SCALE_RESOURCE_COUNT, pods_with_shared_executor[0].client.configuration.connection_pool_maxsize
+        )
+        assert get_max_workers(resources=pods_with_shared_executor, max_workers=2) == 2
+
+    def test_threaded_wait_for_resources_status(self, pods_with_shared_executor):
+        assert all([pod.exists and pod.status == Pod.Status.RUNNING for pod in pods_with_shared_executor])
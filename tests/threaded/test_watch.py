@@ -0,0 +1,111 @@
+import pytest
+from ocp_resources.pod import Pod
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_scale_utilities.threaded.scale import ThreadedScaleResources
+from ocp_scale_utilities.threaded.utils import (
+    threaded_delete_resources,
+    threaded_deploy_resources,
+    threaded_wait_deleted_resources,
+    threaded_wait_for_resources_status,
+)
+from ocp_scale_utilities.threaded.watch import ResourcesWatcher, get_common_label_selector, get_resources_groups
+
+SCALE_RESOURCE_COUNT = 50
+
+
+@pytest.fixture()
+def fake_pods(fake_admin_client):
+    pods = [
+        Pod(
+            name=f"test-watch-pod-{index}",
+            namespace="test-watch-namespace",
+            client=fake_admin_client,
+            label={"test": "watch", "index": str(index)},
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(SCALE_RESOURCE_COUNT)
+    ]
+    threaded_deploy_resources(resources=pods)
+    yield pods
+
+
+def test_get_common_label_selector(fake_pods):
+    assert get_common_label_selector(resources=fake_pods) == "test=watch"
+    assert get_common_label_selector(resources=fake_pods[:1]) == "index=0,test=watch"
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 1})], indirect=True)
+def test_threaded_wait_for_resources_status_watch(fake_apiserver, fake_pods):
+    list_count = fake_apiserver.requests["list"]
+    results = threaded_wait_for_resources_status(resources=fake_pods, status=Pod.Status.RUNNING, watch=True)
+    assert all(results)
+    assert fake_apiserver.requests["list"] - list_count == 1
+    assert all([pod.status == Pod.Status.RUNNING for pod in fake_pods])
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 60})], indirect=True)
+def test_resources_watcher_timeout(fake_pods):
+    watcher = ResourcesWatcher(resources=fake_pods, timeout=2)
+    with pytest.raises(TimeoutExpiredError):
+        watcher.wait_for_status(status=Pod.Status.RUNNING)
+    assert watcher.pending == fake_pods
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"ready_delay": 5, "event_history": 1})], indirect=True)
+def test_resources_watcher_relist_on_expired_watch(fake_apiserver, fake_pods):
+    list_count = fake_apiserver.requests["list"]
+    assert all(ResourcesWatcher(resources=fake_pods, page_size=10).wait_for_status(status=Pod.Status.RUNNING))
+    assert fake_apiserver.requests["list"] - list_count >= SCALE_RESOURCE_COUNT / 10
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"delete_delay": 1})], indirect=True)
+def test_threaded_wait_deleted_resources_watch(fake_apiserver, fake_pods):
+    threaded_delete_resources(resources=fake_pods)
+    assert all(threaded_wait_deleted_resources(resources=fake_pods, watch=True))
+    assert not fake_apiserver.get_objects(plural="pods", namespace="test-watch-namespace")
+
+
+@pytest.mark.parametrize("fake_apiserver", [pytest.param({"delete_delay": 60})], indirect=True)
+def test_resources_watcher_deleted_pending(fake_pods):
+    threaded_delete_resources(resources=fake_pods[:10])
+    watcher = ResourcesWatcher(resources=fake_pods, timeout=2)
+    assert not any(watcher.wait_deleted())
+    assert watcher.pending == fake_pods
+
+
+def test_threaded_scale_resources_watch_deleted(fake_apiserver, fake_admin_client):
+    pods = [
+        Pod(
+            name=f"test-watch-scale-pod-{index}",
+            namespace="test-watch-namespace",
+            client=fake_admin_client,
+            containers=[
+                dict(
+                    name="pause",
+                    image="registry.k8s.io/pause:3.9",
+                ),
+            ],
+        )
+        for index in range(SCALE_RESOURCE_COUNT)
+    ]
+    groups_count = len(get_resources_groups(resources=pods))
+    requests = fake_apiserver.requests.copy()
+    with ThreadedScaleResources(resources=pods, wait_for_status=Pod.Status.RUNNING, watch_status=True):
+        assert len(fake_apiserver.get_objects(plural="pods", namespace="test-watch-namespace")) >= SCALE_RESOURCE_COUNT
+        deploy_requests = fake_apiserver.requests - requests
+        requests = fake_apiserver.requests.copy()
+    delete_requests = fake_apiserver.requests - requests
+    assert not any([
+        pod.name in fake_apiserver.get_objects(plural="pods", namespace="test-watch-namespace") for pod in pods
+    ])
+    # create() reads each resource once and delete() twice, waits must not add a GET per resource
+    assert deploy_requests["list"] == delete_requests["list"] == groups_count
+    assert deploy_requests["watch"] <= groups_count and delete_requests["watch"] <= groups_count
+    assert deploy_requests["get"] - deploy_requests["create"] < SCALE_RESOURCE_COUNT
+    assert delete_requests["get"] - 2 * delete_requests["delete"] < SCALE_RESOURCE_COUNT